@@ -0,0 +1,54 @@
+"""
+DataScope Benchmark - Clustering Backends
+Wall time and cluster quality of each ClusteringEngine backend against exact KMeans.
+
+Usage:
+    python -m benchmarks.clustering_backends --rows 200000 --features 12 --k 6
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import adjusted_rand_score
+
+from benchmarks.generators import station_dataset
+from src.modules.clustering.engine import BACKENDS, ClusteringEngine
+
+def run(rows: int, features: int, k: int, seed: int = 42) -> pd.DataFrame:
+    raw, _ = station_dataset(rows, features, n_groups=k, seed=seed)
+    data = (raw - raw.mean()) / raw.std(ddof=0)
+
+    records = []
+    reference = None
+    for backend in [b for b in BACKENDS if b != "auto"]:
+        engine = ClusteringEngine(data, backend=backend, random_state=seed)
+        start = time.perf_counter()
+        result = engine.run_clustering(k)
+        elapsed = time.perf_counter() - start
+        labels = result["labels"].to_numpy()
+        if reference is None:
+            reference = (labels, result["inertia"], elapsed)
+        records.append({
+            "backend": backend,
+            "seconds": elapsed,
+            "speedup": reference[2] / elapsed,
+            "inertia_ratio": result["inertia"] / reference[1],
+            "ari_vs_exact": adjusted_rand_score(reference[0], labels)
+        })
+    return pd.DataFrame(records).set_index("backend")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--features", type=int, default=12)
+    parser.add_argument("--k", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"rows={args.rows:,} features={args.features} k={args.k}")
+    print(run(args.rows, args.features, args.k, args.seed).round(4).to_string())
+
+if __name__ == "__main__":
+    main()
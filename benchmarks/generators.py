@@ -0,0 +1,101 @@
+"""
+DataScope Benchmark - Synthetic Datasets
+Seeded, station-like datasets at production scale for the benchmark suite.
+"""
+
+import os
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+# Typical magnitude (location, spread) of each kind of station measurement,
+# cycled when more features are requested than there are kinds
+STATION_FEATURES = [
+    ("Passengers/day", 250_000, 120_000),
+    ("Platforms", 12, 6),
+    ("Trains/day", 800, 400),
+    ("Surface_(m²)", 150_000, 60_000),
+    ("Consumption_(kWh)", 300_000, 120_000),
+    ("Noise_(dB)", 70, 10),
+    ("Temperature_(°C)", 15, 6),
+    ("Safety_(%)", 75, 12),
+]
+
+def station_dataset(rows: int, features: int, n_groups: int = 4, nan_rate: float = 0.0,
+                    anomaly_rate: float = 0.0, seed: int = 42) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    Returns (frame, is_anomaly): `n_groups` latent station profiles with
+    correlated, heterogeneously scaled features, `anomaly_rate` of rows
+    pushed far off their profile and `nan_rate` of cells blanked.
+    """
+    rng = np.random.default_rng(seed)
+    latent_dims = max(2, min(features, 6))
+    centers = rng.normal(scale=3.0, size=(n_groups, latent_dims))
+    groups = rng.integers(0, n_groups, size=rows)
+    latent = centers[groups] + rng.normal(size=(rows, latent_dims))
+    mixing = rng.normal(size=(latent_dims, features)) / np.sqrt(latent_dims)
+    z = latent @ mixing + rng.normal(scale=0.3, size=(rows, features))
+
+    is_anomaly = rng.random(rows) < anomaly_rate
+    n_anomalies = int(is_anomaly.sum())
+    if n_anomalies:
+        z[is_anomaly] += rng.choice([-1.0, 1.0], size=(n_anomalies, features)) * rng.uniform(
+            4.0, 8.0, size=(n_anomalies, features))
+
+    names, location, spread = [], np.empty(features), np.empty(features)
+    for j in range(features):
+        name, loc, scale = STATION_FEATURES[j % len(STATION_FEATURES)]
+        names.append(name if j < len(STATION_FEATURES) else f"{name}_{j // len(STATION_FEATURES)}")
+        location[j], spread[j] = loc, scale
+    values = z / z.std(axis=0) * spread + location
+
+    if nan_rate > 0:
+        values[rng.random(values.shape) < nan_rate] = np.nan
+    return pd.DataFrame(values, columns=names), is_anomaly
+
+def contingency_table(n_rows: int, n_cols: int, total: int = 100_000, seed: int = 42) -> pd.DataFrame:
+    """Region x service-type counts with a planted association (for CA)."""
+    rng = np.random.default_rng(seed)
+    row_p = rng.dirichlet(np.full(n_rows, 2.0))
+    col_p = rng.dirichlet(np.full(n_cols, 2.0))
+    association = np.exp(rng.normal(scale=0.5, size=(n_rows, n_cols)))
+    p = np.outer(row_p, col_p) * association
+    counts = rng.multinomial(total, (p / p.sum()).ravel()).reshape(n_rows, n_cols)
+    # Empty margins break the chi-squared test; give each line at least one count
+    counts[counts.sum(axis=1) == 0, 0] += 1
+    counts[0, counts.sum(axis=0) == 0] += 1
+    return pd.DataFrame(counts, index=[f"Region_{i + 1}" for i in range(n_rows)],
+                        columns=[f"Type_{j + 1}" for j in range(n_cols)])
+
+def sparse_contingency_table(n_rows: int, n_cols: int, nnz: int, seed: int = 42) -> "sp.csr_matrix":
+    """Large region x category counts with about `nnz` occupied cells (for sparse-mode CA)."""
+    rng = np.random.default_rng(seed)
+    # Skewed category popularity, as in real cross-tabs; every line gets at least one count
+    col_p = rng.dirichlet(np.full(n_cols, 0.5))
+    rows = np.concatenate([rng.integers(0, n_rows, nnz), np.arange(n_rows), rng.integers(0, n_rows, n_cols)])
+    cols = np.concatenate([rng.choice(n_cols, nnz, p=col_p), rng.integers(0, n_cols, n_rows), np.arange(n_cols)])
+    counts = rng.poisson(3.0, len(rows)) + 1
+    return sp.csr_matrix((counts.astype(float), (rows, cols)), shape=(n_rows, n_cols))
+
+def write_dataset(df: pd.DataFrame, directory: str, name: str, fmt: str = "xlsx",
+                  index: bool = False) -> str:
+    """Writes `df` once per name; existing files are reused across runs."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{name}.{fmt}")
+    if not os.path.exists(path):
+        tmp = os.path.join(directory, f".{name}.tmp.{fmt}")
+        if fmt == "csv":
+            df.to_csv(tmp, index=index)
+        else:
+            df.to_excel(tmp, index=index)
+        os.replace(tmp, path)
+    return path
+
+def dataset_name(rows: int, features: int, nan_rate: float, anomaly_rate: float,
+                 seed: int, n_groups: Optional[int] = None) -> str:
+    parts = [f"stations_{rows}x{features}", f"nan{nan_rate:g}", f"anom{anomaly_rate:g}", f"s{seed}"]
+    if n_groups is not None:
+        parts.append(f"g{n_groups}")
+    return "_".join(parts)
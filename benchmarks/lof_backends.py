@@ -0,0 +1,66 @@
+"""
+DataScope Benchmark - LOF Neighbor Backends
+Wall time of each LOF neighbor backend and how far it drifts from exact LOF.
+
+Usage:
+    python -m benchmarks.lof_backends --rows 200000 --features 24
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from scipy.stats import spearmanr
+from sklearn.metrics import roc_auc_score
+
+from benchmarks.generators import station_dataset
+from src.modules.cybersecurity.neighbors import knn_graph, lof_from_knn
+
+BACKENDS = ("brute", "tree", "approximate")
+
+def run(rows: int, features: int, anomaly_rate: float = 0.05, k: int = 20, seed: int = 42,
+        backends=BACKENDS) -> pd.DataFrame:
+    raw, is_anomaly = station_dataset(rows, features, anomaly_rate=anomaly_rate, seed=seed)
+    X = ((raw - raw.min()) / (raw.max() - raw.min())).to_numpy()
+
+    records = []
+    reference = None
+    for backend in backends:
+        start = time.perf_counter()
+        distances, indices = knn_graph(X, k, backend)
+        lof = lof_from_knn(distances, indices, contamination=anomaly_rate)
+        elapsed = time.perf_counter() - start
+        scores = -lof["negative_outlier_factor"]
+        flagged = lof["labels"] == -1
+        if reference is None:
+            reference = (indices, scores, flagged, elapsed)
+        ref_indices, ref_scores, ref_flagged, ref_elapsed = reference
+        recall = np.mean([len(np.intersect1d(a, b)) / k for a, b in zip(indices, ref_indices)])
+        records.append({
+            "backend": backend,
+            "seconds": elapsed,
+            "speedup": ref_elapsed / elapsed,
+            "knn_recall": recall,
+            "score_spearman": spearmanr(scores, ref_scores).statistic,
+            "flag_jaccard": (flagged & ref_flagged).sum() / max((flagged | ref_flagged).sum(), 1),
+            "auc_planted": roc_auc_score(is_anomaly, scores) if is_anomaly.any() else np.nan
+        })
+    return pd.DataFrame(records).set_index("backend")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--features", type=int, default=24)
+    parser.add_argument("--anomaly-rate", type=float, default=0.05)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS),
+                        help="The first one is the reference (keep 'brute' first for exact figures).")
+    args = parser.parse_args()
+
+    print(f"rows={args.rows:,} features={args.features} k={args.k} (reference: {args.backends[0]})")
+    print(run(args.rows, args.features, args.anomaly_rate, args.k, args.seed, args.backends).round(4).to_string())
+
+if __name__ == "__main__":
+    main()
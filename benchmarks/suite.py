@@ -0,0 +1,268 @@
+"""
+DataScope Benchmark - Pipeline Suite
+Times each pipeline stage on synthetic station data, records peak RSS, and
+compares against a saved JSON baseline.
+
+Usage:
+    python -m benchmarks.suite --scale small --output baseline.json
+    python -m benchmarks.suite --scale small --compare baseline.json --threshold 0.25
+
+Every stage runs in a fresh spawned process so its peak RSS is its own.
+The exit status is 1 when `--compare` finds a regression past the threshold.
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.generators import (contingency_table, dataset_name, sparse_contingency_table, station_dataset,
+                                   write_dataset)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SCALES = {
+    "small": {"rows": 5_000, "features": 12, "format": "xlsx"},
+    "medium": {"rows": 50_000, "features": 24, "format": "csv"},
+    "large": {"rows": 200_000, "features": 32, "format": "csv"},
+}
+STAGES = ("startup", "load_cold", "load_cached", "pca", "ca", "ca_sparse", "clustering_flow", "predict",
+          "predict_batch", "security", "live_score")
+PREDICT_CALLS = 200
+LIVE_BATCHES = 100
+LIVE_BATCH_ROWS = 64
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Cold start in a fresh interpreter: import the launcher and, when a display is
+# available, build the main window and process its first paint
+STARTUP_SCRIPT = """
+import tkinter as tk
+import main
+try:
+    root = tk.Tk()
+except tk.TclError:  # headless: import cost only
+    raise SystemExit(0)
+app = main.DataScopeApp(root)
+root.update()
+app.context.scheduler.shutdown()
+root.destroy()
+"""
+
+def _max_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 2**20 if sys.platform == "darwin" else rss / 2**10
+
+def _prepare(stage: str, spec: Dict[str, Any]) -> Callable[[], Any]:
+    """Untimed setup for `stage`; returns the callable to time."""
+    if stage == "startup":
+        return lambda: subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], cwd=ROOT, check=True)
+
+    from src.data.cache import IngestionCache
+    from src.data.loaders import load_excel_dataset
+    from src.data.scaling import ScalingParams
+
+    cache_root = os.path.join(spec["work_dir"], f"cache-{stage}")
+    if stage == "load_cold":
+        def cold():
+            shutil.rmtree(cache_root, ignore_errors=True)
+            return load_excel_dataset(spec["dataset"], cache=IngestionCache(cache_root))
+        return cold
+    if stage == "load_cached":
+        load_excel_dataset(spec["dataset"], cache=IngestionCache(cache_root))
+        return lambda: load_excel_dataset(spec["dataset"], cache=IngestionCache(cache_root))
+
+    if stage == "ca":
+        from src.data.loaders import read_table
+        from src.modules.ca.engine import CAEngine
+        table = read_table(spec["contingency"], index_col=0, cache=IngestionCache(cache_root))
+        return lambda: CAEngine(table).run()
+    if stage == "ca_sparse":
+        from src.modules.ca.engine import CAEngine
+        counts = sparse_contingency_table(*spec["sparse_table"], seed=spec["seed"])
+        return lambda: CAEngine(counts).run()
+
+    raw, scaled = load_excel_dataset(spec["dataset"], cache=IngestionCache(cache_root))
+    if stage == "pca":
+        from src.modules.pca.engine import PCAEngine
+        return lambda: PCAEngine(raw, scaled).run()
+    if stage == "security":
+        from src.modules.cybersecurity.engine import SecurityEngine
+        return lambda: SecurityEngine(raw, contamination=spec["contamination"]).run_scan()
+    if stage == "live_score":
+        from src.modules.cybersecurity.monitor import ReferenceModel
+        model = ReferenceModel.fit(raw, contamination=spec["contamination"])
+        batches = [raw.iloc[i * LIVE_BATCH_ROWS % len(raw):][:LIVE_BATCH_ROWS] for i in range(LIVE_BATCHES)]
+        return lambda: [model.score(batch) for batch in batches]
+
+    from src.modules.clustering.engine import ClusteringEngine
+    if stage == "clustering_flow":
+        return lambda: ClusteringEngine(scaled).run_clustering_flow(spec["k"])
+    engine = ClusteringEngine(scaled, scaling=ScalingParams.fit(raw))
+    engine.run_clustering_flow(spec["k"])
+    if stage == "predict":
+        rows = raw.to_numpy()[:PREDICT_CALLS].tolist()
+        return lambda: [engine.predict(row) for row in rows]
+    if stage == "predict_batch":
+        return lambda: engine.predict_batch(raw)
+    raise ValueError(f"Unknown stage: {stage}")
+
+def run_stage(stage: str, spec: Dict[str, Any], repeats: int) -> Dict[str, Any]:
+    """Runs in a fresh worker process: setup, then `repeats` timed runs."""
+    fn = _prepare(stage, spec)
+    setup_rss = _max_rss_mb()
+    runs = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return {
+        "seconds": statistics.median(runs),
+        "runs": runs,
+        "setup_rss_mb": setup_rss,
+        "peak_rss_mb": _max_rss_mb()
+    }
+
+def run_suite(spec: Dict[str, Any], stages=STAGES, repeats: int = 3,
+              log: Callable[[str], None] = print) -> Dict[str, Any]:
+    results = {}
+    context = mp.get_context("spawn")
+    for stage in stages:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results[stage] = pool.submit(run_stage, stage, spec, repeats).result()
+        rss = results[stage]["peak_rss_mb"]
+        log(f"  {stage:<16} {results[stage]['seconds']:9.4f}s" + (f"  peak {rss:8.1f} MB" if rss else ""))
+    return results
+
+def environment() -> Dict[str, Any]:
+    import pandas as pd
+    import sklearn
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")
+    }
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """Per-stage time and memory ratios against `baseline`; `regressed` past 1 + threshold."""
+    rows = []
+    for stage, result in current["stages"].items():
+        base = baseline["stages"].get(stage)
+        if base is None:
+            continue
+        time_ratio = result["seconds"] / base["seconds"] if base["seconds"] else float("inf")
+        mem_ratio = None
+        if result.get("peak_rss_mb") and base.get("peak_rss_mb"):
+            mem_ratio = result["peak_rss_mb"] / base["peak_rss_mb"]
+        rows.append({
+            "stage": stage,
+            "time_ratio": time_ratio,
+            "memory_ratio": mem_ratio,
+            "regressed": time_ratio > 1 + threshold or (mem_ratio is not None and mem_ratio > 1 + threshold)
+        })
+    return rows
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--rows", type=int, help="Overrides the scale preset.")
+    parser.add_argument("--features", type=int, help="Overrides the scale preset.")
+    parser.add_argument("--format", choices=("xlsx", "csv"), help="Overrides the scale preset.")
+    parser.add_argument("--nan-rate", type=float, default=0.01)
+    parser.add_argument("--anomaly-rate", type=float, default=0.05)
+    parser.add_argument("--table", type=int, nargs=2, default=(40, 12), metavar=("ROWS", "COLS"),
+                        help="Contingency table size for CA.")
+    parser.add_argument("--sparse-table", type=int, nargs=3, default=(20_000, 5_000, 1_000_000),
+                        metavar=("ROWS", "COLS", "NNZ"), help="Sparse contingency table for sparse-mode CA.")
+    parser.add_argument("--k", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "datascope-bench"),
+                        help="Where generated datasets are kept between runs.")
+    parser.add_argument("--output", help="Write results to this JSON file.")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed slowdown / memory growth before flagging (0.2 = +20%%).")
+    args = parser.parse_args(argv)
+
+    preset = SCALES[args.scale]
+    params = {
+        "rows": args.rows or preset["rows"],
+        "features": args.features or preset["features"],
+        "format": args.format or preset["format"],
+        "nan_rate": args.nan_rate,
+        "anomaly_rate": args.anomaly_rate,
+        "table": list(args.table),
+        "sparse_table": list(args.sparse_table),
+        "k": args.k,
+        "seed": args.seed
+    }
+
+    print(f"Generating datasets in {args.data_dir} ...")
+    name = dataset_name(params["rows"], params["features"], params["nan_rate"], params["anomaly_rate"],
+                        params["seed"], n_groups=params["k"])
+    frame, _ = station_dataset(params["rows"], params["features"], n_groups=params["k"],
+                               nan_rate=params["nan_rate"], anomaly_rate=params["anomaly_rate"], seed=params["seed"])
+    table = contingency_table(*params["table"], seed=params["seed"])
+    work_dir = tempfile.mkdtemp(prefix="datascope-bench-")
+    spec = {
+        "dataset": write_dataset(frame, args.data_dir, name, params["format"]),
+        "contingency": write_dataset(table, args.data_dir, f"contingency_{params['table'][0]}x"
+                                     f"{params['table'][1]}_s{params['seed']}", "xlsx", index=True),
+        "work_dir": work_dir,
+        "sparse_table": params["sparse_table"],
+        "seed": params["seed"],
+        "k": params["k"],
+        "contamination": params["anomaly_rate"] or 0.1
+    }
+    del frame
+
+    print(f"rows={params['rows']:,} features={params['features']} format={params['format']} "
+          f"repeats={args.repeats}")
+    try:
+        stages = run_suite(spec, args.stages, args.repeats)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    current = {"params": params, "repeats": args.repeats, "environment": environment(), "stages": stages}
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if not args.compare:
+        return 0
+    with open(args.compare, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("params") != params:
+        print("Warning: baseline was recorded with different parameters.")
+    rows = compare(current, baseline, args.threshold)
+    print(f"\nAgainst {args.compare} (threshold +{args.threshold:.0%}):")
+    for row in rows:
+        mem = f"{row['memory_ratio']:.2f}x" if row["memory_ratio"] is not None else "n/a"
+        flag = "REGRESSION" if row["regressed"] else "ok"
+        print(f"  {row['stage']:<16} time {row['time_ratio']:.2f}x  memory {mem:>6}  {flag}")
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
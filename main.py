@@ -9,18 +9,28 @@ from typing import List, Tuple
 
 from src.core.context import AppContext
 from src.core.exceptions import DataScopeError
-from src.data.loaders import load_excel_dataset
+from src.core.lazy import LazyLoader
 from src.ui.theme import Theme
 from src.ui.components import PremiumButton
-from src.modules.pca.view import PCAView
-from src.modules.clustering.view import ClusteringView
-from src.modules.ca.view import CAView
-from src.modules.cybersecurity.view import SecurityView
+from src.ui.performance import PerformancePanel
+
+# Analysis windows are imported on first click (they pull in pandas, sklearn,
+# scipy, seaborn and matplotlib), so only the Tk shell loads before first paint
+MODULES = [
+    ("📈  Data-Analysis PCA (ACP)", "src.modules.pca.view:PCAView", Theme.PRIMARY, Theme.PRIMARY_HOVER),
+    ("🤖  AI Clustering & Forecasting", "src.modules.clustering.view:ClusteringView", Theme.SUCCESS, Theme.SUCCESS_LIGHT),
+    ("📊  Data-Analysis CA (AFC)", "src.modules.ca.view:CAView", Theme.AFC_PINK, Theme.AFC_PINK_LIGHT),
+    ("🛡️  Cybersecurity", "src.modules.cybersecurity.view:SecurityView", Theme.DANGER, Theme.DANGER_LIGHT)
+]
+# Warmed in the background after first paint: the dataset loaders first, then the modules
+WARM_REFS = ["src.data.loaders", "src.data.streaming"] + [ref for _, ref, _, _ in MODULES]
+WARMUP_DELAY_MS = 300
 
 class DataScopeApp:
     def __init__(self, root: tk.Tk):
         self.root = root
         self.context = AppContext()
+        self.loader = LazyLoader()
         self.root.title("DataScope Professional V2")
         self.root.state('zoomed')
         self.root.configure(bg=Theme.BG_LIGHT)
@@ -28,6 +38,9 @@ class DataScopeApp:
         
         self.module_buttons: List[Tuple[PremiumButton, str, str]] = []
         self._build_ui()
+        self.context.scheduler.attach(self.root)
+        if self.context.get_setting("warm_modules"):
+            self.root.after(WARMUP_DELAY_MS, self._warm_modules)
 
     def _build_ui(self):
         self._build_header()
@@ -111,24 +124,24 @@ class DataScopeApp:
         btn_frame.pack(fill="both", expand=True, pady=10, padx=30)
         for i in range(2): btn_frame.grid_columnconfigure(i, weight=1)
         
-        modules = [
-            ("📈  Data-Analysis PCA (ACP)", lambda: PCAView(self.root, self.context), Theme.PRIMARY, Theme.PRIMARY_HOVER),
-            ("🤖  AI Clustering & Forecasting", lambda: ClusteringView(self.root, self.context), Theme.SUCCESS, Theme.SUCCESS_LIGHT),
-            ("📊  Data-Analysis CA (AFC)", lambda: CAView(self.root, self.context), Theme.AFC_PINK, Theme.AFC_PINK_LIGHT),
-            ("🛡️  Cybersecurity", lambda: SecurityView(self.root, self.context), Theme.DANGER, Theme.DANGER_LIGHT)
-        ]
-        
-        for idx, (name, command, color, hover) in enumerate(modules):
+        for idx, (name, ref, color, hover) in enumerate(MODULES):
             row, col = divmod(idx, 2)
             btn_container = tk.Frame(btn_frame, bg=Theme.BG_CARD)
             btn_container.grid(row=row, column=col, sticky="nsew", padx=15, pady=10)
             
-            btn = PremiumButton(btn_container, text=name, command=command,
+            btn = PremiumButton(btn_container, text=name, command=lambda r=ref: self._open_module(r),
                                bg_color=color, hover_color=hover, height=75,
                                font_size=13, disabled=True)
             btn.pack(fill="both", expand=True)
             self.module_buttons.append((btn, color, hover))
 
+        tools_frame = tk.Frame(content, bg=Theme.BG_CARD)
+        tools_frame.pack(pady=(10, 0))
+        PremiumButton(tools_frame, text="⏱  Performance Monitor",
+                      command=lambda: PerformancePanel(self.root, self.context.profiler),
+                      bg_color=Theme.BG_MEDIUM, hover_color=Theme.BG_DARK, width=300, height=45,
+                      font_size=10).pack()
+
     def _build_footer(self):
         footer = tk.Frame(self.root, bg=Theme.BG_LIGHT, height=100)
         footer.pack(side="bottom", fill="x")
@@ -162,23 +175,73 @@ class DataScopeApp:
         tk.Label(f, text=text, font=(Theme.FONT_FAMILY, 14, "bold"),
                  fg=Theme.TEXT_PRIMARY, bg=Theme.BG_CARD).pack()
 
+    def _warm_modules(self):
+        # After first paint: import the heavy stacks while the user picks a file
+        self.context.scheduler.submit(self.loader.warm, WARM_REFS, name="warm-modules")
+
+    def _open_module(self, ref: str):
+        """Opens an analysis window, importing its module on first use."""
+        if not self.loader.is_loaded(ref):
+            self.root.config(cursor="watch")
+            self.root.update_idletasks()
+        try:
+            view_cls = self.loader.resolve(ref)
+        except Exception as e:
+            messagebox.showerror("Module Error", f"Unable to load module: {str(e)}")
+            return
+        finally:
+            self.root.config(cursor="")
+        view_cls(self.root, self.context)
+
     def _update_prefix(self, event=None):
         prefix = self.entry_prefix.get().strip()
         if prefix: self.context.set_individual_prefix(prefix)
 
     def _on_load_click(self):
-        filepath = filedialog.askopenfilename(filetypes=[("Excel", "*.xlsx")])
+        filepath = filedialog.askopenfilename(filetypes=[("Excel", "*.xlsx"), ("CSV / Parquet (chunked)", "*.csv *.parquet")])
         if not filepath: return
-        try:
-            raw_df, scaled_df = load_excel_dataset(filepath)
-            self.context.set_data(raw_df, scaled_df)
-            self.status_lbl.config(text=f"✓ Loaded {len(raw_df)} records", fg=Theme.SUCCESS,
-                                  font=(Theme.FONT_FAMILY, 10, "bold"))
-            for btn, color, hover in self.module_buttons: btn.enable(color, hover)
-        except DataScopeError as e:
-            messagebox.showerror("System Error", str(e))
+        self.btn_load.disabled = True
+        self.status_lbl.config(text="⏳ Loading dataset…", fg=Theme.TEXT_MUTED, font=(Theme.FONT_FAMILY, 10))
+        self.context.scheduler.submit(self._load_dataset, filepath, name="load-dataset", pass_job=True,
+                                      on_success=self._on_data_loaded, on_error=self._on_load_error,
+                                      on_progress=self._on_load_progress)
+
+    @staticmethod
+    def _load_dataset(filepath: str, job):
+        """Runs on a worker thread; returns (raw_df, scaled_df, scaling)."""
+        # Imported here, off the UI thread, unless the warm-up already did
+        from src.data.loaders import load_raw_dataset
+        from src.data.scaling import ScalingParams
+        from src.data.stats import dataset_stats
+        from src.data.streaming import load_chunked_dataset
+        if filepath.lower().endswith(('.csv', '.parquet')):
+            # Large logs: stream into memory-mapped stores instead of RAM
+            mapped = load_chunked_dataset(filepath, progress=job.report)
+            raw_df = mapped.raw_frame()
+            dataset_stats(raw_df)  # computed here, off the UI thread
+            return raw_df, mapped.scaled_frame(), mapped.scaling_params()
+        raw_df = load_raw_dataset(filepath)
+        return raw_df, None, ScalingParams.from_stats(dataset_stats(raw_df))
+
+    def _on_load_progress(self, fraction: float, message: str):
+        self.status_lbl.config(text=f"⏳ {message}")
+
+    def _on_data_loaded(self, loaded):
+        raw_df, scaled_df, scaling = loaded
+        self.btn_load.disabled = False
+        self.context.set_data(raw_df, scaled_df, scaling=scaling)
+        self.status_lbl.config(text=f"✓ Loaded {len(raw_df)} records", fg=Theme.SUCCESS,
+                              font=(Theme.FONT_FAMILY, 10, "bold"))
+        for btn, color, hover in self.module_buttons: btn.enable(color, hover)
+
+    def _on_load_error(self, error: BaseException):
+        self.btn_load.disabled = False
+        self.status_lbl.config(text="No data loaded — Select an Excel file to begin", fg=Theme.TEXT_MUTED)
+        title = "System Error" if isinstance(error, DataScopeError) else "Unexpected Error"
+        messagebox.showerror(title, str(error))
 
 if __name__ == "__main__":
     root = tk.Tk()
     app = DataScopeApp(root)
     root.mainloop()
+    app.context.scheduler.shutdown()
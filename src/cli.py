@@ -0,0 +1,252 @@
+"""
+DataScope Batch Runner
+Headless PCA / CA / Clustering / Security scans over many workbooks.
+
+Usage:
+    python -m src.cli data/ --out reports/ --workers 4
+    python -m src.cli "stations/*.xlsx" --modules pca clustering --k 5
+
+Nothing here imports tkinter or matplotlib, so it runs on display-less hosts.
+"""
+
+import argparse
+import glob
+import hashlib
+import os
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.core.exceptions import DataScopeError
+from src.data.loaders import load_raw_dataset, read_table
+from src.data.scaling import ScaledView, ScalingParams
+from src.data.stats import dataset_stats
+from src.modules.ca.engine import CAEngine
+from src.modules.clustering.engine import ClusteringEngine
+from src.modules.cybersecurity.engine import SecurityEngine
+from src.modules.cybersecurity.neighbors import NEIGHBOR_BACKENDS
+from src.modules.pca.engine import PCAEngine
+from src.services.exporter import Exporter
+from src.services.registry import ModelRegistry
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MODULES = ("pca", "ca", "clustering", "security")
+SUPPORTED_EXTENSIONS = (".xlsx", ".xls", ".csv")
+
+def collect_files(targets: Sequence[str]) -> List[str]:
+    """Expands directories and glob patterns into a sorted, de-duplicated file list."""
+    files = []
+    for target in targets:
+        if os.path.isdir(target):
+            matches = [os.path.join(target, name) for name in os.listdir(target)]
+        else:
+            matches = glob.glob(target, recursive=True)
+        files.extend(path for path in matches
+                     if os.path.isfile(path) and path.lower().endswith(SUPPORTED_EXTENSIONS)
+                     and not os.path.basename(path).startswith("~$"))
+    return sorted(set(os.path.abspath(path) for path in files))
+
+def report_path(filepath: str, out_dir: str) -> str:
+    """One workbook per input; a short path hash keeps same-named inputs apart."""
+    stem = os.path.splitext(os.path.basename(filepath))[0]
+    digest = hashlib.blake2b(filepath.encode(), digest_size=3).hexdigest()
+    return os.path.join(out_dir, f"{stem}_{digest}_report.xlsx")
+
+def _registry(options: Dict[str, Any]) -> Optional[ModelRegistry]:
+    model_dir = options.get("model_dir")
+    return ModelRegistry(model_dir) if model_dir else None
+
+def _pca_sheets(raw: pd.DataFrame, options: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
+    scaled = ScaledView(raw, ScalingParams.fit(raw), "zscore").frame()
+    res = PCAEngine(raw, scaled).run()
+    names = [f"PC{i + 1}" for i in range(len(res["eigenvalues"]))]
+    eigen = pd.DataFrame({
+        "Eigenvalue": res["eigenvalues"],
+        "Inertia (%)": res["inertia"],
+        "Cumulative (%)": np.cumsum(res["inertia"])
+    }, index=names)
+    loadings = pd.DataFrame(res["loadings"], index=res["features"], columns=names)
+    return {"PCA Eigenvalues": eigen, "PCA Loadings": loadings, "PCA Stats": res["desc_stats"]}
+
+def _ca_sheets(filepath: str, options: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
+    table = read_table(filepath, index_col=0).select_dtypes(include=[np.number])
+    res = CAEngine(table).run()
+    test = pd.DataFrame({"Value": [res["chi2"], res["p_value"], res["dof"], res["total_inertia"]]},
+                        index=["Chi2", "p-value", "DoF", "Total inertia"])
+    inertia = pd.DataFrame({"Inertia": res["inertia"]},
+                           index=[f"Dim{i + 1}" for i in range(len(res["inertia"]))])
+    return {"CA Test": test, "CA Inertia": inertia, "CA Residuals": res["res_df"]}
+
+def _clustering_sheets(raw: pd.DataFrame, options: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
+    scaled = ScaledView(raw, ScalingParams.fit(raw), "zscore").frame()
+    res = ClusteringEngine(scaled, registry=_registry(options)).run_clustering_flow(options["k"])
+    sizes = res["distribution"].rename("Count").to_frame()
+    sizes.loc["RF accuracy", "Count"] = res["accuracy"]
+    return {"Clusters": res["labels"].to_frame(), "Cluster Sizes": sizes}
+
+def _security_sheets(raw: pd.DataFrame, options: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
+    res = SecurityEngine(raw, contamination=options["contamination"],
+                         neighbors=options.get("neighbors", "auto"), registry=_registry(options)).run_scan()
+    flags = pd.DataFrame({
+        "IsolationForest": res["y_iso"] == -1,
+        "LOF": res["y_lof"] == -1
+    }, index=res["labels"])
+    flags["High risk"] = flags["IsolationForest"] & flags["LOF"]
+    return {"Security": flags}
+
+def _run_module(name: str, run: Callable[[], Dict[str, pd.DataFrame]], sheets: Dict[str, pd.DataFrame],
+                rows: List[Dict[str, Any]]) -> None:
+    start = time.perf_counter()
+    try:
+        sheets.update(run())
+        status, detail = "ok", ""
+    except DataScopeError as e:
+        status, detail = "error", str(e)
+    except Exception as e:
+        # e.g. sklearn rejecting --k above the row count; the other modules still report
+        status, detail = "error", f"{type(e).__name__}: {e}"
+    rows.append({"module": name, "status": status, "seconds": time.perf_counter() - start, "detail": detail})
+
+def process_file(filepath: str, out_dir: str, modules: Sequence[str], options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Runs the selected engines on one file and writes its report workbook.
+    Executed in a worker process; returns a JSON-friendly summary row.
+    `worker_max_rss_mb` is the worker's high-water mark so far; the exact
+    per-file peak (`peak_traced_mb`) needs `trace_memory`, which slows the
+    engines down several times.
+    """
+    trace_memory = options.get("trace_memory", False)
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    summary: Dict[str, Any] = {"file": filepath, "report": "", "status": "ok", "error": ""}
+    try:
+        sheets: Dict[str, pd.DataFrame] = {}
+        rows: List[Dict[str, Any]] = []
+        raw = None
+        if set(modules) - {"ca"}:
+            raw = load_raw_dataset(filepath)
+            dataset_stats(raw)
+            summary["rows"], summary["features"] = raw.shape
+        if "pca" in modules:
+            _run_module("pca", lambda: _pca_sheets(raw, options), sheets, rows)
+        if "ca" in modules:
+            _run_module("ca", lambda: _ca_sheets(filepath, options), sheets, rows)
+        if "clustering" in modules:
+            _run_module("clustering", lambda: _clustering_sheets(raw, options), sheets, rows)
+        if "security" in modules:
+            _run_module("security", lambda: _security_sheets(raw, options), sheets, rows)
+
+        for row in rows:
+            summary[f"{row['module']}_seconds"] = round(row["seconds"], 4)
+            if row["status"] != "ok":
+                summary["status"] = "partial"
+                summary["error"] = "; ".join(filter(None, [summary["error"], f"{row['module']}: {row['detail']}"]))
+
+        path = report_path(filepath, out_dir)
+        Exporter.to_excel(path, {"Summary": pd.DataFrame(rows).set_index("module"), **sheets})
+        summary["report"] = path
+    except DataScopeError as e:
+        summary["status"], summary["error"] = "failed", str(e)
+    finally:
+        summary["seconds"] = round(time.perf_counter() - start, 4)
+        if trace_memory:
+            summary["peak_traced_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 2)
+            tracemalloc.stop()
+        summary["worker_max_rss_mb"] = _max_rss_mb()
+    return summary
+
+def _max_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return round(rss / 2**20 if sys.platform == "darwin" else rss / 2**10, 2)
+
+def _init_worker(threads: int) -> None:
+    # Keep BLAS/OpenMP pools from oversubscribing the machine across workers
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(threads)
+    except ImportError:
+        pass
+
+def run_batch(files: Sequence[str], out_dir: str, modules: Sequence[str], options: Dict[str, Any],
+              workers: int = 1, on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> pd.DataFrame:
+    """Spreads `files` over a process pool and returns one summary row per file."""
+    os.makedirs(out_dir, exist_ok=True)
+    workers = max(1, min(workers, len(files) or 1))
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(threads,)) as pool:
+        futures = {pool.submit(process_file, path, out_dir, modules, options): path for path in files}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # A crashed worker (e.g. killed by the OOM killer) must not end the batch
+                result = {"file": futures[future], "status": "failed", "error": str(e)}
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    return pd.DataFrame(results).set_index("file").sort_index() if results else pd.DataFrame()
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("targets", nargs="+", help="Files, directories or glob patterns.")
+    parser.add_argument("--out", default="datascope_reports", help="Output directory for report workbooks.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes.")
+    parser.add_argument("--modules", nargs="+", choices=MODULES, default=list(MODULES))
+    parser.add_argument("--k", type=int, default=4, help="Number of clusters.")
+    parser.add_argument("--contamination", type=float, default=0.1, help="Expected anomaly share.")
+    parser.add_argument("--neighbors", choices=NEIGHBOR_BACKENDS, default="auto",
+                        help="LOF neighbor search backend ('approximate' for very large scans).")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Exact per-file peak memory via tracemalloc (slower).")
+    parser.add_argument("--model-dir", help="Model registry directory (default: ~/.datascope/models). "
+                                            "Trained models are reused across runs.")
+    parser.add_argument("--no-registry", action="store_true", help="Always retrain; save nothing.")
+    args = parser.parse_args(argv)
+
+    files = collect_files(args.targets)
+    if not files:
+        print("No input files found.", file=sys.stderr)
+        return 2
+
+    options = {"k": args.k, "contamination": args.contamination, "neighbors": args.neighbors,
+               "trace_memory": args.trace_memory,
+               "model_dir": None if args.no_registry else (args.model_dir or ModelRegistry().root)}
+    print(f"Scanning {len(files)} file(s) with {args.workers} worker(s): {', '.join(args.modules)}")
+
+    def progress(result: Dict[str, Any]) -> None:
+        line = f"[{result['status']:>7}] {os.path.basename(result['file'])}"
+        if "seconds" in result:
+            peak = result.get("peak_traced_mb", result.get("worker_max_rss_mb"))
+            line += f"  {result['seconds']:.2f}s"
+            if peak is not None:
+                line += f"  peak {peak:.1f} MB"
+        if result.get("error"):
+            line += f"  ({result['error']})"
+        print(line, flush=True)
+
+    start = time.perf_counter()
+    summary = run_batch(files, args.out, args.modules, options, workers=args.workers, on_result=progress)
+    Exporter.to_excel(os.path.join(args.out, "batch_summary.xlsx"), {"Runs": summary})
+
+    failed = int((summary["status"] == "failed").sum())
+    print(f"Done in {time.perf_counter() - start:.2f}s: {len(summary) - failed} ok, {failed} failed. "
+          f"Summary: {os.path.join(args.out, 'batch_summary.xlsx')}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,29 +3,106 @@ DataScope App Context
 Central state management and dependency injection container.
 """
 
-from typing import Optional, Dict, Any
-import pandas as pd
+from typing import TYPE_CHECKING, Optional, Dict, Any
+
+from src.core.jobs import JobScheduler
+from src.core.lru import LRUCache
+from src.core.profiling import Profiler, default_profiler
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from src.data.scaling import ScaledView, ScalingParams
+    from src.data.stats import DatasetStats
+    from src.services.projection import ProjectionService
+    from src.services.registry import ModelRegistry
 
 class AppContext:
     """
     Holds application state and shared services.
     Eliminates the need for global singletons.
+
+    Importing this module stays cheap (no pandas or sklearn) so the launcher
+    can paint before any analysis stack loads; data helpers and services are
+    imported on first use.
     """
-    
+
     def __init__(self) -> None:
-        self.raw_data: Optional[pd.DataFrame] = None
-        self.scaled_data: Optional[pd.DataFrame] = None
+        self.raw_data: Optional["pd.DataFrame"] = None
+        self.scaling: Optional["ScalingParams"] = None
         self.features: list[str] = []
         self.individual_prefix: str = "Individual"
         self.settings: Dict[str, Any] = {
-            "theme_mode": "dark"
+            "theme_mode": "dark",
+            "scaled_cache_mb": 256,
+            # Import the analysis modules in the background once the launcher is up
+            "warm_modules": True
         }
         self.metadata: Dict[str, Any] = {}
+        self.scheduler = JobScheduler()
+        self.scaled_cache = LRUCache(max_bytes=self.settings["scaled_cache_mb"] * 2**20)
+        # Engine results (K-Means fits, trained forests) keyed by dataset fingerprint
+        self.result_cache = LRUCache(max_items=32)
+        # Spans from loaders, engines and charts (disabled until recording starts)
+        self.profiler: Profiler = default_profiler()
+        self._projections: Optional["ProjectionService"] = None
+        self._models: Optional["ModelRegistry"] = None
+        self._scaled_source: Optional["pd.DataFrame"] = None
+        self._views: Dict[str, "ScaledView"] = {}
+
+    @property
+    def projections(self) -> "ProjectionService":
+        """Shared 2-D projections, created on first use."""
+        if self._projections is None:
+            from src.services.projection import ProjectionService
+            self._projections = ProjectionService()
+        return self._projections
 
-    def set_data(self, df: pd.DataFrame, scaled_df: Optional[pd.DataFrame] = None) -> None:
+    @property
+    def models(self) -> "ModelRegistry":
+        """Trained models persisted across sessions, created on first use."""
+        if self._models is None:
+            from src.services.registry import ModelRegistry
+            self._models = ModelRegistry()
+        return self._models
+
+    def set_data(self, df: "pd.DataFrame", scaled_df: Optional["pd.DataFrame"] = None,
+                 scaling: Optional["ScalingParams"] = None) -> None:
+        """
+        Stores the raw frame and its fitted scaling parameters.
+        Scaled views are derived lazily; pass `scaled_df` only when a scaled
+        copy already exists without heap cost (e.g. a memory-mapped store).
+        """
+        from src.data.scaling import ScalingParams
+        from src.data.stats import dataset_stats
         self.raw_data = df
-        self.scaled_data = scaled_df
+        self._scaled_source = scaled_df
+        self.scaling = scaling if scaling is not None or df is None else ScalingParams.from_stats(dataset_stats(df))
         self.features = df.columns.tolist() if df is not None else []
+        self._views.clear()
+        self.scaled_cache.clear()
+
+    def scaled_view(self, kind: str = "zscore") -> Optional["ScaledView"]:
+        """Lazily scaled view of the raw data ('zscore' or 'minmax')."""
+        if self.raw_data is None: return None
+        view = self._views.get(kind)
+        if view is None:
+            from src.data.scaling import ScaledView
+            view = ScaledView(self.raw_data, self.scaling, kind, cache=self.scaled_cache)
+            self._views[kind] = view
+        return view
+
+    @property
+    def stats(self) -> Optional["DatasetStats"]:
+        """Descriptive statistics of the raw data, computed once per dataset."""
+        from src.data.stats import dataset_stats
+        return dataset_stats(self.raw_data) if self.raw_data is not None else None
+
+    @property
+    def scaled_data(self) -> Optional["pd.DataFrame"]:
+        """Z-scored data, materialized on demand and kept only while the cache budget allows."""
+        if self._scaled_source is not None: return self._scaled_source
+        view = self.scaled_view("zscore")
+        return view.frame() if view is not None else None
 
     def set_individual_prefix(self, prefix: str) -> None:
         self.individual_prefix = prefix
@@ -39,3 +116,5 @@ class AppContext:
 
     def set_setting(self, key: str, value: Any) -> None:
         self.settings[key] = value
+        if key == "scaled_cache_mb":
+            self.scaled_cache.max_bytes = int(value) * 2**20
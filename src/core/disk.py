@@ -0,0 +1,51 @@
+"""
+DataScope Disk Budget
+Size accounting and least-recently-used pruning for the on-disk caches.
+"""
+
+import os
+import shutil
+from typing import Iterable, List, Sequence
+
+def dir_nbytes(path: str) -> int:
+    """Total size of the files under `path`."""
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                pass
+    return total
+
+def touch(path: str) -> None:
+    """Marks an entry as recently used for `prune_to_budget`."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+def prune_to_budget(entries: Iterable[str], max_bytes: int, keep: Sequence[str] = ()) -> List[str]:
+    """
+    Deletes entry directories, least recently modified first, until the rest
+    fit in `max_bytes`. Paths in `keep` (e.g. the entry just written) are
+    never deleted. Returns the removed paths.
+    """
+    sized = []
+    for path in entries:
+        try:
+            sized.append((os.path.getmtime(path), path, dir_nbytes(path)))
+        except OSError:
+            continue
+    total = sum(size for _, _, size in sized)
+    keep = {os.path.abspath(path) for path in keep}
+    removed = []
+    for _, path, size in sorted(sized):
+        if total <= max_bytes:
+            break
+        if os.path.abspath(path) in keep:
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+        removed.append(path)
+    return removed
@@ -18,3 +18,7 @@ class AnalysisError(DataScopeError):
 class ValidationError(DataScopeError):
     """Raised when data validation fails."""
     pass
+
+class JobCancelled(DataScopeError):
+    """Raised inside a background job once it has been cancelled."""
+    pass
@@ -0,0 +1,188 @@
+"""
+DataScope Job Scheduler
+Runs engine work on thread/process pools and delivers results on the Tk thread.
+"""
+
+import itertools
+import os
+import queue
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.exceptions import JobCancelled
+
+class Job:
+    """Handle for a submitted task: cancellation flag and progress reporting."""
+
+    def __init__(self, scheduler: "JobScheduler", job_id: int, name: str, owner: Any,
+                 on_success: Optional[Callable[[Any], None]],
+                 on_error: Optional[Callable[[BaseException], None]],
+                 on_progress: Optional[Callable[[float, str], None]]) -> None:
+        self.id = job_id
+        self.name = name
+        self.owner = owner
+        self.on_success = on_success
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.future: Optional[Future] = None
+        self._scheduler = scheduler
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def done(self) -> bool:
+        return self.future is not None and self.future.done()
+
+    def cancel(self) -> None:
+        """Drops pending work and suppresses callbacks; running code stops at its next checkpoint."""
+        self._cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise JobCancelled(f"Job '{self.name}' was cancelled.")
+
+    def report(self, fraction: float, message: str = "") -> None:
+        """Thread-safe progress update; also acts as a cancellation checkpoint."""
+        self.raise_if_cancelled()
+        self._scheduler._events.put(("progress", self, (fraction, message)))
+
+class JobScheduler:
+    """
+    Shared executor for analysis engines.
+
+    Work runs on a thread pool (or a process pool for picklable, CPU-bound
+    functions); completion and progress events are queued and dispatched by
+    `poll()`, which `attach()` schedules on the Tk event loop with `after()`.
+    Callbacks therefore always run on the UI thread, and are skipped when
+    the job was cancelled or its owner widget has been destroyed.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_processes: Optional[int] = None,
+                 poll_interval_ms: int = 50) -> None:
+        cpus = os.cpu_count() or 2
+        self.max_workers = max_workers or min(8, cpus + 2)
+        self.max_processes = max_processes or max(1, cpus - 1)
+        self.poll_interval_ms = poll_interval_ms
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._events: "queue.Queue" = queue.Queue()
+        self._jobs: Dict[int, Job] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._widget = None
+
+    def submit(self, fn: Callable[..., Any], *args: Any, name: str = "", owner: Any = None,
+               on_success: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None,
+               on_progress: Optional[Callable[[float, str], None]] = None,
+               use_processes: bool = False, pass_job: bool = False, **kwargs: Any) -> Job:
+        """
+        Schedules `fn(*args, **kwargs)` and returns its Job handle.
+        With `pass_job=True` the handle is passed as the `job` keyword so the
+        function can report progress; this is only available on threads.
+        """
+        if use_processes and pass_job:
+            raise ValueError("Progress reporting is not available for process-pool jobs.")
+
+        job = Job(self, next(self._ids), name or getattr(fn, "__name__", "job"), owner,
+                  on_success, on_error, on_progress)
+        if pass_job:
+            kwargs["job"] = job
+
+        executor = self.executor(use_processes)
+        with self._lock:
+            self._jobs[job.id] = job
+        job.future = executor.submit(fn, *args, **kwargs)
+        job.future.add_done_callback(lambda _f, j=job: self._events.put(("done", j, None)))
+        return job
+
+    def executor(self, use_processes: bool = False) -> Executor:
+        """Underlying pool, for engines that fan work out themselves (e.g. a K sweep)."""
+        return self._process_pool() if use_processes else self._thread_pool()
+
+    def attach(self, widget: Any) -> None:
+        """Starts the `after()` polling loop on a Tk widget (normally the root)."""
+        self._widget = widget
+        widget.after(self.poll_interval_ms, self._poll_loop)
+
+    def _poll_loop(self) -> None:
+        self.poll()
+        if self._widget is not None:
+            try:
+                self._widget.after(self.poll_interval_ms, self._poll_loop)
+            except Exception:
+                self._widget = None
+
+    def poll(self) -> None:
+        """Dispatches queued completion/progress events on the calling (UI) thread."""
+        while True:
+            try:
+                kind, job, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == "done":
+                with self._lock:
+                    self._jobs.pop(job.id, None)
+
+            if job.cancelled:
+                continue
+            if job.owner is not None and not _widget_alive(job.owner):
+                job.cancel()
+                continue
+
+            if kind == "progress":
+                if job.on_progress:
+                    job.on_progress(*payload)
+                continue
+
+            error = job.future.exception()
+            if error is None:
+                if job.on_success:
+                    job.on_success(job.future.result())
+            elif not isinstance(error, JobCancelled) and job.on_error:
+                job.on_error(error)
+
+    def active_jobs(self, owner: Any = None) -> List[Job]:
+        with self._lock:
+            return [j for j in self._jobs.values() if owner is None or j.owner is owner]
+
+    def cancel_owner(self, owner: Any) -> None:
+        """Cancels every pending or running job submitted for `owner`."""
+        for job in self.active_jobs(owner):
+            job.cancel()
+
+    def shutdown(self, wait: bool = False) -> None:
+        for job in self.active_jobs():
+            job.cancel()
+        self._widget = None
+        if self._threads is not None:
+            self._threads.shutdown(wait=wait, cancel_futures=True)
+            self._threads = None
+        if self._processes is not None:
+            self._processes.shutdown(wait=wait, cancel_futures=True)
+            self._processes = None
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                   thread_name_prefix="datascope-job")
+            return self._threads
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(max_workers=self.max_processes)
+            return self._processes
+
+def _widget_alive(widget: Any) -> bool:
+    try:
+        return bool(widget.winfo_exists())
+    except Exception:
+        return False
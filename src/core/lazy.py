@@ -0,0 +1,50 @@
+"""
+DataScope Lazy Loader
+Imports heavy modules on first use and warms them in the background.
+"""
+
+import importlib
+import time
+from typing import Any, Dict, Iterable, Set
+
+from src.core.profiling import span
+
+class LazyLoader:
+    """
+    Resolves "package.module:Attribute" references on first use.
+
+    `load` always goes through `importlib.import_module`, which blocks on
+    the per-module import lock, so a UI click during the warm-up waits for
+    the import in flight instead of getting a half-initialized module from
+    `sys.modules`. `is_loaded` only reports imports that have finished.
+    `load_seconds` records how long each module took the first time it was
+    imported through the loader.
+    """
+
+    def __init__(self) -> None:
+        self.load_seconds: Dict[str, float] = {}
+        self._completed: Set[str] = set()
+
+    def is_loaded(self, ref: str) -> bool:
+        return ref.partition(":")[0] in self._completed
+
+    def load(self, module_name: str) -> Any:
+        if module_name in self._completed:
+            return importlib.import_module(module_name)
+        start = time.perf_counter()
+        with span("startup.import", module=module_name):
+            module = importlib.import_module(module_name)
+        self.load_seconds.setdefault(module_name, time.perf_counter() - start)
+        self._completed.add(module_name)
+        return module
+
+    def resolve(self, ref: str) -> Any:
+        module_name, _, attr = ref.partition(":")
+        module = self.load(module_name)
+        return getattr(module, attr) if attr else module
+
+    def warm(self, refs: Iterable[str]) -> Dict[str, float]:
+        """Imports every referenced module (meant for a background thread)."""
+        for ref in refs:
+            self.load(ref.partition(":")[0])
+        return dict(self.load_seconds)
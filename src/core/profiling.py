@@ -0,0 +1,198 @@
+"""
+DataScope Profiling
+Lightweight spans for hot paths, with a JSON-lines event log and in-memory history.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from functools import wraps
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+def current_rss() -> Optional[int]:
+    """Resident set size in bytes (Linux), else the peak RSS so far, else None."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        pass
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+class _NullSpan:
+    """Shared no-op span returned while profiling is disabled."""
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+class Span:
+    """One timed operation; nested spans on the same thread record their parent."""
+    __slots__ = ("profiler", "name", "attrs", "parent", "_start", "_wall", "_rss")
+
+    def __init__(self, profiler: "Profiler", name: str, attrs: Dict[str, Any]) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.attrs = attrs
+        self.parent: Optional[str] = None
+
+    def set(self, **attrs: Any) -> None:
+        """Adds attributes (e.g. row counts) known only inside the span."""
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        stack = self.profiler._stack()
+        self.parent = stack[-1].name if stack else None
+        stack.append(self)
+        self._rss = current_rss() if self.profiler.track_memory else None
+        self._wall = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        duration = time.perf_counter() - self._start
+        stack = self.profiler._stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        rss_delta = None
+        if self._rss is not None:
+            end_rss = current_rss()
+            rss_delta = (end_rss - self._rss) if end_rss is not None else None
+        event = {
+            "name": self.name,
+            "start": self._wall,
+            "duration_ms": duration * 1000.0,
+            "rss_delta_mb": rss_delta / 2**20 if rss_delta is not None else None,
+            "thread": threading.current_thread().name,
+            "parent": self.parent,
+            "error": exc_type.__name__ if exc_type is not None else None
+        }
+        if self.attrs:
+            event["attrs"] = self.attrs
+        self.profiler._record(event)
+        return False
+
+class Profiler:
+    """
+    Collects spans from any thread into a bounded history and, optionally,
+    a JSON-lines log file. While disabled, `span()` returns a shared no-op
+    object, so instrumented hot paths pay one attribute check.
+    """
+
+    def __init__(self, enabled: bool = False, log_path: Optional[str] = None,
+                 max_events: int = 5000, track_memory: bool = True) -> None:
+        self.enabled = enabled
+        self.log_path = log_path
+        self.track_memory = track_memory
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self, log_path: Optional[str] = None) -> None:
+        if log_path is not None:
+            self.log_path = log_path
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def span(self, name: str, **attrs: Any):
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, attrs)
+
+    def recent(self, n: Optional[int] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            events = list(self.events)
+        return events if n is None else events[-n:]
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Per-operation aggregates over the retained history, slowest total first."""
+        groups: Dict[str, Dict[str, Any]] = {}
+        for event in self.recent():
+            row = groups.setdefault(event["name"], {"name": event["name"], "count": 0, "total_ms": 0.0,
+                                                    "max_ms": 0.0, "rss_delta_mb": 0.0})
+            row["count"] += 1
+            row["total_ms"] += event["duration_ms"]
+            row["max_ms"] = max(row["max_ms"], event["duration_ms"])
+            row["rss_delta_mb"] += event["rss_delta_mb"] or 0.0
+        rows = sorted(groups.values(), key=lambda r: r["total_ms"], reverse=True)
+        for row in rows:
+            row["mean_ms"] = row["total_ms"] / row["count"]
+        return rows
+
+    def clear(self) -> None:
+        with self._lock:
+            self.events.clear()
+
+    def export(self, path: str) -> None:
+        """Writes the retained history as JSON lines."""
+        with open(path, "w", encoding="utf-8") as f:
+            for event in self.recent():
+                f.write(json.dumps(event, default=str) + "\n")
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            self.events.append(event)
+            if self.log_path:
+                try:
+                    with open(self.log_path, "a", encoding="utf-8") as f:
+                        f.write(json.dumps(event, default=str) + "\n")
+                except OSError:
+                    self.log_path = None
+
+_default: Optional[Profiler] = None
+
+def default_profiler() -> Profiler:
+    """Process-wide profiler; DATASCOPE_PROFILE=1 enables it, DATASCOPE_PROFILE_LOG sets the log file."""
+    global _default
+    if _default is None:
+        log_path = os.environ.get("DATASCOPE_PROFILE_LOG") or None
+        enabled = os.environ.get("DATASCOPE_PROFILE", "") not in ("", "0") or log_path is not None
+        _default = Profiler(enabled=enabled, log_path=log_path)
+    return _default
+
+def span(name: str, **attrs: Any):
+    """`with span("pca.fit", rows=n):` on the default profiler."""
+    return default_profiler().span(name, **attrs)
+
+def timed(name: Optional[str] = None) -> Callable:
+    """Decorator that reports into whichever profiler is the default at call time."""
+    def decorate(fn: Callable) -> Callable:
+        label = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            profiler = default_profiler()
+            if not profiler.enabled:
+                return fn(*args, **kwargs)
+            with Span(profiler, label, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
@@ -0,0 +1,195 @@
+"""
+DataScope Ingestion Cache
+Columnar on-disk cache so each workbook is parsed only once.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.disk import prune_to_budget, touch
+from src.core.lru import LRUCache
+from src.core.profiling import span
+
+CACHE_FORMAT_VERSION = 1
+_HASH_CHUNK = 1 << 20
+# Recently read frames kept in-process for sharing between views
+MAX_SHARED_FRAMES = 8
+# On-disk budget; least recently used entries are pruned after each write
+MAX_CACHE_MB = 4096
+
+def file_content_hash(filepath: str) -> str:
+    """Returns a BLAKE2 digest of the file content, read in 1 MiB chunks."""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(filepath, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """Content fingerprint of a DataFrame (values, index and column names)."""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(repr(df.columns.tolist()).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+class IngestionCache:
+    """
+    Converts tabular files into a memory-mapped columnar layout on first read.
+
+    Each entry is keyed by absolute path, mtime and content hash (plus a reader
+    variant such as the index column). Numeric columns are stored as one
+    ``.npy`` file each and opened with ``mmap_mode='r'``; a cache hit wraps
+    those maps without copying them, so numeric columns stay read-only and
+    paged in from disk. Other columns and the index are pickled alongside.
+    The last `max_frames` frames are also kept in-process so every view that
+    loads the same file shares one copy.
+
+    Entries on disk (including the chunked loader's mapped stores) are kept
+    under `max_mb`; after each write the least recently used ones are pruned.
+    """
+
+    def __init__(self, root: Optional[str] = None, max_frames: int = MAX_SHARED_FRAMES,
+                 max_mb: float = MAX_CACHE_MB) -> None:
+        self.root = root or os.environ.get("DATASCOPE_CACHE_DIR") or os.path.join(
+            os.path.expanduser("~"), ".datascope", "cache")
+        self.max_bytes = int(max_mb * 2**20)
+        self._frames = LRUCache(max_items=max_frames)
+        self._hashes: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def entry_key(self, filepath: str, variant: str = "") -> str:
+        """Builds the cache key from path, mtime, size, content hash and variant."""
+        path = os.path.abspath(filepath)
+        stat = os.stat(path)
+        stamp = (path, stat.st_mtime_ns, stat.st_size)
+        content = self._hashes.get(stamp)
+        if content is None:
+            content = file_content_hash(path)
+            self._hashes[stamp] = content
+        raw = f"{CACHE_FORMAT_VERSION}|{path}|{stat.st_mtime_ns}|{content}|{variant}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def read(self, filepath: str, reader: Callable[[], pd.DataFrame], variant: str = "") -> pd.DataFrame:
+        """
+        Returns the cached frame for ``filepath``, calling ``reader`` on a miss.
+
+        The returned frame is shared between callers and must not be mutated
+        in place. Cache I/O failures fall back to the plain reader.
+        """
+        key = self.entry_key(filepath, variant)
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is not None:
+                return frame
+
+            entry_dir = os.path.join(self.root, key)
+            frame = None
+            if os.path.isfile(os.path.join(entry_dir, "manifest.json")):
+                try:
+                    with span("load.cache_hit", file=os.path.basename(filepath)):
+                        frame = self._load_entry(entry_dir)
+                    touch(entry_dir)
+                except (OSError, ValueError, KeyError):
+                    shutil.rmtree(entry_dir, ignore_errors=True)
+
+            if frame is None:
+                with span("load.parse", file=os.path.basename(filepath)):
+                    frame = reader()
+                try:
+                    with span("load.cache_write"):
+                        self._write_entry(entry_dir, frame)
+                    self._prune(keep=[entry_dir])
+                except OSError:
+                    pass
+
+            self._frames.put(key, frame)
+            return frame
+
+    def forget(self) -> None:
+        """Drops in-process frames; the on-disk entries are kept."""
+        with self._lock:
+            self._frames.clear()
+
+    def prune(self, keep: Sequence[str] = ()) -> List[str]:
+        """Deletes least recently used entries until the cache fits in `max_bytes`."""
+        with self._lock:
+            return self._prune(keep)
+
+    def _prune(self, keep: Sequence[str]) -> List[str]:
+        if not os.path.isdir(self.root):
+            return []
+        # Only finished entries count; in-progress temp directories have no manifest yet
+        entries = [entry.path for entry in os.scandir(self.root)
+                   if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "manifest.json"))]
+        removed = prune_to_budget(entries, self.max_bytes, keep)
+        for path in removed:
+            self._frames.pop(os.path.basename(path))
+        return removed
+
+    def clear(self) -> None:
+        """Removes every on-disk entry and in-process frame."""
+        with self._lock:
+            self._frames.clear()
+            shutil.rmtree(self.root, ignore_errors=True)
+
+    def _write_entry(self, entry_dir: str, df: pd.DataFrame) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=".tmp-", dir=self.root)
+        try:
+            columns = []
+            objects = {}
+            for pos in range(df.shape[1]):
+                series = df.iloc[:, pos]
+                if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+                    fname = f"col_{pos:05d}.npy"
+                    np.save(os.path.join(tmp_dir, fname), series.to_numpy())
+                    columns.append({"kind": "array", "file": fname})
+                else:
+                    objects[pos] = series
+                    columns.append({"kind": "object"})
+
+            pd.to_pickle({"columns": df.columns, "index": df.index, "objects": objects},
+                         os.path.join(tmp_dir, "meta.pkl"))
+            with open(os.path.join(tmp_dir, "manifest.json"), "w", encoding="utf-8") as fh:
+                json.dump({"version": CACHE_FORMAT_VERSION, "n_rows": len(df), "columns": columns}, fh)
+
+            os.replace(tmp_dir, entry_dir)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+    def _load_entry(self, entry_dir: str) -> pd.DataFrame:
+        with open(os.path.join(entry_dir, "manifest.json"), encoding="utf-8") as fh:
+            manifest = json.load(fh)
+        if manifest.get("version") != CACHE_FORMAT_VERSION:
+            raise ValueError("Stale cache entry.")
+
+        meta = pd.read_pickle(os.path.join(entry_dir, "meta.pkl"))
+        data = {}
+        for pos, spec in enumerate(manifest["columns"]):
+            if spec["kind"] == "array":
+                data[pos] = np.load(os.path.join(entry_dir, spec["file"]), mmap_mode="r")
+            else:
+                data[pos] = meta["objects"][pos].array
+
+        # copy=False keeps one block per memory-mapped column instead of consolidating
+        frame = pd.DataFrame(data, index=meta["index"], copy=False)
+        frame.columns = meta["columns"]
+        return frame
+
+_default_cache: Optional[IngestionCache] = None
+
+def default_cache() -> IngestionCache:
+    """Returns the process-wide ingestion cache, creating it on first use."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = IngestionCache()
+    return _default_cache
@@ -6,13 +6,34 @@ Implementation of robust data ingestion logic.
 import os
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import StandardScaler
-from typing import Tuple
+from typing import Tuple, Optional
 from src.core.exceptions import DataLoadError
+from src.core.profiling import span, timed
+from src.data.cache import IngestionCache, default_cache
+from src.data.scaling import ScaledView, ScalingParams
+from src.data.stats import attach_stats, compute_stats
 
-def load_excel_dataset(filepath: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+def read_table(filepath: str, index_col: Optional[int] = None,
+               cache: Optional[IngestionCache] = None) -> pd.DataFrame:
     """
-    Loads an Excel file and returns (raw_df, scaled_df).
+    Reads an Excel or CSV file through the ingestion cache.
+    The first read parses the file; later reads memory-map the columnar copy.
+    The returned frame is shared and must not be modified in place.
+    """
+    if not os.path.exists(filepath):
+        raise DataLoadError(f"File not found: {filepath}")
+
+    if filepath.lower().endswith('.csv'):
+        reader = lambda: pd.read_csv(filepath, index_col=index_col)
+    else:
+        reader = lambda: pd.read_excel(filepath, index_col=index_col)
+
+    return (cache or default_cache()).read(filepath, reader, variant=f"index_col={index_col}")
+
+@timed("load.dataset")
+def load_raw_dataset(filepath: str, cache: Optional[IngestionCache] = None) -> pd.DataFrame:
+    """
+    Loads an Excel file and returns the cleaned numeric frame (no scaled copy).
     
     Raises:
         DataLoadError: If loading or processing fails.
@@ -22,7 +43,7 @@ def load_excel_dataset(filepath: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
             raise DataLoadError(f"File not found: {filepath}")
 
         # Load data (do not use first column as index, we want row-based IDs)
-        df = pd.read_excel(filepath, index_col=None)
+        df = read_table(filepath, index_col=None, cache=cache)
         
         # Filter numeric columns
         numeric_df = df.select_dtypes(include=[np.number])
@@ -36,22 +57,30 @@ def load_excel_dataset(filepath: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
         # Set 1-based index (Row 2 in Excel becomes ID 1)
         numeric_df.index = range(1, len(numeric_df) + 1)
 
-        # Handle NaNs
-        if numeric_df.isnull().any().any():
-            numeric_df = numeric_df.fillna(numeric_df.mean())
-
-        # Scale data
-        scaler = StandardScaler()
-        scaled_values = scaler.fit_transform(numeric_df)
-        scaled_df = pd.DataFrame(
-            scaled_values, 
-            columns=numeric_df.columns, 
-            index=numeric_df.index
-        )
-        
-        return numeric_df, scaled_df
+        # One statistics pass drives the NaN check and the imputation; the
+        # figures stay valid after mean imputation, so they are attached to
+        # the cleaned frame for scaling and the engines to reuse.
+        stats = compute_stats(numeric_df)
+        if stats.has_nulls:
+            with span("load.impute", nulls=int(stats.nulls.sum())):
+                numeric_df = numeric_df.fillna(pd.Series(stats.mean, index=numeric_df.columns))
+        attach_stats(numeric_df, stats)
+
+        return numeric_df
 
     except Exception as e:
         if isinstance(e, DataLoadError):
             raise e
         raise DataLoadError(f"Unexpected error loading data: {str(e)}")
+
+def load_excel_dataset(filepath: str, cache: Optional[IngestionCache] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Loads an Excel file and returns (raw_df, scaled_df).
+    Prefer `load_raw_dataset` + `AppContext.set_data`, which scale lazily.
+    
+    Raises:
+        DataLoadError: If loading or processing fails.
+    """
+    numeric_df = load_raw_dataset(filepath, cache=cache)
+    scaled_df = ScaledView(numeric_df, ScalingParams.fit(numeric_df), "zscore").frame()
+    return numeric_df, scaled_df
@@ -0,0 +1,123 @@
+"""
+DataScope Scaling
+Fitted scaling parameters and lazily computed, block-wise scaled views.
+"""
+
+import itertools
+import weakref
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.lru import LRUCache
+from src.core.profiling import span
+from src.data.stats import DatasetStats, dataset_stats
+
+SCALING_KINDS = ("zscore", "minmax")
+DEFAULT_BLOCK_COLS = 64
+_view_ids = itertools.count()
+
+@dataclass(frozen=True)
+class ScalingParams:
+    """Per-column statistics needed for z-score (StandardScaler) and MinMax scaling."""
+    mean: np.ndarray
+    scale: np.ndarray
+    data_min: np.ndarray
+    data_range: np.ndarray
+
+    @classmethod
+    def fit(cls, df: pd.DataFrame) -> "ScalingParams":
+        """Fits the parameters on a NaN-free numeric frame (population std, like StandardScaler)."""
+        return cls.from_stats(dataset_stats(df))
+
+    @classmethod
+    def from_stats(cls, stats: DatasetStats) -> "ScalingParams":
+        """Derives the parameters from already computed dataset statistics."""
+        return cls(mean=stats.mean.copy(), scale=_nonzero(stats.std(ddof=0)),
+                   data_min=stats.min.copy(), data_range=_nonzero(stats.max - stats.min))
+
+    def offsets(self, kind: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns (shift, divisor) so that scaled = (x - shift) / divisor."""
+        if kind == "zscore":
+            return self.mean, self.scale
+        if kind == "minmax":
+            return self.data_min, self.data_range
+        raise ValueError(f"Unknown scaling kind: {kind}")
+
+def _nonzero(values: np.ndarray) -> np.ndarray:
+    # Constant columns are left unscaled, as in sklearn's scalers
+    values = np.asarray(values, dtype=np.float64).copy()
+    values[values == 0] = 1.0
+    return values
+
+class ScaledView:
+    """
+    Scaled projection of a raw frame computed on demand, column-block by column-block.
+    Blocks and assembled frames are stored in a shared, size-bounded LRU so
+    the scaled copy only lives as long as memory allows. A frame too large for
+    the LRU is still shared through a weak reference while any consumer holds it.
+    """
+
+    def __init__(self, raw: pd.DataFrame, params: ScalingParams, kind: str = "zscore",
+                 cache: Optional[LRUCache] = None, block_cols: int = DEFAULT_BLOCK_COLS) -> None:
+        if kind not in SCALING_KINDS:
+            raise ValueError(f"Unknown scaling kind: {kind}")
+        self.raw = raw
+        self.params = params
+        self.kind = kind
+        self.cache = cache if cache is not None else LRUCache(max_items=0)
+        self.block_cols = max(1, block_cols)
+        self._token = (next(_view_ids), kind)
+        self._frame_ref: Optional["weakref.ref[pd.DataFrame]"] = None
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.raw.shape
+
+    def block_bounds(self) -> Iterator[Tuple[int, int]]:
+        n_cols = self.raw.shape[1]
+        for start in range(0, n_cols, self.block_cols):
+            yield start, min(start + self.block_cols, n_cols)
+
+    def block(self, start: int, stop: int) -> np.ndarray:
+        """Scaled values for columns [start, stop) as a float64 array."""
+        return self.cache.get_or_compute((self._token, "block", start, stop),
+                                         lambda: self._compute(start, stop))
+
+    def iter_blocks(self) -> Iterator[Tuple[int, int, np.ndarray]]:
+        for start, stop in self.block_bounds():
+            yield start, stop, self.block(start, stop)
+
+    def frame(self) -> pd.DataFrame:
+        """Full scaled DataFrame, assembled block-wise into one preallocated array."""
+        key = (self._token, "frame")
+        cached = self.cache.get(key)
+        if cached is None and self._frame_ref is not None:
+            cached = self._frame_ref()
+        if cached is not None:
+            return cached
+
+        with span("scale.frame", kind=self.kind, shape=self.raw.shape):
+            out = np.empty(self.raw.shape, dtype=np.float64)
+            for start, stop in self.block_bounds():
+                block = self.cache.get((self._token, "block", start, stop))
+                if block is None:
+                    self._compute(start, stop, out=out[:, start:stop])
+                else:
+                    out[:, start:stop] = block
+
+        df = pd.DataFrame(out, columns=self.raw.columns, index=self.raw.index, copy=False)
+        self.cache.put(key, df)
+        self._frame_ref = weakref.ref(df)
+        return df
+
+    def _compute(self, start: int, stop: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        shift, divisor = self.params.offsets(self.kind)
+        values = self.raw.iloc[:, start:stop].to_numpy(dtype=np.float64, copy=False)
+        if out is None:
+            out = np.empty(values.shape, dtype=np.float64)
+        np.subtract(values, shift[start:stop], out=out)
+        np.divide(out, divisor[start:stop], out=out)
+        return out
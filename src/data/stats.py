@@ -0,0 +1,218 @@
+"""
+DataScope Statistics Kernel
+Single-pass, blocked descriptive statistics and covariance shared by every engine.
+"""
+
+import weakref
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from src.core.profiling import timed
+
+ROW_BLOCK = 65_536
+
+@dataclass
+class DatasetStats:
+    """
+    Per-column count/nulls/mean/variance/min/max and the co-moment matrix.
+
+    Dispersion figures follow the loader's mean imputation: missing cells
+    contribute zero deviation, so variances divide by `n_rows - ddof`. On
+    complete data this is exactly the usual definition.
+    """
+    columns: List[str]
+    n_rows: int
+    count: np.ndarray
+    nulls: np.ndarray
+    mean: np.ndarray
+    m2: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
+    comoment: np.ndarray
+
+    @property
+    def has_nulls(self) -> bool:
+        return bool(self.nulls.any())
+
+    def var(self, ddof: int = 1) -> np.ndarray:
+        return self.m2 / max(self.n_rows - ddof, 1)
+
+    def std(self, ddof: int = 1) -> np.ndarray:
+        return np.sqrt(self.var(ddof))
+
+    def cov(self, ddof: int = 1) -> np.ndarray:
+        return self.comoment / max(self.n_rows - ddof, 1)
+
+    def corr(self) -> np.ndarray:
+        scale = np.sqrt(np.diag(self.comoment))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = self.comoment / np.outer(scale, scale)
+        np.fill_diagonal(corr, np.where(scale > 0, 1.0, np.nan))
+        return corr
+
+    def corr_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.corr(), index=self.columns, columns=self.columns)
+
+    def summary(self) -> pd.DataFrame:
+        """Mean/std rows in the shape of `DataFrame.describe().loc[['mean', 'std']]`."""
+        return pd.DataFrame([self.mean, self.std(ddof=1)], index=['mean', 'std'], columns=self.columns)
+
+class StatsAccumulator:
+    """
+    Mergeable accumulator behind `compute_stats`.
+
+    Per-column moments use Welford/Chan pairwise merging. Cross moments are
+    kept as shifted sums (X'ᵀX', X'ᵀM, MᵀM with M the presence mask), which
+    are exactly additive and give the mean-imputed co-moment once the
+    global mean is known.
+    """
+
+    def __init__(self, n_features: int) -> None:
+        p = n_features
+        self.n_rows = 0
+        self.count = np.zeros(p)
+        self.mean = np.zeros(p)
+        self.m2 = np.zeros(p)
+        self.min = np.full(p, np.inf)
+        self.max = np.full(p, -np.inf)
+        self.shift: Optional[np.ndarray] = None
+        self._gram = np.zeros((p, p))
+        self._cross = np.zeros((p, p))
+        self._pairs = np.zeros((p, p))
+
+    def update(self, block: np.ndarray) -> None:
+        block = np.asarray(block, dtype=np.float64)
+        if block.ndim != 2 or len(block) == 0:
+            return
+        present = ~np.isnan(block)
+        complete = bool(present.all())
+        count = present.sum(axis=0).astype(np.float64)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            block_mean = np.nansum(block, axis=0) / count
+            block_m2 = np.nansum((block - block_mean) ** 2, axis=0)
+        block_mean = np.where(count > 0, block_mean, 0.0)
+        if count.all():
+            np.minimum(self.min, np.nanmin(block, axis=0), out=self.min)
+            np.maximum(self.max, np.nanmax(block, axis=0), out=self.max)
+        else:
+            filled = np.where(present, block, np.inf)
+            np.minimum(self.min, filled.min(axis=0), out=self.min)
+            np.maximum(self.max, np.where(present, block, -np.inf).max(axis=0), out=self.max)
+
+        if self.shift is None:
+            self.shift = block_mean.copy()
+        shifted = block - self.shift
+        if not complete:
+            shifted = np.where(present, shifted, 0.0)
+        self._gram += shifted.T @ shifted
+        if complete:
+            self._cross += shifted.sum(axis=0)[:, None]
+            self._pairs += len(block)
+        else:
+            mask = present.astype(np.float64)
+            self._cross += shifted.T @ mask
+            self._pairs += mask.T @ mask
+
+        self._merge_moments(len(block), count, block_mean, block_m2)
+
+    def merge(self, other: "StatsAccumulator") -> None:
+        """Folds another accumulator (e.g. from a parallel worker) into this one."""
+        if other.shift is None:
+            return
+        if self.shift is None:
+            self.shift = other.shift.copy()
+        gram, cross = other._reshifted(self.shift)
+        self._gram += gram
+        self._cross += cross
+        self._pairs += other._pairs
+        np.minimum(self.min, other.min, out=self.min)
+        np.maximum(self.max, other.max, out=self.max)
+        self._merge_moments(other.n_rows, other.count, other.mean, other.m2)
+
+    def _reshifted(self, shift: np.ndarray):
+        d = self.shift - shift
+        cross = self._cross + d[:, None] * self._pairs
+        gram = self._gram + self._cross * d[None, :] + self._cross.T * d[:, None] + np.outer(d, d) * self._pairs
+        return gram, cross
+
+    def _merge_moments(self, n_rows: int, count: np.ndarray, mean: np.ndarray, m2: np.ndarray) -> None:
+        total = self.count + count
+        safe = np.where(total > 0, total, 1.0)
+        delta = mean - self.mean
+        self.mean = self.mean + delta * count / safe
+        self.m2 = self.m2 + m2 + delta ** 2 * self.count * count / safe
+        self.count = total
+        self.n_rows += n_rows
+
+    def result(self, columns: Sequence[str]) -> DatasetStats:
+        p = len(self.mean)
+        comoment = np.zeros((p, p))
+        if self.shift is not None:
+            mu = self.mean - self.shift
+            comoment = (self._gram - self._cross * mu[None, :] - self._cross.T * mu[:, None]
+                        + self._pairs * np.outer(mu, mu))
+            np.fill_diagonal(comoment, self.m2)
+        empty = self.count == 0
+        return DatasetStats(
+            columns=list(columns),
+            n_rows=self.n_rows,
+            count=self.count.astype(np.int64),
+            nulls=(self.n_rows - self.count).astype(np.int64),
+            mean=np.where(empty, np.nan, self.mean),
+            m2=self.m2.copy(),
+            min=np.where(empty, np.nan, self.min),
+            max=np.where(empty, np.nan, self.max),
+            comoment=comoment
+        )
+
+@timed("stats.compute")
+def compute_stats(data: Union[pd.DataFrame, np.ndarray], columns: Optional[Sequence[str]] = None,
+                  block_rows: int = ROW_BLOCK) -> DatasetStats:
+    """
+    One blocked pass over `data` (a frame or a possibly memory-mapped array).
+    Frames are read column by column into one row block at a time, so a
+    frame backed by several (memory-mapped) blocks is never copied whole.
+    """
+    n_rows, n_cols = data.shape
+    if isinstance(data, pd.DataFrame):
+        columns = [str(c) for c in data.columns] if columns is None else columns
+        arrays = [data.iloc[:, j].to_numpy() for j in range(n_cols)]
+    else:
+        columns = [str(i) for i in range(n_cols)] if columns is None else columns
+
+    acc = StatsAccumulator(n_cols)
+    for start in range(0, n_rows, block_rows):
+        stop = min(start + block_rows, n_rows)
+        if isinstance(data, pd.DataFrame):
+            block = np.empty((stop - start, n_cols))
+            for j, values in enumerate(arrays):
+                block[:, j] = values[start:stop]
+        else:
+            block = data[start:stop]
+        acc.update(block)
+    return acc.result(columns)
+
+_attached: Dict[int, DatasetStats] = {}
+
+def attach_stats(df: pd.DataFrame, stats: DatasetStats) -> None:
+    """Caches `stats` for the lifetime of `df` (released when the frame is collected)."""
+    key = id(df)
+    if key not in _attached:
+        weakref.finalize(df, _attached.pop, key, None)
+    _attached[key] = stats
+
+def cached_stats(df: pd.DataFrame) -> Optional[DatasetStats]:
+    """Statistics already attached to `df`, if any."""
+    return _attached.get(id(df))
+
+def dataset_stats(df: pd.DataFrame) -> DatasetStats:
+    """Statistics of `df`, computed once and then reused by every engine."""
+    stats = cached_stats(df)
+    if stats is None:
+        stats = compute_stats(df)
+        attach_stats(df, stats)
+    return stats
@@ -0,0 +1,193 @@
+"""
+DataScope Streaming Loader
+Chunked CSV/Parquet ingestion with incremental standardization into memory-mapped stores.
+"""
+
+import json
+import os
+import shutil
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from src.core.disk import touch
+from src.core.exceptions import DataLoadError, DataScopeError
+from src.core.profiling import timed
+from src.data.cache import IngestionCache, default_cache
+from src.data.scaling import ScalingParams
+
+DEFAULT_CHUNKSIZE = 100_000
+STORE_FORMAT_VERSION = 2
+
+def iter_chunks(filepath: str, chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """Yields successive row blocks of a CSV or Parquet file."""
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext == ".csv":
+        yield from pd.read_csv(filepath, chunksize=chunksize)
+    elif ext in (".parquet", ".pq"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise DataLoadError("Reading Parquet files requires the 'pyarrow' package.")
+        for batch in pq.ParquetFile(filepath).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        raise DataLoadError(f"Unsupported format for chunked loading: {ext or filepath}")
+
+class MappedDataset:
+    """
+    Numeric dataset backed by two float32 memory-mapped matrices on disk.
+    `raw` holds the mean-imputed values and `scaled` the z-scores; both are
+    opened read-only so the OS page cache, not the heap, holds the data.
+    """
+
+    def __init__(self, directory: str) -> None:
+        with open(os.path.join(directory, "manifest.json"), encoding="utf-8") as fh:
+            manifest = json.load(fh)
+        if manifest.get("version") != STORE_FORMAT_VERSION:
+            raise DataLoadError("Mapped store was written by an incompatible version.")
+
+        self.directory = directory
+        self.columns: List[str] = manifest["columns"]
+        self.n_rows: int = manifest["n_rows"]
+        self.mean = np.asarray(manifest["mean"], dtype=np.float64)
+        self.scale = np.asarray(manifest["scale"], dtype=np.float64)
+        self.data_min = np.asarray(manifest["min"], dtype=np.float64)
+        self.data_max = np.asarray(manifest["max"], dtype=np.float64)
+        shape = (self.n_rows, len(self.columns))
+        self.raw = np.memmap(os.path.join(directory, "raw.f32"), dtype=np.float32, mode="r", shape=shape)
+        self.scaled = np.memmap(os.path.join(directory, "scaled.f32"), dtype=np.float32, mode="r", shape=shape)
+
+    @property
+    def index(self) -> pd.RangeIndex:
+        # Same 1-based row IDs as the Excel loader
+        return pd.RangeIndex(1, self.n_rows + 1)
+
+    def raw_frame(self) -> pd.DataFrame:
+        """DataFrame view over the raw store (no copy)."""
+        return pd.DataFrame(self.raw, columns=self.columns, index=self.index, copy=False)
+
+    def scaled_frame(self) -> pd.DataFrame:
+        """DataFrame view over the scaled store (no copy)."""
+        return pd.DataFrame(self.scaled, columns=self.columns, index=self.index, copy=False)
+
+    def scaling_params(self) -> ScalingParams:
+        """Fitted parameters for AppContext, so no pass over the store is needed."""
+        data_range = self.data_max - self.data_min
+        data_range[data_range == 0] = 1.0
+        return ScalingParams(mean=self.mean, scale=self.scale, data_min=self.data_min, data_range=data_range)
+
+    def iter_blocks(self, block_rows: int = DEFAULT_CHUNKSIZE, scaled: bool = True) -> Iterator[np.ndarray]:
+        """Yields contiguous row blocks of the scaled (or raw) matrix."""
+        source = self.scaled if scaled else self.raw
+        for start in range(0, self.n_rows, block_rows):
+            yield source[start:start + block_rows]
+
+def _numeric_block(chunk: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    missing = [c for c in columns if c not in chunk.columns]
+    if missing:
+        raise DataLoadError(f"Columns missing from a later chunk: {missing}")
+    # A writable copy: under copy-on-write pandas the plain conversion is a read-only view
+    return chunk[columns].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64, copy=True)
+
+@timed("load.chunked.fit_pass")
+def _fit_pass(filepath: str, chunksize: int,
+              progress: Optional[Callable[[float, str], None]]) -> Tuple[List[str], int, StandardScaler]:
+    scaler = StandardScaler()
+    columns: Optional[List[str]] = None
+    n_rows = 0
+    for chunk in iter_chunks(filepath, chunksize):
+        chunk = chunk.rename(columns=str)
+        if columns is None:
+            columns = chunk.select_dtypes(include=[np.number]).columns.tolist()
+            if not columns:
+                raise DataLoadError("Dataset contains no numeric columns.")
+        block = _numeric_block(chunk, columns)
+        if len(block):
+            scaler.partial_fit(block)
+            n_rows += len(block)
+        if progress:
+            progress(0.0, f"Scanning… {n_rows:,} rows")
+
+    if columns is None or n_rows < 2:
+        raise DataLoadError("Dataset must have at least 2 rows for analysis.")
+    return columns, n_rows, scaler
+
+@timed("load.chunked")
+def load_chunked_dataset(filepath: str, chunksize: int = DEFAULT_CHUNKSIZE,
+                         cache: Optional[IngestionCache] = None,
+                         progress: Optional[Callable[[float, str], None]] = None) -> MappedDataset:
+    """
+    Streams a CSV/Parquet file into memory-mapped raw and scaled stores.
+
+    The first pass accumulates running means/variances with
+    `StandardScaler.partial_fit`; the second pass imputes NaNs with the
+    column mean and writes both float32 matrices block by block. Stores are
+    kept next to the ingestion cache and reused while the file is unchanged.
+    `progress(fraction, message)` is called once per chunk (e.g. `Job.report`).
+
+    Raises:
+        DataLoadError: If loading or processing fails.
+    """
+    try:
+        if not os.path.exists(filepath):
+            raise DataLoadError(f"File not found: {filepath}")
+
+        cache = cache or default_cache()
+        store_dir = os.path.join(cache.root, cache.entry_key(filepath, variant="mapped") + "-mapped")
+        if os.path.isfile(os.path.join(store_dir, "manifest.json")):
+            touch(store_dir)
+            return MappedDataset(store_dir)
+
+        columns, n_rows, scaler = _fit_pass(filepath, chunksize, progress)
+
+        # Variance as if NaNs were mean-imputed (matches the Excel loader)
+        mean = scaler.mean_
+        var = scaler.var_ * scaler.n_samples_seen_ / n_rows
+        scale = np.sqrt(var)
+        scale[scale == 0] = 1.0
+
+        tmp_dir = store_dir + ".tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        shape = (n_rows, len(columns))
+        raw = np.memmap(os.path.join(tmp_dir, "raw.f32"), dtype=np.float32, mode="w+", shape=shape)
+        scaled = np.memmap(os.path.join(tmp_dir, "scaled.f32"), dtype=np.float32, mode="w+", shape=shape)
+
+        data_min = np.full(len(columns), np.inf)
+        data_max = np.full(len(columns), -np.inf)
+        row = 0
+        for chunk in iter_chunks(filepath, chunksize):
+            block = _numeric_block(chunk.rename(columns=str), columns)
+            nan_mask = np.isnan(block)
+            if nan_mask.any():
+                block[nan_mask] = np.take(mean, np.nonzero(nan_mask)[1])
+            if len(block):
+                np.minimum(data_min, block.min(axis=0), out=data_min)
+                np.maximum(data_max, block.max(axis=0), out=data_max)
+            end = row + len(block)
+            raw[row:end] = block
+            scaled[row:end] = (block - mean) / scale
+            row = end
+            if progress:
+                progress(row / n_rows, f"Writing stores… {row:,}/{n_rows:,} rows")
+        raw.flush()
+        scaled.flush()
+        del raw, scaled
+
+        with open(os.path.join(tmp_dir, "manifest.json"), "w", encoding="utf-8") as fh:
+            json.dump({"version": STORE_FORMAT_VERSION, "columns": columns, "n_rows": n_rows,
+                       "mean": mean.tolist(), "scale": scale.tolist(),
+                       "min": data_min.tolist(), "max": data_max.tolist()}, fh)
+
+        shutil.rmtree(store_dir, ignore_errors=True)
+        os.replace(tmp_dir, store_dir)
+        cache.prune(keep=[store_dir])
+        return MappedDataset(store_dir)
+
+    except Exception as e:
+        if isinstance(e, DataScopeError):
+            raise e
+        raise DataLoadError(f"Unexpected error loading data: {str(e)}")
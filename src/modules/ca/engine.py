@@ -5,53 +5,189 @@ Logic for Correspondence Analysis and Chi-squared independence testing.
 
 import pandas as pd
 import numpy as np
-from scipy.stats import chi2_contingency
-from typing import Dict, Any
+from scipy import sparse as sp
+from scipy.sparse.linalg import LinearOperator, svds
+from scipy.stats import chi2 as chi2_dist, chi2_contingency
+from typing import Dict, Any, Optional, Sequence, Union
 from src.core.exceptions import AnalysisError
+from src.core.profiling import span
+
+DEFAULT_DIMS = 2
+# Dense tables up to this many rows or columns get a full SVD (every axis's inertia)
+FULL_SVD_MAX_DIM = 1_000
+# In sparse mode the chi² contributions list only the strongest observed cells
+RES_TOP_CELLS = 1_000
 
 class CAEngine:
-    def __init__(self, df: pd.DataFrame):
-        if df.empty or df.shape[0] < 2 or df.shape[1] < 2:
+    """
+    Correspondence Analysis of a contingency table.
+
+    Dense mode (a regular DataFrame) keeps the full residual table and, for
+    tables up to FULL_SVD_MAX_DIM on a side, the whole inertia spectrum.
+
+    Sparse mode (scipy.sparse counts, a DataFrame of SparseDtype columns, or
+    `sparse=True`) never builds an R x C dense array. The chi² comes from the
+    nonzero cells (sum of O²/E minus n), and the standardized residual matrix
+    is a LinearOperator with rank-one centering. A truncated SVD (`svds`)
+    extracts only `n_dims` axes. `inertia` then holds those axes,
+    `total_inertia` is still chi²/n, and `res_df` lists the RES_TOP_CELLS
+    largest cell contributions.
+    """
+
+    def __init__(self, df: Union[pd.DataFrame, "sp.spmatrix"], n_dims: int = DEFAULT_DIMS,
+                 row_names: Optional[Sequence] = None, col_names: Optional[Sequence] = None,
+                 sparse: Optional[bool] = None):
+        if isinstance(df, pd.DataFrame):
+            row_names = df.index.tolist() if row_names is None else list(row_names)
+            col_names = df.columns.tolist() if col_names is None else list(col_names)
+            frame_sparse = len(df.columns) > 0 and all(isinstance(t, pd.SparseDtype) for t in df.dtypes)
+            self.sparse = frame_sparse if sparse is None else sparse
+            if self.sparse:
+                table = df.sparse.to_coo() if frame_sparse else sp.coo_matrix(df.to_numpy(dtype=float))
+                self.counts = sp.csr_matrix(table, dtype=float)
+        elif sp.issparse(df):
+            self.sparse = True
+            self.counts = sp.csr_matrix(df, dtype=float)
+        else:
+            raise AnalysisError("Table must be a DataFrame or a scipy.sparse matrix.")
+
+        shape = self.counts.shape if self.sparse else df.shape
+        if shape[0] < 2 or shape[1] < 2 or (self.counts.nnz == 0 if self.sparse else df.empty):
             raise AnalysisError("Table must be at least 2x2 with numeric data.")
-        self.df = df
+        self.df = None if self.sparse else df
+        self.row_names = row_names if row_names is not None else [f"Row_{i + 1}" for i in range(shape[0])]
+        self.col_names = col_names if col_names is not None else [f"Col_{j + 1}" for j in range(shape[1])]
+        self.n_dims = max(1, n_dims)
 
     def run(self) -> Dict[str, Any]:
         """Performs full CA computation."""
         try:
-            # Chi-squared test
-            chi2, p_value, dof, expected = chi2_contingency(self.df)
-            
-            # Standardized residuals/Inertia
-            data = self.df.values.astype(float)
-            total_n = data.sum()
-            P = data / total_n
-            r, c = P.sum(axis=1), P.sum(axis=0)
-            S = (P - np.outer(r, c)) / np.sqrt(np.outer(r, c))
-            
-            # SVD for coordinates
-            U, s, Vt = np.linalg.svd(S, full_matrices=False)
-            inertia = s ** 2
-            
-            n_dims = min(2, len(s))
-            row_coords = U[:, :n_dims] * s[:n_dims] / np.sqrt(r)[:, None]
-            col_coords = Vt.T[:, :n_dims] * s[:n_dims] / np.sqrt(c)[:, None]
-
-            # Contribution to Chi2 (Residuals)
-            residuals = (data - expected) ** 2 / expected
-            res_df = pd.DataFrame(residuals, index=self.df.index, columns=self.df.columns).round(3)
-
-            return {
-                "chi2": chi2,
-                "p_value": p_value,
-                "dof": dof,
-                "expected": expected,
-                "inertia": inertia,
-                "total_inertia": np.sum(inertia),
-                "row_coords": row_coords,
-                "col_coords": col_coords,
-                "row_names": self.df.index.tolist(),
-                "col_names": self.df.columns.tolist(),
-                "res_df": res_df
-            }
+            return self._run_sparse() if self.sparse else self._run_dense()
+        except AnalysisError:
+            raise
         except Exception as e:
             raise AnalysisError(f"CA Failed: {str(e)}")
+
+    def _run_dense(self) -> Dict[str, Any]:
+        data = self.df.values.astype(float)
+        total_n = data.sum()
+        row_sums, col_sums = data.sum(axis=1), data.sum(axis=0)
+        self._check_margins(row_sums, col_sums)
+        dof = (data.shape[0] - 1) * (data.shape[1] - 1)
+
+        # Chi-squared test on the one expected table shared with the residuals
+        with span("ca.chi2", shape=data.shape):
+            expected = np.outer(row_sums, col_sums) / total_n
+            residuals = (data - expected) ** 2 / expected
+            if dof == 1:
+                # 2x2: keep scipy's Yates continuity correction for the test itself
+                chi2, p_value, _, _ = chi2_contingency(data)
+            else:
+                chi2 = residuals.sum()
+                p_value = chi2_dist.sf(chi2, dof)
+
+        # Standardized residuals S = (O - E) / sqrt(n E)
+        S = (data - expected) / np.sqrt(expected * total_n)
+        r, c = row_sums / total_n, col_sums / total_n
+        with span("ca.svd", shape=data.shape):
+            if min(data.shape) <= FULL_SVD_MAX_DIM:
+                U, s, Vt = np.linalg.svd(S, full_matrices=False)
+            else:
+                U, s, Vt = self._truncated_svd(S, self.n_dims)
+        inertia = s ** 2
+        n_dims = min(self.n_dims, len(s))
+        row_coords = U[:, :n_dims] * s[:n_dims] / np.sqrt(r)[:, None]
+        col_coords = Vt.T[:, :n_dims] * s[:n_dims] / np.sqrt(c)[:, None]
+
+        # Contribution to Chi2 (Residuals)
+        res_df = pd.DataFrame(residuals, index=self.df.index, columns=self.df.columns).round(3)
+
+        return {
+            "chi2": chi2,
+            "p_value": p_value,
+            "dof": dof,
+            "expected": expected,
+            "inertia": inertia,
+            "total_inertia": residuals.sum() / total_n,
+            "row_coords": row_coords,
+            "col_coords": col_coords,
+            "row_names": self.row_names,
+            "col_names": self.col_names,
+            "res_df": res_df
+        }
+
+    def _run_sparse(self) -> Dict[str, Any]:
+        counts = self.counts
+        total_n = counts.sum()
+        row_sums = np.asarray(counts.sum(axis=1)).ravel()
+        col_sums = np.asarray(counts.sum(axis=0)).ravel()
+        self._check_margins(row_sums, col_sums)
+        dof = (counts.shape[0] - 1) * (counts.shape[1] - 1)
+
+        # Σ (O - E)² / E = Σ O² / E - n, and only nonzero cells have O² > 0
+        with span("ca.chi2", shape=counts.shape, nnz=counts.nnz):
+            coo = counts.tocoo()
+            expected_nz = row_sums[coo.row] * col_sums[coo.col] / total_n
+            chi2 = float(np.sum(coo.data ** 2 / expected_nz) - total_n)
+            p_value = chi2_dist.sf(chi2, dof)
+
+        r, c = row_sums / total_n, col_sums / total_n
+        sr, sc = np.sqrt(r), np.sqrt(c)
+        P = counts / total_n
+
+        def matvec(v):
+            v = np.asarray(v).reshape(len(sc), -1)
+            return (P @ (v / sc[:, None])) / sr[:, None] - np.outer(sr, sc @ v)
+
+        def rmatvec(u):
+            u = np.asarray(u).reshape(len(sr), -1)
+            return (P.T @ (u / sr[:, None])) / sc[:, None] - np.outer(sc, sr @ u)
+
+        # S = D_r^-1/2 (P - r c^T) D_c^-1/2 without forming r c^T
+        S = LinearOperator(counts.shape, matvec=matvec, rmatvec=rmatvec, matmat=matvec,
+                           rmatmat=rmatvec, dtype=float)
+        with span("ca.svd", shape=counts.shape, k=self.n_dims):
+            U, s, Vt = self._truncated_svd(S, self.n_dims)
+        row_coords = U * s / sr[:, None]
+        col_coords = Vt.T * s / sc[:, None]
+
+        return {
+            "chi2": chi2,
+            "p_value": p_value,
+            "dof": dof,
+            "expected": None,
+            "inertia": s ** 2,
+            "total_inertia": chi2 / total_n,
+            "row_coords": row_coords,
+            "col_coords": col_coords,
+            "row_names": self.row_names,
+            "col_names": self.col_names,
+            "res_df": self._top_cells(coo, expected_nz)
+        }
+
+    def _top_cells(self, coo: "sp.coo_matrix", expected_nz: np.ndarray) -> pd.DataFrame:
+        """Observed cells with the largest chi² contributions, strongest first."""
+        contrib = (coo.data - expected_nz) ** 2 / expected_nz
+        top = np.argpartition(contrib, -RES_TOP_CELLS)[-RES_TOP_CELLS:] if len(contrib) > RES_TOP_CELLS \
+            else np.arange(len(contrib))
+        top = top[np.argsort(contrib[top])[::-1]]
+        return pd.DataFrame({
+            "Row": np.asarray(self.row_names, dtype=object)[coo.row[top]],
+            "Column": np.asarray(self.col_names, dtype=object)[coo.col[top]],
+            "Observed": coo.data[top],
+            "Expected": expected_nz[top],
+            "Contribution": contrib[top]
+        }).round(3)
+
+    @staticmethod
+    def _truncated_svd(S, k: int):
+        """Top-k singular triplets, largest first (svds returns them ascending)."""
+        # svds needs k < min(shape); a 2 x C table has a single axis
+        U, s, Vt = svds(S, k=min(k, min(S.shape) - 1), random_state=0)
+        order = np.argsort(s)[::-1]
+        return U[:, order], s[order], Vt[order]
+
+    @staticmethod
+    def _check_margins(row_sums: np.ndarray, col_sums: np.ndarray) -> None:
+        if (row_sums <= 0).any() or (col_sums <= 0).any():
+            raise AnalysisError("CA Failed: every row and column needs a positive total.")
@@ -12,9 +12,12 @@ import matplotlib.pyplot as plt
 
 from src.ui.theme import Theme
 from src.ui.components import StyledCard, PremiumButton
-from src.ui.charts import create_embedded_chart, setup_chart_style
+from src.ui.table import VirtualTable
+from src.ui.view_cache import ViewCache
+from src.ui.charts import LabelManager, create_embedded_chart, lod_scatter, setup_chart_style
 from src.modules.ca.engine import CAEngine
 from src.core.context import AppContext
+from src.data.loaders import read_table
 
 class CAView(tk.Toplevel):
     def __init__(self, parent, context: AppContext):
@@ -45,20 +48,23 @@ class CAView(tk.Toplevel):
         # Content Area
         self.content_container = tk.Frame(self, bg=Theme.BG_PRIMARY)
         self.content_container.pack(fill="both", expand=True, padx=20, pady=20)
+        # Rendered pages are kept and swapped; a new table invalidates them
+        self.views = ViewCache(self.content_container)
+
+        self.back_btn = tk.Button(self.header_content, text="⬅️ Back to Menu", 
+                                  font=(Theme.FONT_FAMILY, 10, "bold"),
+                                  bg="#475569", fg=Theme.TEXT_WHITE, bd=0, padx=15, pady=5,
+                                  cursor="hand2", command=self._render_dashboard)
 
         self._render_dashboard()
 
     def _render_dashboard(self):
-        # Clear current content
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
-        
-        # Reset header
-        for widget in self.header_content.winfo_children():
-            if getattr(widget, 'is_back_btn', False): widget.destroy()
+        self.back_btn.pack_forget()
+        self.views.show("dashboard", self._build_dashboard)
 
+    def _build_dashboard(self, parent):
         # Dashboard Grid
-        dashboard = tk.Frame(self.content_container, bg=Theme.BG_PRIMARY)
+        dashboard = tk.Frame(parent, bg=Theme.BG_PRIMARY)
         dashboard.pack(expand=True)
 
         # Top Row: Data Controls
@@ -93,34 +99,21 @@ class CAView(tk.Toplevel):
             messagebox.showinfo("Note", "Please load or generate data first.")
             return
 
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
-
-        # Add Back Button to Header - Clear existing ones first to prevent duplication
-        for widget in self.header_content.winfo_children():
-            if getattr(widget, 'is_back_btn', False): widget.destroy()
-
-        back_btn = tk.Button(self.header_content, text="⬅️ Back to Menu", 
-                             font=(Theme.FONT_FAMILY, 10, "bold"),
-                             bg="#475569", fg=Theme.TEXT_WHITE, bd=0, padx=15, pady=5,
-                             cursor="hand2", command=self._render_dashboard)
-        back_btn.is_back_btn = True
-        back_btn.pack(side="right", padx=20)
-
-        if view_id == "stats":
-            self._render_stats()
-        elif view_id == "heatmap":
-            self._render_heatmap()
-        elif view_id == "biplot":
-            self._render_biplot()
-        elif view_id == "chi2":
-            self._render_chi2()
+        self.back_btn.pack(side="right", padx=20)
+
+        renderers = {
+            "stats": self._render_stats,
+            "heatmap": self._render_heatmap,
+            "biplot": self._render_biplot,
+            "chi2": self._render_chi2
+        }
+        self.views.show(view_id, renderers[view_id])
 
     def _on_load(self):
         path = filedialog.askopenfilename(filetypes=[("Excel/CSV", "*.xlsx *.csv")])
         if not path: return
         try:
-            df = pd.read_csv(path, index_col=0) if path.endswith('.csv') else pd.read_excel(path, index_col=0)
+            df = read_table(path, index_col=0)
             df = df.select_dtypes(include=[np.number])
             self._update_data(df)
         except Exception as e: messagebox.showerror("Error", str(e))
@@ -144,45 +137,57 @@ class CAView(tk.Toplevel):
         self._update_data(df)
 
     def _update_data(self, df):
-        self.current_df = df
-        engine = CAEngine(df)
-        self.results = engine.run()
+        self.context.scheduler.submit(self._compute, df, name="ca", owner=self,
+                                      on_success=self._on_results,
+                                      on_error=lambda e: messagebox.showerror("Error", str(e)))
+
+    @staticmethod
+    def _compute(df):
+        """Runs on a worker thread; returns (table, results)."""
+        return df, CAEngine(df).run()
+
+    def _on_results(self, outcome):
+        self.current_df, self.results = outcome
+        # Pages of the previous table are stale; the dashboard does not depend on it
+        for view_id in ("stats", "heatmap", "biplot", "chi2"):
+            self.views.invalidate(view_id)
         self._switch_view("stats")
 
-    def _render_stats(self):
-        card = StyledCard(self.content_container, "Frequency Matrix", "📋")
+    def _render_stats(self, parent):
+        card = StyledCard(parent, "Frequency Matrix", "📋")
         card.pack(fill="both", expand=True)
-        t = tk.Text(card.content, bg="#fdf2f8", font=(Theme.FONT_MONO, 10), relief="flat")
-        content = "FREQUENCY MATRIX\n" + "="*30 + "\n" + self.current_df.to_string() + "\n\n"
-        content += f"Chi2: {self.results['chi2']:.4f}\nP-Value: {self.results['p_value']:.4e}\nDOF: {self.results['dof']}"
-        t.insert("1.0", content)
-        t.config(state="disabled")
-        t.pack(fill="both", expand=True, padx=10, pady=10)
-
-    def _render_heatmap(self):
-        card = StyledCard(self.content_container, "Contingency Heatmap", "🔥")
+        summary = f"Chi2: {self.results['chi2']:.4f}    P-Value: {self.results['p_value']:.4e}    DOF: {self.results['dof']}"
+        tk.Label(card.content, text=summary, font=(Theme.FONT_MONO, 10, "bold"), bg=Theme.BG_CARD,
+                 fg=Theme.TEXT_PRIMARY).pack(side="bottom", anchor="w", padx=10, pady=(0, 10))
+        VirtualTable(card.content, self.current_df, bg="#fdf2f8", stripe="#fce7f3",
+                     font_size=10).pack(fill="both", expand=True, padx=10, pady=10)
+
+    def _render_heatmap(self, parent):
+        card = StyledCard(parent, "Contingency Heatmap", "🔥")
         card.pack(fill="both", expand=True)
         fig, ax, canvas = create_embedded_chart(card.content)
         sns.heatmap(self.current_df, annot=True, fmt="d", cmap="PuRd", ax=ax, cbar=False)
         canvas.draw()
 
-    def _render_biplot(self):
-        card = StyledCard(self.content_container, "Factorial Biplot", "🎯")
+    def _render_biplot(self, parent):
+        card = StyledCard(parent, "Factorial Biplot", "🎯")
         card.pack(fill="both", expand=True)
         fig, ax, canvas = create_embedded_chart(card.content)
         r = self.results
-        ax.scatter(r['row_coords'][:,0], r['row_coords'][:,1], c=Theme.CHART_BLUE, label="Rows", s=60)
-        ax.scatter(r['col_coords'][:,0], r['col_coords'][:,1], c=Theme.AFC_PINK, label="Cols", s=60, marker="^")
-        for i, txt in enumerate(r['row_names']): ax.annotate(txt, (r['row_coords'][i,0], r['row_coords'][i,1]), color=Theme.CHART_BLUE)
-        for i, txt in enumerate(r['col_names']): ax.annotate(txt, (r['col_coords'][i,0], r['col_coords'][i,1]), color=Theme.AFC_PINK)
+        lod_scatter(ax, r['row_coords'][:,0], r['row_coords'][:,1], Theme.CHART_BLUE, label="Rows", s=60)
+        lod_scatter(ax, r['col_coords'][:,0], r['col_coords'][:,1], Theme.AFC_PINK, label="Cols", s=60, marker="^")
+        LabelManager(ax, r['row_coords'][:,0], r['row_coords'][:,1], r['row_names'], offset=(0, 0),
+                     style={'color': Theme.CHART_BLUE})
+        LabelManager(ax, r['col_coords'][:,0], r['col_coords'][:,1], r['col_names'], offset=(0, 0),
+                     style={'color': Theme.AFC_PINK})
         ax.axhline(0, color='gray', lw=0.5); ax.axvline(0, color='gray', lw=0.5)
         ax.legend()
         canvas.draw()
 
-    def _render_chi2(self):
-        card = StyledCard(self.content_container, "Chi² Independence Analysis", "📉")
+    def _render_chi2(self, parent):
+        card = StyledCard(parent, "Chi² Independence Analysis", "📉")
         card.pack(fill="both", expand=True)
-        t = tk.Text(card.content, bg="#fdf2f8", font=(Theme.FONT_MONO, 9), relief="flat")
-        t.insert("1.0", "CONTRIBUTION TO CHI2\n" + "="*30 + "\n" + self.results['res_df'].to_string())
-        t.config(state="disabled")
-        t.pack(fill="both", expand=True, padx=10, pady=10)
+        tk.Label(card.content, text="CONTRIBUTION TO CHI2", font=(Theme.FONT_MONO, 9, "bold"),
+                 bg=Theme.BG_CARD, fg=Theme.TEXT_PRIMARY).pack(anchor="w", padx=10, pady=(10, 0))
+        VirtualTable(card.content, self.results['res_df'], bg="#fdf2f8", stripe="#fce7f3", precision=3,
+                     font_size=9).pack(fill="both", expand=True, padx=10, pady=10)
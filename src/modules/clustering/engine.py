@@ -3,58 +3,441 @@ Clustering Analysis Engine - Professional Edition
 Logic for K-Means and Random Forest classification with feature support.
 """
 
+import threading
+import time
 import pandas as pd
 import numpy as np
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, classification_report
-from typing import Dict, Any, Tuple, Optional
+from sklearn.metrics import accuracy_score, classification_report, silhouette_score, davies_bouldin_score
+from concurrent.futures import Executor
+from typing import Callable, Dict, Any, Tuple, Optional, Sequence, Union
 from src.core.exceptions import AnalysisError
+from src.core.lru import LRUCache
+from src.core.profiling import timed
+from src.data.cache import frame_fingerprint
+from src.data.scaling import ScalingParams
+from src.data.streaming import iter_chunks
+from src.services.registry import ModelRegistry
+
+SWEEP_SEED_ROWS = 50_000
+SILHOUETTE_SAMPLE = 10_000
+
+BACKENDS = ("auto", "kmeans", "minibatch", "streaming")
+MINIBATCH_MIN_ROWS = 100_000
+STREAMING_MIN_ROWS = 1_000_000
+STREAM_BLOCK_ROWS = 65_536
+STREAM_EPOCHS = 3
+PREDICT_CHUNK_ROWS = 65_536
+
+def resolve_backend(backend: str, n_rows: int) -> str:
+    """Maps 'auto' to a concrete backend by row count."""
+    if backend not in BACKENDS:
+        raise AnalysisError(f"Unknown clustering backend: {backend}")
+    if backend != "auto":
+        return backend
+    if n_rows >= STREAMING_MIN_ROWS:
+        return "streaming"
+    if n_rows >= MINIBATCH_MIN_ROWS:
+        return "minibatch"
+    return "kmeans"
+
+def _stream_kmeans(X: np.ndarray, n_clusters: int, random_state: int,
+                   init: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, float]:
+    """MiniBatchKMeans.partial_fit over contiguous row blocks (memmap friendly)."""
+    model = MiniBatchKMeans(n_clusters=n_clusters, init=init if init is not None else "k-means++",
+                            n_init=1, batch_size=STREAM_BLOCK_ROWS, random_state=random_state)
+    for _ in range(STREAM_EPOCHS):
+        for start in range(0, len(X), STREAM_BLOCK_ROWS):
+            model.partial_fit(X[start:start + STREAM_BLOCK_ROWS])
+
+    labels = np.empty(len(X), dtype=np.int32)
+    inertia = 0.0
+    for start in range(0, len(X), STREAM_BLOCK_ROWS):
+        block = np.asarray(X[start:start + STREAM_BLOCK_ROWS])
+        block_labels = model.predict(block)
+        labels[start:start + len(block)] = block_labels
+        inertia += float(((block - model.cluster_centers_[block_labels]) ** 2).sum())
+    return labels, model.cluster_centers_, inertia
+
+def fit_kmeans_backend(X: np.ndarray, n_clusters: int, backend: str, n_init: int, random_state: int,
+                       init: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, float]:
+    """Returns (labels, centroids, inertia) using the requested concrete backend."""
+    if backend == "streaming":
+        return _stream_kmeans(X, n_clusters, random_state, init)
+    if backend == "minibatch":
+        model = MiniBatchKMeans(n_clusters=n_clusters, init=init if init is not None else "k-means++",
+                                n_init=1 if init is not None else min(n_init, 3),
+                                batch_size=4096, random_state=random_state)
+    else:
+        model = KMeans(n_clusters=n_clusters, init=init if init is not None else "k-means++",
+                       n_init=1 if init is not None else n_init, random_state=random_state)
+    labels = model.fit_predict(X)
+    return labels, model.cluster_centers_, float(model.inertia_)
+
+def _refine_k(X: np.ndarray, init: np.ndarray, backend: str, random_state: int,
+              silhouette_sample: int) -> Dict[str, Any]:
+    """Single warm-started fit plus quality metrics (module-level so it pickles)."""
+    labels, centroids, inertia = fit_kmeans_backend(X, len(init), backend, 1, random_state, init=init)
+    n_labels = len(np.unique(labels))
+    if 1 < n_labels < len(X):
+        sample = min(silhouette_sample, len(X))
+        silhouette = float(silhouette_score(X, labels, sample_size=sample, random_state=random_state))
+        davies_bouldin = float(davies_bouldin_score(X, labels))
+    else:
+        silhouette = davies_bouldin = float("nan")
+    return {
+        "labels": labels,
+        "centroids": centroids,
+        "inertia": inertia,
+        "silhouette": silhouette,
+        "davies_bouldin": davies_bouldin
+    }
 
 class ClusteringEngine:
-    def __init__(self, scaled_data: pd.DataFrame):
-        self.data = scaled_data
+    """
+    K-Means segmentation with a Random Forest trained on the resulting labels.
+    Clustering and forest results are memoized per (dataset fingerprint, K,
+    hyperparameters) in a bounded LRU, and the forest is only trained on
+    demand, so revisiting a K is instant.
+
+    `backend` selects exact KMeans, MiniBatchKMeans or a chunked streaming
+    fit; 'auto' picks by row count (see `resolve_backend`).
+
+    `scaling` holds the z-score parameters `scaled_data` was built with;
+    `predict`/`predict_batch` apply them to raw inputs. Without it, inputs
+    are taken to be on the training scale already.
+
+    With a `registry`, fitted K-Means results and forests are also saved to
+    disk under the same key, so a later session reloads them instead of
+    retraining.
+
+    `scaled_data` may also be a zero-argument callable. The frame, its
+    fingerprint and the 'auto' backend are then resolved on first use,
+    normally inside the first submitted job rather than on the UI thread.
+    """
+
+    def __init__(self, scaled_data: Union[pd.DataFrame, Callable[[], pd.DataFrame]], cache: Optional[LRUCache] = None,
+                 n_init: int = 10, n_estimators: int = 100, random_state: int = 42,
+                 backend: str = "auto", registry: Optional[ModelRegistry] = None,
+                 scaling: Optional[ScalingParams] = None):
+        if backend not in BACKENDS:
+            raise AnalysisError(f"Unknown clustering backend: {backend}")
+        self._data_source = scaled_data
+        self._data: Optional[pd.DataFrame] = scaled_data if isinstance(scaled_data, pd.DataFrame) else None
+        self._fingerprint: Optional[str] = None
+        self._backend: Optional[str] = None
+        self._requested_backend = backend
+        self._lazy_lock = threading.RLock()
+        self.scaling = scaling
+        self.cache = cache if cache is not None else LRUCache(max_items=32)
+        self.registry = registry
+        self.n_init = n_init
+        self.n_estimators = n_estimators
+        self.random_state = random_state
         self.clf: Optional[RandomForestClassifier] = None
         self.accuracy: float = 0.0
         self.report: str = ""
         self.labels: Optional[pd.Series] = None
 
-    def run_clustering_flow(self, n_clusters: int = 4) -> Dict[str, Any]:
-        """Runs the standard K-Means -> RF Training flow."""
+    @property
+    def data(self) -> pd.DataFrame:
+        if self._data is None:
+            with self._lazy_lock:
+                if self._data is None:
+                    self._data = self._data_source()
+        return self._data
+
+    @property
+    def fingerprint(self) -> str:
+        """Content fingerprint of `data`, hashed once on first use."""
+        if self._fingerprint is None:
+            with self._lazy_lock:
+                if self._fingerprint is None:
+                    self._fingerprint = frame_fingerprint(self.data)
+        return self._fingerprint
+
+    @property
+    def backend(self) -> str:
+        if self._backend is None:
+            self._backend = resolve_backend(self._requested_backend, len(self.data))
+        return self._backend
+
+    def _kmeans_key(self, n_clusters: int) -> Tuple:
+        return ("kmeans", self.fingerprint, n_clusters, self.backend, self.n_init, self.random_state)
+
+    def _forest_key(self, n_clusters: int, source: str) -> Tuple:
+        # `source` records which labels the forest learned: the sweep's refinement
+        # numbers clusters differently from the exact fit
+        return ("forest", self.fingerprint, n_clusters, source, self.backend, self.n_init, self.n_estimators,
+                self.random_state)
+
+    def _sweep_key(self, n_clusters: int) -> Tuple:
+        return ("kmeans-sweep", self.fingerprint, n_clusters, self.backend, self.random_state)
+
+    def _persisted(self, key: Tuple, fit) -> Dict[str, Any]:
+        """Loads the model saved under `key` from the registry, or fits and saves it."""
+        if self.registry is None:
+            return fit()
+        kind, fingerprint, *params = key
+        return self.registry.load_or_fit(kind, fingerprint, {"params": params}, fit)
+
+    def has_clustering(self, n_clusters: int) -> bool:
+        # Cheap enough for the UI thread: False until a job has fingerprinted the data
+        if self._fingerprint is None:
+            return False
+        return self._kmeans_key(n_clusters) in self.cache or self._sweep_key(n_clusters) in self.cache
+
+    def has_classifier(self, n_clusters: int) -> bool:
+        if self._fingerprint is None:
+            return False
+        return self._forest_key(n_clusters, self._label_source(n_clusters)) in self.cache
+
+    def _label_source(self, n_clusters: int) -> str:
+        """'exact' when an exact K-Means fit is cached (or none is), 'sweep' when only the sweep's is."""
+        if self._kmeans_key(n_clusters) not in self.cache and self._sweep_key(n_clusters) in self.cache:
+            return "sweep"
+        return "exact"
+
+    def _clustering_from(self, n_clusters: int, source: str) -> Dict[str, Any]:
+        if source == "sweep":
+            result = self.cache.get(self._sweep_key(n_clusters))
+            if result is not None:
+                return result
+        key = self._kmeans_key(n_clusters)
+        return self.cache.get_or_compute(key, lambda: self._persisted(key, lambda: self._fit_kmeans(n_clusters)))
+
+    def run_clustering(self, n_clusters: int = 4) -> Dict[str, Any]:
+        """Fits (or recalls) K-Means for the given K."""
+        try:
+            result = self._clustering_from(n_clusters, self._label_source(n_clusters))
+            self.labels = result["labels"]
+            return result
+        except Exception as e:
+            raise AnalysisError(f"Clustering failed: {str(e)}")
+
+    @timed("clustering.kmeans")
+    def _fit_kmeans(self, n_clusters: int) -> Dict[str, Any]:
+        values, centroids, inertia = fit_kmeans_backend(self.data.to_numpy(), n_clusters, self.backend,
+                                                        self.n_init, self.random_state)
+        labels = pd.Series(values, index=self.data.index, name="Cluster")
+        return {
+            "labels": labels,
+            "distribution": labels.value_counts().sort_index(),
+            "n_clusters": n_clusters,
+            "centroids": centroids,
+            "inertia": inertia,
+            "backend": self.backend
+        }
+
+    def sweep(self, k_values: Sequence[int] = range(2, 11), executor: Optional[Executor] = None,
+              silhouette_sample: int = SILHOUETTE_SAMPLE) -> pd.DataFrame:
+        """
+        Fits every K in `k_values` and returns inertia, silhouette and
+        Davies-Bouldin per K (indexed by K).
+
+        Centroids are warm-started: one K-Means at the largest K (on a sample
+        for big datasets) is collapsed to each smaller K by a weighted
+        K-Means over its centroids, then each K is refined with a single
+        full-data fit. Refinements run concurrently on `executor` (a process
+        pool) when given. Per-K labels are cached so `run_clustering` can
+        switch K without recomputing.
+        """
+        try:
+            k_values = sorted(set(int(k) for k in k_values if 2 <= k < len(self.data)))
+            if not k_values:
+                raise AnalysisError("No valid K values to sweep.")
+            key = ("sweep", self.fingerprint, tuple(k_values), self.backend, self.random_state, silhouette_sample)
+            return self.cache.get_or_compute(key, lambda: self._run_sweep(k_values, executor, silhouette_sample))
+        except AnalysisError:
+            raise
+        except Exception as e:
+            raise AnalysisError(f"K sweep failed: {str(e)}")
+
+    @timed("clustering.sweep")
+    def _run_sweep(self, k_values: Sequence[int], executor: Optional[Executor],
+                   silhouette_sample: int) -> pd.DataFrame:
+        X = self.data.to_numpy()
+        rng = np.random.default_rng(self.random_state)
+        seed_X = X if len(X) <= SWEEP_SEED_ROWS else X[np.sort(rng.choice(len(X), SWEEP_SEED_ROWS, replace=False))]
+
+        k_max = max(k_values)
+        seed = KMeans(n_clusters=k_max, n_init=3, random_state=self.random_state).fit(seed_X)
+        weights = np.bincount(seed.labels_, minlength=k_max)
+
+        inits = {}
+        for k in k_values:
+            if k == k_max:
+                inits[k] = seed.cluster_centers_
+            else:
+                collapse = KMeans(n_clusters=k, n_init=10, random_state=self.random_state)
+                collapse.fit(seed.cluster_centers_, sample_weight=weights)
+                inits[k] = collapse.cluster_centers_
+
+        if executor is not None:
+            futures = {k: executor.submit(_refine_k, X, inits[k], self.backend, self.random_state,
+                                          silhouette_sample)
+                       for k in k_values}
+            fits = {k: f.result() for k, f in futures.items()}
+        else:
+            fits = {k: _refine_k(X, inits[k], self.backend, self.random_state, silhouette_sample)
+                    for k in k_values}
+
+        rows = []
+        for k in k_values:
+            fit = fits[k]
+            labels = pd.Series(fit["labels"], index=self.data.index, name="Cluster")
+            self.cache.put(self._sweep_key(k), {
+                "labels": labels,
+                "distribution": labels.value_counts().sort_index(),
+                "n_clusters": k,
+                "centroids": fit["centroids"],
+                "inertia": fit["inertia"],
+                "backend": self.backend
+            })
+            rows.append({"k": k, "inertia": fit["inertia"], "silhouette": fit["silhouette"],
+                         "davies_bouldin": fit["davies_bouldin"]})
+        return pd.DataFrame(rows).set_index("k")
+
+    def train_classifier(self, n_clusters: int = 4) -> Dict[str, Any]:
+        """Trains (or recalls) the Random Forest on the K-Means labels for K."""
         try:
-            # 1. K-Means
-            kmeans = KMeans(n_clusters=n_clusters, n_init=10, random_state=42)
-            self.labels = pd.Series(kmeans.fit_predict(self.data), index=self.data.index, name="Cluster")
-            
-            # 2. Train Classifier
-            X_train, X_test, y_train, y_test = train_test_split(
-                self.data, self.labels, test_size=0.3, random_state=42
-            )
-            self.clf = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1)
-            self.clf.fit(X_train, y_train)
-            
-            y_pred = self.clf.predict(X_test)
-            self.accuracy = accuracy_score(y_test, y_pred)
-            self.report = classification_report(y_test, y_pred, zero_division=0)
-            
-            return {
-                "accuracy": self.accuracy,
-                "report": self.report,
-                "labels": self.labels,
-                "distribution": self.labels.value_counts().sort_index(),
-                "n_clusters": n_clusters
-            }
+            source = self._label_source(n_clusters)
+            key = self._forest_key(n_clusters, source)
+            result = self.cache.get_or_compute(key, lambda: self._persisted(
+                key, lambda: self._fit_forest(n_clusters, source)))
+            self.clf = result["clf"]
+            self.accuracy = result["accuracy"]
+            self.report = result["report"]
+            return result
+        except AnalysisError:
+            raise
         except Exception as e:
-            raise AnalysisError(f"Clustering flow failed: {str(e)}")
+            raise AnalysisError(f"Classifier training failed: {str(e)}")
+
+    @timed("clustering.forest")
+    def _fit_forest(self, n_clusters: int, source: str) -> Dict[str, Any]:
+        labels = self._clustering_from(n_clusters, source)["labels"]
+        X_train, X_test, y_train, y_test = train_test_split(
+            self.data, labels, test_size=0.3, random_state=self.random_state
+        )
+        clf = RandomForestClassifier(n_estimators=self.n_estimators, random_state=self.random_state, n_jobs=-1)
+        clf.fit(X_train, y_train)
+
+        y_pred = clf.predict(X_test)
+        return {
+            "clf": clf,
+            "accuracy": accuracy_score(y_test, y_pred),
+            "report": classification_report(y_test, y_pred, zero_division=0),
+            "report_table": pd.DataFrame(classification_report(y_test, y_pred, zero_division=0,
+                                                               output_dict=True)).T.drop(index="accuracy").astype({"support": int}),
+            "n_clusters": n_clusters
+        }
+
+    def run_clustering_flow(self, n_clusters: int = 4) -> Dict[str, Any]:
+        """Runs the standard K-Means -> RF Training flow."""
+        clustering = self.run_clustering(n_clusters)
+        model = self.train_classifier(n_clusters)
+        return {
+            "accuracy": model["accuracy"],
+            "report": model["report"],
+            "labels": clustering["labels"],
+            "distribution": clustering["distribution"],
+            "n_clusters": n_clusters
+        }
 
     def predict(self, feature_values: list) -> int:
         """Predicts cluster for raw feature inputs."""
         if not self.clf:
             raise AnalysisError("Classifier is not trained.")
         try:
-            # Wrap in DataFrame to avoid feature name warning
             input_df = pd.DataFrame([feature_values], columns=self.data.columns)
-            return int(self.clf.predict(input_df)[0])
+            return int(self.predict_batch(input_df)["Cluster"].iloc[0])
+        except AnalysisError:
+            raise
+        except Exception as e:
+            raise AnalysisError(f"Prediction failed: {str(e)}")
+
+    def predict_batch(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Scores many raw records at once. Returns the predicted "Cluster" and
+        one "P(Cluster k)" column per class, indexed like `frame`.
+
+        Values are coerced to numbers and scaled with the training
+        parameters; missing or non-finite values are imputed with the
+        training means, as at load time. Rows with no usable value get
+        <NA> as cluster and NaN probabilities.
+        """
+        return self._score(frame)[0]
+
+    def _score(self, frame: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+        """`predict_batch` plus the number of rows that needed imputation."""
+        if not self.clf:
+            raise AnalysisError("Classifier is not trained.")
+        missing = [c for c in self.data.columns if c not in frame.columns]
+        if missing:
+            raise AnalysisError(f"Input is missing feature columns: {', '.join(map(str, missing))}")
+        try:
+            values = frame[self.data.columns]
+            if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in values.dtypes):
+                values = values.apply(pd.to_numeric, errors="coerce")
+            X = values.to_numpy(dtype=np.float64, copy=True)
+            bad = ~np.isfinite(X)
+            valid = ~bad.all(axis=1)
+
+            if self.scaling is not None:
+                shift, divisor = self.scaling.offsets("zscore")
+                X -= shift
+                X /= divisor
+                fill = np.zeros(X.shape[1])
+            else:
+                fill = self.data.mean().to_numpy()
+            X[bad] = np.take(fill, np.nonzero(bad)[1])
+
+            classes = self.clf.classes_
+            proba = np.full((len(X), len(classes)), np.nan)
+            codes = np.zeros(len(X), dtype=np.int64)
+            if valid.any():
+                proba[valid] = self.clf.predict_proba(pd.DataFrame(X[valid], columns=self.data.columns))
+                codes[valid] = classes[proba[valid].argmax(axis=1)]
+
+            result = pd.DataFrame(proba, index=frame.index, columns=[f"P(Cluster {c})" for c in classes])
+            result.insert(0, "Cluster", pd.arrays.IntegerArray(codes, mask=~valid))
+            return result, int((bad.any(axis=1) & valid).sum())
         except Exception as e:
             raise AnalysisError(f"Prediction failed: {str(e)}")
+
+    @timed("clustering.predict_file")
+    def predict_file(self, filepath: str, chunksize: int = PREDICT_CHUNK_ROWS,
+                     progress: Optional[Callable[[float, str], None]] = None) -> Dict[str, Any]:
+        """
+        Scores every row of a CSV/Parquet file chunk by chunk with `predict_batch`.
+        Returns the predictions with row counts and throughput;
+        `progress(fraction, message)` is called after each chunk.
+        """
+        start = time.perf_counter()
+        parts = []
+        n_rows = n_imputed = 0
+        for chunk in iter_chunks(filepath, chunksize=chunksize):
+            chunk.index = pd.RangeIndex(n_rows, n_rows + len(chunk))
+            part, imputed = self._score(chunk)
+            parts.append(part)
+            n_rows += len(chunk)
+            n_imputed += imputed
+            if progress:
+                progress(0.0, f"{n_rows:,} rows scored")
+
+        if not parts:
+            raise AnalysisError("The file contains no rows to score.")
+        predictions = pd.concat(parts)
+        seconds = time.perf_counter() - start
+        return {
+            "predictions": predictions,
+            "distribution": predictions["Cluster"].value_counts().sort_index(),
+            "rows": n_rows,
+            "invalid_rows": int(predictions["Cluster"].isna().sum()),
+            "imputed_rows": n_imputed,
+            "seconds": seconds,
+            "rows_per_second": n_rows / seconds if seconds > 0 else float("inf")
+        }
@@ -4,13 +4,15 @@ Dashboard with cluster viz, pie charts, metrics, and interactive forms.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+import numpy as np
 import matplotlib.pyplot as plt
-from sklearn.decomposition import PCA
 
 from src.ui.theme import Theme
 from src.ui.components import StyledCard, PremiumButton, ModernSlider
-from src.ui.charts import create_embedded_chart, setup_chart_style
+from src.ui.table import VirtualTable
+from src.ui.view_cache import ViewCache
+from src.ui.charts import LabelManager, create_embedded_chart, lod_scatter, setup_chart_style
 from src.modules.clustering.engine import ClusteringEngine
 from src.core.context import AppContext
 
@@ -23,7 +25,15 @@ class ClusteringView(tk.Toplevel):
         self.configure(bg=Theme.BG_PRIMARY)
         self.bind('<Escape>', lambda e: self.destroy())
         
-        self.engine = ClusteringEngine(self.context.scaled_data)
+        # The scaled frame and its fingerprint are built by the first job, off the Tk thread
+        self.engine = ClusteringEngine(lambda: self.context.scaled_data, cache=self.context.result_cache,
+                                       registry=self.context.models, scaling=self.context.scaling)
+        self._cluster_busy = False
+        self._pending_k = None
+        self.sweep_results = None
+        self.sweep_error = None
+        self.projection = None
+        self.projection_error = None
         setup_chart_style()
         self._build_ui()
         self._run_analysis()
@@ -45,28 +55,99 @@ class ClusteringView(tk.Toplevel):
         # Content Area
         self.content_container = tk.Frame(self, bg=Theme.BG_PRIMARY)
         self.content_container.pack(fill="both", expand=True, padx=20, pady=20)
+        # Rendered pages are kept and swapped; K-dependent ones are keyed by K
+        self.views = ViewCache(self.content_container)
+
+        self.back_btn = tk.Button(self.header_content, text="⬅️ Back to Menu", 
+                                  font=(Theme.FONT_FAMILY, 10, "bold"),
+                                  bg="#475569", fg=Theme.TEXT_WHITE, bd=0, padx=15, pady=5,
+                                  cursor="hand2", command=self._render_dashboard)
 
         self._render_dashboard()
 
     def _run_analysis(self):
-        try:
-            self.results = self.engine.run_clustering_flow()
-            # No initial view switch here, dashboard is default
-        except Exception as e:
-            messagebox.showerror("ML Error", str(e))
+        # No initial view switch here, dashboard is default
+        self._request_clustering(4)
+        # The viz tab draws only from this job's result and redraws when it lands
+        self.context.scheduler.submit(self._projection, name="projection-2d", owner=self,
+                                      on_success=self._on_projection_done, on_error=self._on_projection_error)
+        # Precompute K=2..10 so the slider and elbow chart need no compute later
+        self.context.scheduler.submit(self.engine.sweep, range(2, 11),
+                                      executor=self.context.scheduler.executor(use_processes=True),
+                                      name="k-sweep", owner=self,
+                                      on_success=self._on_sweep_done, on_error=self._on_sweep_error)
+
+    def _projection(self):
+        return self.context.projections.project_2d(self.engine.data, "zscore",
+                                                   fingerprint=self.engine.fingerprint)
+
+    def _on_projection_done(self, projection):
+        self.projection = projection
+        if self._viz_built():
+            self._update_viz_chart()
+
+    def _on_projection_error(self, error):
+        self.projection_error = str(error)
+        if self._viz_built():
+            self._update_viz_chart()
+
+    def _on_sweep_done(self, sweep_results):
+        self.sweep_results = sweep_results
+        if self._viz_built():
+            self._update_elbow_chart()
+
+    def _on_sweep_error(self, error):
+        self.sweep_error = str(error)
+        if self._viz_built():
+            self._update_elbow_chart()
+
+    def _request_clustering(self, k: int):
+        """Queues a run for K; while one is in flight only the latest K is kept."""
+        if not self._cluster_busy and self.engine.has_clustering(k):
+            # Already fitted for this K: redraw without a round-trip
+            self._pending_k = None
+            self._on_cluster_results(self.engine.run_clustering(k))
+            return
+        self._pending_k = k
+        if not self._cluster_busy:
+            self._submit_clustering()
+
+    def _submit_clustering(self):
+        k, self._pending_k = self._pending_k, None
+        self._cluster_busy = True
+        self.context.scheduler.submit(self.engine.run_clustering, n_clusters=k,
+                                      name=f"clustering-k{k}", owner=self,
+                                      on_success=self._on_cluster_results,
+                                      on_error=self._on_cluster_error)
+
+    def _on_cluster_results(self, results):
+        self._cluster_busy = False
+        if self._pending_k is not None:
+            self._request_clustering(self._pending_k)
+            return
+        self.results = results
+        if self._viz_built():
+            self._update_viz_chart()
+            self._update_elbow_chart()
+
+    def _on_cluster_error(self, error):
+        self._cluster_busy = False
+        self._pending_k = None
+        messagebox.showerror("ML Error", str(error))
+
+    def _viz_built(self) -> bool:
+        # True while the viz page exists, shown or cached, so it never goes stale
+        canvas = getattr(self, 'viz_canvas', None)
+        return canvas is not None and bool(canvas.get_tk_widget().winfo_exists())
 
     def _render_dashboard(self):
-        # Clear current content
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
-        
-        # Reset header
-        for widget in self.header_content.winfo_children():
-            if getattr(widget, 'is_back_btn', False): widget.destroy()
+        self.back_btn.pack_forget()
         self.title_label.config(text="AI CLUSTERING & FORECASTING") # Reset title if it was changed
+        self.views.show("dashboard", self._build_dashboard)
 
+    def _build_dashboard(self, parent):
         # Dashboard Grid Area
-        dashboard = tk.Frame(self.content_container, bg=Theme.BG_PRIMARY)
+        dashboard = tk.Frame(parent, bg=Theme.BG_PRIMARY)
         dashboard.pack(expand=True)
 
         menu_items = [
@@ -85,22 +166,11 @@ class ClusteringView(tk.Toplevel):
             btn.grid(row=r, column=c, padx=20, pady=20)
 
     def _switch_view(self, view_id):
-        # Clear current content
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
-
-        # Add Back Button to Header
-        # Remove existing back button if any
-        for widget in self.header_content.winfo_children():
-            if getattr(widget, 'is_back_btn', False):
-                widget.destroy()
-
-        back_btn = tk.Button(self.header_content, text="⬅️ Back to Menu", 
-                             font=(Theme.FONT_FAMILY, 10, "bold"),
-                             bg="#475569", fg=Theme.TEXT_WHITE, bd=0, padx=15, pady=5,
-                             cursor="hand2", command=self._render_dashboard)
-        back_btn.is_back_btn = True # Custom attribute to identify the back button
-        back_btn.pack(side="right", padx=20)
+        if not hasattr(self, 'results'):
+            messagebox.showinfo("Note", "The model is still training, please wait.")
+            return
+
+        self.back_btn.pack(side="right", padx=20)
 
         # Update title based on view
         view_titles = {
@@ -111,17 +181,44 @@ class ClusteringView(tk.Toplevel):
         }
         self.title_label.config(text=view_titles.get(view_id, "AI CLUSTERING & FORECASTING"))
 
+        k = self.results['n_clusters']
         if view_id == "viz":
-            self._render_viz()
+            # Redraws itself in place when K changes
+            self.views.show("viz", self._render_viz)
         elif view_id == "dist":
-            self._render_dist()
-        elif view_id == "perf":
-            self._render_perf()
-        elif view_id == "pred":
-            self._render_pred()
-
-    def _render_viz(self):
-        card = StyledCard(self.content_container, "Cluster Visualization (PCA)", "🎨")
+            self.views.show("dist", self._render_dist, token=k)
+        elif view_id in ("perf", "pred"):
+            if self.engine.has_classifier(k):
+                # A cached page still needs the engine's forest switched back to this K
+                self.model = self.engine.train_classifier(k)
+            render = self._render_perf if view_id == "perf" else self._render_pred
+            self.views.show(view_id, lambda parent: self._with_classifier(parent, render), token=k)
+
+    def _with_classifier(self, parent, render):
+        """Trains the forest for the current K on first use, then renders."""
+        k = self.results['n_clusters']
+        if self.engine.has_classifier(k):
+            self.model = self.engine.train_classifier(k)
+            render(parent)
+            return
+
+        placeholder = tk.Label(parent, text=f"⏳ Training Random Forest for K={k}…",
+                               font=(Theme.FONT_FAMILY, 12, "italic"), bg=Theme.BG_PRIMARY,
+                               fg=Theme.TEXT_SECONDARY)
+        placeholder.pack(expand=True)
+
+        def _on_ready(model):
+            self.model = model
+            if placeholder.winfo_exists():
+                placeholder.destroy()
+                render(parent)
+
+        self.context.scheduler.submit(self.engine.train_classifier, k, name=f"forest-k{k}", owner=self,
+                                      on_success=_on_ready,
+                                      on_error=lambda e: messagebox.showerror("ML Error", str(e)))
+
+    def _render_viz(self, parent):
+        card = StyledCard(parent, "Cluster Visualization (PCA)", "🎨")
         card.pack(fill="both", expand=True)
 
         # Control Panel for Slider
@@ -136,34 +233,78 @@ class ClusteringView(tk.Toplevel):
                                           callback=self._on_slider_change)
         self.cluster_slider.pack(side="left", fill="x", expand=True)
 
-        # Plot Area
-        self.viz_fig, self.viz_ax, self.viz_canvas = create_embedded_chart(card.content)
+        # Plot Area: projection on the left, K sweep metrics on the right
+        body = tk.Frame(card.content, bg=Theme.BG_CARD)
+        body.pack(fill="both", expand=True)
+        elbow_frame = tk.Frame(body, bg=Theme.BG_CARD, width=380)
+        elbow_frame.pack(side="right", fill="y", padx=(10, 0))
+        elbow_frame.pack_propagate(False)
+        plot_frame = tk.Frame(body, bg=Theme.BG_CARD)
+        plot_frame.pack(side="left", fill="both", expand=True)
+
+        self.elbow_fig, self.elbow_ax, self.elbow_canvas = create_embedded_chart(elbow_frame, figsize=(4, 4))
+        self.viz_fig, self.viz_ax, self.viz_canvas = create_embedded_chart(plot_frame)
         self._update_viz_chart()
+        self._update_elbow_chart()
+
+    def _update_elbow_chart(self):
+        fig, ax = self.elbow_fig, self.elbow_ax
+        for extra in fig.axes[1:]:
+            extra.remove()
+        ax.clear()
+        sweep = self.sweep_results
+        if sweep is None:
+            message = f"K sweep failed:\n{self.sweep_error}" if self.sweep_error else "⏳ Computing K sweep…"
+            ax.text(0.5, 0.5, message, ha='center', va='center', transform=ax.transAxes,
+                    fontsize=9, color=Theme.TEXT_SECONDARY, wrap=True)
+            ax.set_xticks([]); ax.set_yticks([])
+            self.elbow_canvas.draw()
+            return
+
+        ks = sweep.index.to_numpy()
+        ax.plot(ks, sweep['inertia'], marker='o', color=Theme.SUCCESS, lw=2, label="Inertia")
+        ax.set_xlabel("K", fontsize=9)
+        ax.set_ylabel("Inertia (elbow)", fontsize=9, color=Theme.SUCCESS)
+        ax.tick_params(labelsize=8)
+
+        ax2 = ax.twinx()
+        ax2.plot(ks, sweep['silhouette'], marker='s', color=Theme.PRIMARY, lw=1.5, label="Silhouette")
+        ax2.set_ylabel("Silhouette", fontsize=9, color=Theme.PRIMARY)
+        ax2.tick_params(labelsize=8)
+
+        k = self.results['n_clusters']
+        if k in sweep.index:
+            ax.axvline(k, color=Theme.AFC_PINK, linestyle='--', alpha=0.8)
+            ax.set_title(f"K={k}  •  DB index {sweep.loc[k, 'davies_bouldin']:.2f}", fontsize=9, fontweight='bold')
+        self.elbow_fig.tight_layout()
+        self.elbow_canvas.draw()
 
     def _on_slider_change(self, val):
-        try:
-            k = int(val)
-            # Re-run analysis with new K
-            self.results = self.engine.run_clustering_flow(n_clusters=k)
-            self._update_viz_chart()
-        except Exception as e:
-            print(f"Slider update error: {e}")
+        # Re-run analysis with new K in the background
+        self._request_clustering(int(val))
 
     def _update_viz_chart(self):
         self.viz_ax.clear()
         r = self.results
-        pca = PCA(n_components=2)
-        X_pca = pca.fit_transform(self.context.scaled_data)
+        X_pca = self.projection
+        if X_pca is None:
+            message = (f"Projection failed:\n{self.projection_error}" if self.projection_error
+                       else "⏳ Computing 2-D projection…")
+            self.viz_ax.text(0.5, 0.5, message, ha='center', va='center', transform=self.viz_ax.transAxes,
+                             fontsize=10, color=Theme.TEXT_SECONDARY, wrap=True)
+            self.viz_ax.set_xticks([]); self.viz_ax.set_yticks([])
+            self.viz_canvas.draw()
+            return
         
         # Extended color palette for more clusters
         colors = ['#10b981', '#3b82f6', '#f59e0b', '#ef4444', '#8b5cf6', '#ec4899', '#06b6d4', '#f97316', '#84cc16', '#a855f7']
         k_colors = colors[:r['n_clusters']]
         
-        self.viz_ax.scatter(X_pca[:, 0], X_pca[:, 1], c=[k_colors[c] for c in r['labels']], s=70, edgecolor='white', alpha=0.8)
+        lod_scatter(self.viz_ax, X_pca[:, 0], X_pca[:, 1], np.asarray(k_colors)[r['labels'].to_numpy()],
+                    s=70, edgecolor='white', alpha=0.8)
         
-        labels = self.context.get_individual_labels()
-        for i, txt in enumerate(labels):
-            self.viz_ax.annotate(txt, (X_pca[i, 0], X_pca[i, 1]), fontsize=7, alpha=0.7, xytext=(4, 4), textcoords='offset points')
+        LabelManager(self.viz_ax, X_pca[:, 0], X_pca[:, 1], self.context.get_individual_labels(),
+                     offset=(4, 4), style={'fontsize': 7, 'alpha': 0.7})
 
         for i, color in enumerate(k_colors):
             self.viz_ax.scatter([],[], c=color, label=f"Cluster {i}")
@@ -172,8 +313,8 @@ class ClusteringView(tk.Toplevel):
         self.viz_ax.set_title(f"Clustering with K={r['n_clusters']}", fontsize=10, fontweight='bold')
         self.viz_canvas.draw()
 
-    def _render_dist(self):
-        card = StyledCard(self.content_container, "Cluster Distribution", "📊")
+    def _render_dist(self, parent):
+        card = StyledCard(parent, "Cluster Distribution", "📊")
         card.pack(fill="both", expand=True)
         fig, ax, canvas = create_embedded_chart(card.content)
         dist = self.results['distribution']
@@ -181,16 +322,16 @@ class ClusteringView(tk.Toplevel):
         ax.pie(dist, labels=[f'Cluster {i}' for i in dist.index], autopct='%1.1f%%', colors=colors, startangle=90, wedgeprops={'edgecolor':'white'})
         canvas.draw()
 
-    def _render_perf(self):
-        card = StyledCard(self.content_container, "Model Performance", "📈")
+    def _render_perf(self, parent):
+        card = StyledCard(parent, "Model Performance", "📈")
         card.pack(fill="both", expand=True)
-        txt = tk.Text(card.content, bg="#f0fdf4", font=(Theme.FONT_MONO, 10), relief="flat", padx=15, pady=10)
-        txt.insert("1.0", f"Accuracy: {self.results['accuracy']*100:.2f}%\n\nREPORT:\n{self.results['report']}")
-        txt.config(state="disabled")
-        txt.pack(fill="both", expand=True)
+        tk.Label(card.content, text=f"Accuracy: {self.model['accuracy']*100:.2f}%", font=(Theme.FONT_MONO, 11, "bold"),
+                 bg=Theme.BG_CARD, fg=Theme.TEXT_PRIMARY).pack(anchor="w", padx=15, pady=(10, 0))
+        VirtualTable(card.content, self.model['report_table'], bg="#f0fdf4", stripe="#dcfce7", precision=2,
+                     font_size=10).pack(fill="both", expand=True, padx=15, pady=10)
 
-    def _render_pred(self):
-        card = StyledCard(self.content_container, "Predict New Individual", "🔮")
+    def _render_pred(self, parent):
+        card = StyledCard(parent, "Predict New Individual", "🔮")
         card.pack(fill="both", expand=True)
         
         # Scrollable Area
@@ -237,6 +378,14 @@ class ClusteringView(tk.Toplevel):
                   bg=Theme.BG_PRIMARY, fg=Theme.TEXT_PRIMARY, font=(Theme.FONT_FAMILY, 11, "bold"),
                   relief="flat", pady=10, width=5).pack(side="left")
 
+        # Batch scoring from a file
+        tk.Button(form, text="📂  Score a CSV / Parquet File", command=self._on_predict_file,
+                  bg=Theme.PRIMARY, fg=Theme.TEXT_WHITE, font=(Theme.FONT_FAMILY, 11, "bold"),
+                  relief="flat", pady=10).pack(fill="x", pady=(0, 10))
+        self.batch_text = tk.Label(form, text="", font=(Theme.FONT_MONO, 10), bg=Theme.BG_CARD,
+                                   fg=Theme.TEXT_PRIMARY, justify="left", anchor="w")
+        self.batch_text.pack(fill="x", pady=(0, 15))
+
         # Result Container
         self.res_card = tk.Frame(form, bg=Theme.BG_CARD, highlightthickness=0)
         self.res_card.pack(fill="x", pady=(0, 20))
@@ -274,3 +423,41 @@ class ClusteringView(tk.Toplevel):
             
         except ValueError:
             messagebox.showerror("Error", "Please enter valid numeric values for all fields.")
+
+    def _on_predict_file(self):
+        file_path = filedialog.askopenfilename(filetypes=[("Tabular files", "*.csv *.parquet *.pq")])
+        if not file_path: return
+
+        self.batch_text.config(text="⏳ Scoring file…", fg=Theme.TEXT_MUTED)
+        self.context.scheduler.submit(self._score_file, file_path, name="predict-file", owner=self,
+                                      pass_job=True,
+                                      on_progress=lambda f, msg: self._set_batch_text(f"⏳ {msg}", Theme.TEXT_MUTED),
+                                      on_success=self._on_file_scored,
+                                      on_error=self._on_file_error)
+
+    def _score_file(self, file_path, job):
+        return self.engine.predict_file(file_path, progress=job.report)
+
+    def _on_file_scored(self, scored):
+        lines = [f"{scored['rows']:,} rows in {scored['seconds']:.2f}s "
+                 f"({scored['rows_per_second']:,.0f} rows/s)"]
+        lines += [f"  Cluster {k}: {n:,}" for k, n in scored["distribution"].items()]
+        if scored["imputed_rows"]:
+            lines.append(f"  {scored['imputed_rows']:,} rows had missing values (mean-imputed)")
+        if scored["invalid_rows"]:
+            lines.append(f"  {scored['invalid_rows']:,} rows had no usable values (not scored)")
+        self._set_batch_text("\n".join(lines), Theme.TEXT_PRIMARY)
+
+        out_path = filedialog.asksaveasfilename(title="Save predictions", defaultextension=".csv",
+                                                filetypes=[("CSV files", "*.csv")])
+        if out_path:
+            scored["predictions"].to_csv(out_path, index_label="Row")
+
+    def _on_file_error(self, error):
+        self._set_batch_text("", Theme.TEXT_PRIMARY)
+        messagebox.showerror("Prediction Error", str(error))
+
+    def _set_batch_text(self, text, color):
+        # The Predict tab may have been left while the file was scoring
+        if self.batch_text.winfo_exists():
+            self.batch_text.config(text=text, fg=color)
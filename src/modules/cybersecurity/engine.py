@@ -7,37 +7,55 @@ import pandas as pd
 import numpy as np
 from sklearn.ensemble import IsolationForest
 from sklearn.neighbors import LocalOutlierFactor
-from sklearn.decomposition import PCA
-from sklearn.preprocessing import MinMaxScaler
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from src.core.exceptions import AnalysisError
+from src.core.profiling import span
+from src.data.cache import frame_fingerprint
+from src.data.scaling import ScaledView, ScalingParams
+from src.modules.cybersecurity.neighbors import knn_graph, lof_from_knn, resolve_neighbor_backend
+from src.services.projection import ProjectionService
+from src.services.registry import ModelRegistry
 
 class SecurityEngine:
-    def __init__(self, data: pd.DataFrame, contamination: float = 0.1):
+    def __init__(self, data: pd.DataFrame, contamination: float = 0.1,
+                 scaled: Optional[pd.DataFrame] = None, projector: Optional[ProjectionService] = None,
+                 neighbors: str = "auto", n_jobs: Optional[int] = -1,
+                 registry: Optional[ModelRegistry] = None, random_state: int = 42):
         if data is None or data.empty:
             raise AnalysisError("No data provided for security scan.")
         self.data = data
         self.contamination = contamination
+        # Optional precomputed MinMax view (e.g. AppContext.scaled_view("minmax"))
+        self.scaled = scaled
+        self.projector = projector or ProjectionService()
+        # LOF neighbor search: 'sklearn', 'tree', 'brute', 'approximate' or 'auto'
+        self.neighbors = resolve_neighbor_backend(neighbors, len(data), data.shape[1])
+        self.n_jobs = n_jobs
+        # Saves the fitted Isolation Forest so later sessions skip training
+        self.registry = registry
+        self.random_state = random_state
+        self.iso: Optional[IsolationForest] = None
 
     def run_scan(self) -> Dict[str, Any]:
         """Runs security algorithms and finds consensus high-risk IDs."""
         try:
-            # Normalization using MinMaxScaler as per Cyber.pdf
-            scaler = MinMaxScaler()
-            X_scaled = scaler.fit_transform(self.data)
-            df_scaled = pd.DataFrame(X_scaled, columns=self.data.columns, index=self.data.index)
+            # Normalization using MinMax scaling as per Cyber.pdf
+            df_scaled = self.scaled
+            if df_scaled is None:
+                df_scaled = ScaledView(self.data, ScalingParams.fit(self.data), "minmax").frame()
 
             # Isolation Forest
-            iso = IsolationForest(contamination=self.contamination, random_state=42)
-            y_iso = iso.fit_predict(df_scaled)
+            with span("security.isolation_forest", rows=len(df_scaled)):
+                forest = self._isolation_forest(df_scaled)
+            self.iso = forest["model"]
+            y_iso = forest["labels"]
             
             # LOF
-            lof = LocalOutlierFactor(n_neighbors=min(20, len(df_scaled)-1), contamination=self.contamination)
-            y_lof = lof.fit_predict(df_scaled)
+            with span("security.lof", rows=len(df_scaled), backend=self.neighbors):
+                y_lof = self._run_lof(df_scaled)
             
-            # Contextual PCA for viz
-            pca = PCA(n_components=2)
-            X_pca = pca.fit_transform(df_scaled)
+            # Contextual PCA for viz (shared with other views via the projection service)
+            X_pca = self.projector.project_2d(df_scaled, scaling="minmax")
             
             # Consensus: flagged by both
             high_risk_idx = np.where((y_iso == -1) & (y_lof == -1))[0]
@@ -53,8 +71,28 @@ class SecurityEngine:
                 "high_risk_ids": high_risk_labels,
                 "iso_count": int((y_iso == -1).sum()),
                 "lof_count": int((y_lof == -1).sum()),
+                "lof_backend": self.neighbors,
                 "risk_count": len(high_risk_idx),
                 "labels": labels
             }
         except Exception as e:
             raise AnalysisError(f"Security scan failed: {str(e)}")
+
+    def _isolation_forest(self, df_scaled: pd.DataFrame) -> Dict[str, Any]:
+        def fit():
+            iso = IsolationForest(contamination=self.contamination, random_state=self.random_state)
+            return {"model": iso, "labels": iso.fit_predict(df_scaled)}
+
+        if self.registry is None:
+            return fit()
+        params = {"contamination": self.contamination, "random_state": self.random_state,
+                  "scaled": self.scaled is not None}
+        return self.registry.load_or_fit("isolation-forest", frame_fingerprint(df_scaled), params, fit)
+
+    def _run_lof(self, df_scaled: pd.DataFrame) -> np.ndarray:
+        n_neighbors = min(20, len(df_scaled)-1)
+        if self.neighbors == "sklearn":
+            lof = LocalOutlierFactor(n_neighbors=n_neighbors, contamination=self.contamination, n_jobs=self.n_jobs)
+            return lof.fit_predict(df_scaled)
+        distances, indices = knn_graph(df_scaled.to_numpy(), n_neighbors, self.neighbors, n_jobs=self.n_jobs)
+        return lof_from_knn(distances, indices, self.contamination)["labels"]
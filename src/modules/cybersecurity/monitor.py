@@ -0,0 +1,221 @@
+"""
+DataScope Live Monitor
+Fit-once anomaly models scored against records appended to a CSV, with background refits.
+"""
+
+import io
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from typing import Deque, List, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import IsolationForest
+from sklearn.neighbors import LocalOutlierFactor
+
+from src.core.exceptions import AnalysisError, DataLoadError
+from src.core.profiling import span
+from src.data.scaling import ScalingParams
+
+DEFAULT_WINDOW_ROWS = 5_000
+DEFAULT_BATCH_ROWS = 1_024
+DEFAULT_REFRESH_SECONDS = 300.0
+
+class CSVTailer:
+    """
+    Reads rows appended to a CSV since the last call. Only complete lines
+    are consumed; a truncated or rotated file is re-read from its header.
+    """
+
+    def __init__(self, path: str) -> None:
+        if not os.path.exists(path):
+            raise DataLoadError(f"File not found: {path}")
+        self.path = path
+        self.header: Optional[str] = None
+        self.offset = 0
+
+    def read_all(self) -> pd.DataFrame:
+        """Every row currently in the file; later reads return only new rows."""
+        self.header, self.offset = None, 0
+        return self.read_new()
+
+    def read_new(self) -> pd.DataFrame:
+        size = os.path.getsize(self.path)
+        if size < self.offset:
+            self.header, self.offset = None, 0
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            chunk = f.read(max(size - self.offset, 0))
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return pd.DataFrame()
+        chunk = chunk[:end + 1]
+        self.offset += len(chunk)
+
+        text = chunk.decode("utf-8", errors="replace")
+        if self.header is None:
+            header, _, text = text.partition("\n")
+            self.header = header.rstrip("\r")
+        if not text.strip():
+            return pd.DataFrame()
+        return pd.read_csv(io.StringIO(self.header + "\n" + text))
+
+@dataclass
+class ReferenceModel:
+    """IsolationForest + LOF (novelty mode) fitted on one reference window."""
+    columns: List[str]
+    fill: np.ndarray
+    scaling: ScalingParams
+    iso: IsolationForest
+    lof: LocalOutlierFactor
+    n_reference: int
+    fitted_at: float
+    fit_seconds: float
+
+    @classmethod
+    def fit(cls, window: pd.DataFrame, contamination: float = 0.1, n_neighbors: int = 20,
+            random_state: int = 42) -> "ReferenceModel":
+        start = time.perf_counter()
+        numeric = window.select_dtypes(include=[np.number])
+        if numeric.shape[1] == 0 or len(numeric) < 3:
+            raise AnalysisError("The reference window needs numeric columns and at least 3 rows.")
+        with span("monitor.fit", rows=len(numeric)):
+            # An all-NaN column has no mean; it becomes a constant 0 feature
+            fill = np.nan_to_num(numeric.mean().to_numpy(dtype=np.float64), nan=0.0)
+            numeric = numeric.fillna(pd.Series(fill, index=numeric.columns))
+            scaling = ScalingParams.fit(numeric)
+            X = _minmax(numeric.to_numpy(dtype=np.float64), scaling)
+            iso = IsolationForest(contamination=contamination, random_state=random_state).fit(X)
+            lof = LocalOutlierFactor(n_neighbors=min(n_neighbors, len(X) - 1), contamination=contamination,
+                                     novelty=True).fit(X)
+        return cls(columns=[str(c) for c in numeric.columns], fill=fill, scaling=scaling, iso=iso, lof=lof,
+                   n_reference=len(X), fitted_at=time.time(), fit_seconds=time.perf_counter() - start)
+
+    def score(self, batch: pd.DataFrame) -> pd.DataFrame:
+        """Scores new records; negative decision values are anomalies (as in `predict`)."""
+        missing = [c for c in self.columns if c not in batch.columns]
+        if missing:
+            raise DataLoadError(f"Incoming records lack columns: {', '.join(missing)}")
+        frame = batch[self.columns]
+        if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in frame.dtypes):
+            frame = frame.apply(pd.to_numeric, errors="coerce")
+        values = frame.to_numpy(dtype=np.float64, copy=True)
+        nan_mask = np.isnan(values)
+        if nan_mask.any():
+            values[nan_mask] = np.take(self.fill, np.nonzero(nan_mask)[1])
+        X = _minmax(values, self.scaling)
+        iso_score = self.iso.decision_function(X)
+        lof_score = self.lof.decision_function(X)
+        return pd.DataFrame({
+            "iso_score": iso_score,
+            "lof_score": lof_score,
+            "iso_flag": iso_score < 0,
+            "lof_flag": lof_score < 0,
+            "high_risk": (iso_score < 0) & (lof_score < 0)
+        }, index=batch.index)
+
+def _minmax(values: np.ndarray, scaling: ScalingParams) -> np.ndarray:
+    shift, divisor = scaling.offsets("minmax")
+    return (values - shift) / divisor
+
+class StreamMonitor:
+    """
+    Scores records appended to a CSV in micro-batches against a reference
+    model. The reference window rolls forward with the stream, and a new
+    model is fitted on it in the background every `refresh_seconds`; the
+    swap happens on the next `poll()` once the fit is done.
+    """
+
+    def __init__(self, path: str, contamination: float = 0.1, window_rows: int = DEFAULT_WINDOW_ROWS,
+                 batch_rows: int = DEFAULT_BATCH_ROWS, refresh_seconds: float = DEFAULT_REFRESH_SECONDS,
+                 executor: Optional[Executor] = None) -> None:
+        self.tailer = CSVTailer(path)
+        self.contamination = contamination
+        self.window_rows = window_rows
+        self.batch_rows = max(1, batch_rows)
+        self.refresh_seconds = refresh_seconds
+        self.executor = executor
+        self.model: Optional[ReferenceModel] = None
+        self.rows_scored = 0
+        self.flag_counts = {"iso_flag": 0, "lof_flag": 0, "high_risk": 0}
+        self.last_batch_ms: Optional[float] = None
+        self._window: Deque[pd.DataFrame] = deque()
+        self._window_len = 0
+        self._pending: Optional[Future] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> ReferenceModel:
+        """Fits the first model on the last `window_rows` rows already in the file."""
+        existing = self.tailer.read_all()
+        if existing.empty:
+            raise DataLoadError("The monitored file has no records to build a reference window from.")
+        self._push_window(existing)
+        self.model = ReferenceModel.fit(self._snapshot(), self.contamination)
+        return self.model
+
+    def poll(self) -> pd.DataFrame:
+        """Scores every complete row appended since the last poll (empty frame when idle)."""
+        if self.model is None:
+            raise AnalysisError("Monitor not started.")
+        self._collect_refresh()
+        batch = self.tailer.read_new()
+        if batch.empty:
+            self._schedule_refresh()
+            return pd.DataFrame()
+
+        model = self.model
+        scored = []
+        for start in range(0, len(batch), self.batch_rows):
+            part = batch.iloc[start:start + self.batch_rows]
+            t0 = time.perf_counter()
+            with span("monitor.score", rows=len(part)):
+                scores = model.score(part)
+            self.last_batch_ms = (time.perf_counter() - t0) * 1000.0
+            scored.append(pd.concat([part, scores], axis=1))
+        result = pd.concat(scored)
+        result.index = range(self.rows_scored + 1, self.rows_scored + len(result) + 1)
+
+        self.rows_scored += len(result)
+        for key in self.flag_counts:
+            self.flag_counts[key] += int(result[key].sum())
+        self._push_window(batch)
+        self._schedule_refresh()
+        return result
+
+    @property
+    def refreshing(self) -> bool:
+        return self._pending is not None
+
+    def model_age(self) -> float:
+        return time.time() - self.model.fitted_at if self.model else 0.0
+
+    def _push_window(self, rows: pd.DataFrame) -> None:
+        with self._lock:
+            self._window.append(rows)
+            self._window_len += len(rows)
+            while self._window and self._window_len - len(self._window[0]) >= self.window_rows:
+                self._window_len -= len(self._window.popleft())
+
+    def _snapshot(self) -> pd.DataFrame:
+        with self._lock:
+            frame = pd.concat(list(self._window), ignore_index=True)
+        return frame.tail(self.window_rows)
+
+    def _schedule_refresh(self) -> None:
+        if self.executor is None or self._pending is not None or self.model_age() < self.refresh_seconds:
+            return
+        self._pending = self.executor.submit(ReferenceModel.fit, self._snapshot(), self.contamination)
+
+    def _collect_refresh(self) -> None:
+        if self._pending is None or not self._pending.done():
+            return
+        future, self._pending = self._pending, None
+        try:
+            self.model = future.result()
+        except Exception:
+            # Keep scoring with the previous model; the next schedule retries
+            self.model.fitted_at = time.time()
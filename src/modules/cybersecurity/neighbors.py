@@ -0,0 +1,142 @@
+"""
+DataScope Neighbor Search
+k-nearest-neighbor backends for LOF: KD/ball tree, chunked brute force and an approximate index.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from sklearn import config_context
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.neighbors import NearestNeighbors
+
+from src.core.exceptions import AnalysisError
+from src.core.profiling import span
+
+NEIGHBOR_BACKENDS = ("auto", "sklearn", "tree", "brute", "approximate")
+SKLEARN_MAX_ROWS = 50_000
+TREE_MAX_FEATURES = 15
+DEFAULT_WORKING_MEMORY_MB = 64
+QUANTIZER_SAMPLE = 50_000
+
+def resolve_neighbor_backend(backend: str, n_rows: int, n_features: int) -> str:
+    """'auto' keeps sklearn's LOF on small data, then a tree for low dimensions and chunked brute force beyond."""
+    if backend not in NEIGHBOR_BACKENDS:
+        raise AnalysisError(f"Unknown neighbor backend: {backend}")
+    if backend != "auto":
+        return backend
+    if n_rows <= SKLEARN_MAX_ROWS:
+        return "sklearn"
+    return "tree" if n_features <= TREE_MAX_FEATURES else "brute"
+
+def _workers(n_jobs: Optional[int]) -> int:
+    if n_jobs is None or n_jobs < 1:
+        return os.cpu_count() or 1
+    return n_jobs
+
+def _parallel(fn, items, n_jobs: Optional[int]) -> None:
+    """Runs `fn(item)` on a thread pool; BLAS and argpartition release the GIL."""
+    workers = min(_workers(n_jobs), len(items))
+    if workers <= 1:
+        for item in items:
+            fn(item)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(fn, item) for item in items]:
+            future.result()
+
+def _tree_knn(X: np.ndarray, k: int, n_jobs: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
+    algorithm = "kd_tree" if X.shape[1] <= TREE_MAX_FEATURES else "ball_tree"
+    nn = NearestNeighbors(n_neighbors=k, algorithm=algorithm, n_jobs=n_jobs).fit(X)
+    return nn.kneighbors()
+
+def _brute_knn(X: np.ndarray, k: int, n_jobs: Optional[int],
+               working_memory_mb: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Exact kNN over pairwise-distance chunks bounded by `working_memory_mb`."""
+    with config_context(working_memory=working_memory_mb):
+        nn = NearestNeighbors(n_neighbors=k, algorithm="brute", n_jobs=n_jobs).fit(X)
+        return nn.kneighbors()
+
+def _approximate_knn(X: np.ndarray, k: int, n_jobs: Optional[int], working_memory_mb: float,
+                     n_cells: Optional[int] = None, n_probe: int = 16,
+                     random_state: int = 42) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Inverted-file index: MiniBatchKMeans splits the rows into ~sqrt(n)
+    cells, and the rows of each cell are matched exactly against the rows
+    of its `n_probe` nearest cells. Neighbors beyond those cells are missed.
+    """
+    n = len(X)
+    n_cells = n_cells or max(1, int(np.sqrt(n)))
+    if n_cells <= n_probe:
+        return _brute_knn(X, k, n_jobs, working_memory_mb)
+    sample = X if n <= QUANTIZER_SAMPLE else X[np.random.default_rng(random_state).choice(
+        n, QUANTIZER_SAMPLE, replace=False)]
+    quantizer = MiniBatchKMeans(n_clusters=n_cells, n_init=1, random_state=random_state,
+                                batch_size=4096).fit(sample)
+    cells = quantizer.predict(X)
+    order = np.argsort(cells, kind="stable")
+    bounds = np.searchsorted(cells[order], np.arange(n_cells + 1))
+    centers = quantizer.cluster_centers_
+    center_d2 = ((centers[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+    probes = np.argsort(center_d2, axis=1)[:, :n_probe]
+    sq_norms = np.einsum("ij,ij->i", X, X)
+    distances = np.empty((n, k))
+    indices = np.empty((n, k), dtype=np.intp)
+    max_cells = working_memory_mb * 2**20 / (8 * _workers(n_jobs))
+
+    def search(cell: int) -> None:
+        members = order[bounds[cell]:bounds[cell + 1]]
+        if len(members) == 0:
+            return
+        pool = np.concatenate([order[bounds[c]:bounds[c + 1]] for c in probes[cell]])
+        chunk = int(max(1, max_cells // max(len(pool), 1)))
+        for start in range(0, len(members), chunk):
+            rows = members[start:start + chunk]
+            d2 = X[rows] @ X[pool].T
+            d2 *= -2.0
+            d2 += sq_norms[pool][None, :]
+            d2[rows[:, None] == pool[None, :]] = np.inf  # exclude self
+            kk = min(k, len(pool) - 1)
+            part = np.argpartition(d2, kk - 1, axis=1)[:, :kk]
+            part_d2 = np.take_along_axis(d2, part, axis=1) + sq_norms[rows][:, None]
+            ranked = np.argsort(part_d2, axis=1, kind="stable")
+            found = np.take_along_axis(part, ranked, axis=1)
+            found_d2 = np.take_along_axis(part_d2, ranked, axis=1)
+            if kk < k:
+                # Tiny neighborhoods: pad with the farthest neighbor found
+                found = np.pad(found, ((0, 0), (0, k - kk)), mode="edge")
+                found_d2 = np.pad(found_d2, ((0, 0), (0, k - kk)), mode="edge")
+            indices[rows] = pool[found]
+            distances[rows] = np.sqrt(np.maximum(found_d2, 0.0))
+
+    _parallel(search, range(n_cells), n_jobs)
+    return distances, indices
+
+def knn_graph(X: np.ndarray, k: int, backend: str = "tree", n_jobs: Optional[int] = -1,
+              working_memory_mb: float = DEFAULT_WORKING_MEMORY_MB, **approx) -> Tuple[np.ndarray, np.ndarray]:
+    """(distances, indices) of the `k` nearest other samples of every row, nearest first."""
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    with span("security.knn", backend=backend, rows=len(X), k=k):
+        if backend == "tree":
+            return _tree_knn(X, k, n_jobs)
+        if backend == "brute":
+            return _brute_knn(X, k, n_jobs, working_memory_mb)
+        if backend == "approximate":
+            return _approximate_knn(X, k, n_jobs, working_memory_mb, **approx)
+    raise AnalysisError(f"Unsupported kNN backend: {backend}")
+
+def lof_from_knn(distances: np.ndarray, indices: np.ndarray, contamination: float) -> Dict[str, np.ndarray]:
+    """
+    Local Outlier Factor from a kNN graph, with sklearn's conventions:
+    the 1e-10 density guard and the contamination percentile as offset.
+    """
+    k_distance = distances[:, -1]
+    reach = np.maximum(distances, k_distance[indices])
+    lrd = 1.0 / (reach.mean(axis=1) + 1e-10)
+    negative_outlier_factor = -(lrd[indices] / lrd[:, None]).mean(axis=1)
+    offset = np.percentile(negative_outlier_factor, 100.0 * contamination)
+    labels = np.ones(len(distances), dtype=int)
+    labels[negative_outlier_factor < offset] = -1
+    return {"labels": labels, "negative_outlier_factor": negative_outlier_factor, "offset": offset}
@@ -1,11 +1,17 @@
 import tkinter as tk
 from tkinter import messagebox, filedialog
+import numpy as np
 from src.ui.theme import Theme
 from src.ui.components import StyledCard, PremiumButton
-from src.ui.charts import create_embedded_chart, setup_chart_style
+from src.ui.view_cache import ViewCache
+from src.ui.charts import LabelManager, create_embedded_chart, lod_scatter, setup_chart_style
 from src.modules.cybersecurity.engine import SecurityEngine
+from src.modules.cybersecurity.monitor import StreamMonitor
 from src.core.context import AppContext
-from src.data.loaders import load_excel_dataset
+from src.data.loaders import load_raw_dataset
+
+LIVE_POLL_MS = 1000
+LIVE_LOG_LINES = 500
 
 class SecurityView(tk.Toplevel):
     def __init__(self, parent, context: AppContext):
@@ -15,6 +21,11 @@ class SecurityView(tk.Toplevel):
         self.state("zoomed")
         self.configure(bg=Theme.BG_PRIMARY)
         self.bind('<Escape>', lambda e: self.destroy())
+        self.monitor = None
+        self._live_after = None
+        self._live_busy = False
+        # Bumped whenever the live page is left, so late callbacks for it are dropped
+        self._live_session = 0
         
         setup_chart_style()
         self._build_ui()
@@ -36,21 +47,25 @@ class SecurityView(tk.Toplevel):
         # Content Area
         self.content_container = tk.Frame(self, bg=Theme.BG_PRIMARY)
         self.content_container.pack(fill="both", expand=True, padx=20, pady=20)
+        # Rendered pages are kept and swapped; a new scan invalidates them
+        self.views = ViewCache(self.content_container)
+
+        self.back_btn = tk.Button(self.header_content, text="⬅️ Back to Menu", 
+                                  font=(Theme.FONT_FAMILY, 10, "bold"),
+                                  bg="#475569", fg=Theme.TEXT_WHITE, bd=0, padx=15, pady=5,
+                                  cursor="hand2", command=self._render_dashboard)
 
         self._render_dashboard()
 
     def _render_dashboard(self):
-        # Clear current content
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
-        
-        # Reset header (remove back button)
-        for widget in self.header_content.winfo_children():
-            if getattr(widget, 'is_back_btn', False): widget.destroy()
+        self._stop_live()
+        self.back_btn.pack_forget()
         self.title_label.config(text="CYBERSECURITY ANALYSIS")
+        self.views.show("dashboard", self._build_dashboard)
 
+    def _build_dashboard(self, parent):
         # Dashboard Area
-        dashboard = tk.Frame(self.content_container, bg=Theme.BG_PRIMARY)
+        dashboard = tk.Frame(parent, bg=Theme.BG_PRIMARY)
         dashboard.pack(expand=True)
 
         # 1. Dataset Initialization Section
@@ -93,87 +108,94 @@ class SecurityView(tk.Toplevel):
                                 disabled=is_disabled)
             btn.grid(row=r, column=c, padx=20, pady=20)
 
+        PremiumButton(btn_frame, text="📡 Live Monitoring", command=lambda: self._switch_view("live"),
+                      bg_color=Theme.PRIMARY, hover_color=Theme.PRIMARY_HOVER,
+                      width=320, height=70).grid(row=2, column=0, columnspan=2, pady=(0, 20))
+
     def _handle_import(self):
         file_path = filedialog.askopenfilename(filetypes=[("Excel files", "*.xlsx *.xls")])
         if not file_path: return
         
-        try:
-            raw_df, _ = load_excel_dataset(file_path)
-            self.engine = SecurityEngine(raw_df)
-            self.res = self.engine.run_scan()
-            self._render_dashboard()
-        except Exception as e:
-            messagebox.showerror("Import Error", f"Unable to load file: {str(e)}")
+        self.status_label.config(text="⏳ Scanning dataset…", font=(Theme.FONT_FAMILY, 10, "italic"),
+                                 fg=Theme.TEXT_MUTED)
+        self.context.scheduler.submit(self._import_and_scan, file_path, self.context.projections,
+                                      self.context.models, name="security-scan", owner=self,
+                                      on_success=self._on_scan_done, on_error=self._on_scan_error)
+
+    @staticmethod
+    def _import_and_scan(file_path, projector, registry):
+        """Runs on a worker thread; returns (engine, results)."""
+        raw_df = load_raw_dataset(file_path)
+        engine = SecurityEngine(raw_df, projector=projector, registry=registry)
+        return engine, engine.run_scan()
+
+    def _on_scan_done(self, outcome):
+        self.engine, self.res = outcome
+        self.views.invalidate()
+        self._render_dashboard()
+
+    def _on_scan_error(self, error):
+        # Rebuilt to reset the status line and buttons to the last good scan
+        self.views.invalidate("dashboard")
+        self._render_dashboard()
+        messagebox.showerror("Import Error", f"Unable to load file: {str(error)}")
 
     def _switch_view(self, view_id):
-        # Clear current content
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
-
-        # Add Back Button to Header
-        back_btn = tk.Button(self.header_content, text="⬅️ Back to Menu", 
-                             font=(Theme.FONT_FAMILY, 10, "bold"),
-                             bg="#475569", fg=Theme.TEXT_WHITE, bd=0, padx=15, pady=5,
-                             cursor="hand2", command=self._render_dashboard)
-        back_btn.is_back_btn = True
-        back_btn.pack(side="right", padx=20)
+        self._stop_live()
+        self.back_btn.pack(side="right", padx=20)
 
         # Update title based on view
         titles = {
             "iso": "🌲 Isolation Forest Analysis",
             "lof": "📍 LOF Algorithm Results",
             "risk": "⚠️ Risk Profiles & Interpretation",
-            "protocol": "🛡️ Security Protocol"
+            "protocol": "🛡️ Security Protocol",
+            "live": "📡 Live Monitoring"
         }
         self.title_label.config(text=titles.get(view_id, "CYBERSECURITY ANALYSIS"))
 
-        if view_id == "iso":
-            self._render_iso_full()
-        elif view_id == "lof":
-            self._render_lof_full()
-        elif view_id == "risk":
-            self._render_risk_full()
-        elif view_id == "protocol":
-            self._render_protocol_full()
-
-    def _render_iso_full(self):
-        card = StyledCard(self.content_container, "Isolation Forest Results", "🌲")
+        renderers = {
+            "iso": self._render_iso_full,
+            "lof": self._render_lof_full,
+            "risk": self._render_risk_full,
+            "protocol": self._render_protocol_full,
+            "live": self._render_live_full
+        }
+        # The live page holds a running monitor and is rebuilt on every visit
+        self.views.show(view_id, renderers[view_id], keep=view_id != "live")
+
+    def _render_iso_full(self, parent):
+        card = StyledCard(parent, "Isolation Forest Results", "🌲")
         card.pack(fill="both", expand=True)
         fig, ax, canvas = create_embedded_chart(card.content)
         r = self.res
-        colors = [Theme.DANGER if x == -1 else Theme.PRIMARY for x in r['y_iso']]
-        ax.scatter(r['X_pca'][:,0], r['X_pca'][:,1], c=colors, s=80, alpha=0.9, edgecolor='white')
-        
-        for i, txt in enumerate(r['labels']):
-            is_anomaly = r['y_iso'][i] == -1
-            ax.annotate(txt, (r['X_pca'][i, 0], r['X_pca'][i, 1]), 
-                        color=Theme.DANGER if is_anomaly else Theme.TEXT_SECONDARY, 
-                        fontweight='bold' if is_anomaly else 'normal', 
-                        fontsize=7, alpha=0.9 if is_anomaly else 0.4)
+        flagged = r['y_iso'] == -1
+        colors = np.where(flagged, Theme.DANGER, Theme.PRIMARY)
+        lod_scatter(ax, r['X_pca'][:,0], r['X_pca'][:,1], colors, priority=flagged, s=80, alpha=0.9, edgecolor='white')
+        LabelManager(ax, r['X_pca'][:,0], r['X_pca'][:,1], r['labels'], priority=flagged, highlight=flagged,
+                     offset=(0, 0), style={'color': Theme.TEXT_SECONDARY, 'fontsize': 7, 'alpha': 0.4},
+                     highlight_style={'color': Theme.DANGER, 'fontweight': 'bold', 'alpha': 0.9})
 
         ax.set_title(f"Visualizing {r['iso_count']} Detected Global Anomalies")
         canvas.draw()
 
-    def _render_lof_full(self):
-        card = StyledCard(self.content_container, "LOF (Local Outlier Factor) Results", "📍")
+    def _render_lof_full(self, parent):
+        card = StyledCard(parent, "LOF (Local Outlier Factor) Results", "📍")
         card.pack(fill="both", expand=True)
         fig, ax, canvas = create_embedded_chart(card.content)
         r = self.res
-        colors = [Theme.WARNING if x == -1 else Theme.PRIMARY for x in r['y_lof']]
-        ax.scatter(r['X_pca'][:,0], r['X_pca'][:,1], c=colors, s=80, alpha=0.9, edgecolor='white')
-        
-        for i, txt in enumerate(r['labels']):
-            is_outlier = r['y_lof'][i] == -1
-            ax.annotate(txt, (r['X_pca'][i, 0], r['X_pca'][i, 1]), 
-                        color=Theme.WARNING if is_outlier else Theme.TEXT_SECONDARY, 
-                        fontweight='bold' if is_outlier else 'normal', 
-                        fontsize=7, alpha=0.9 if is_outlier else 0.4)
+        flagged = r['y_lof'] == -1
+        colors = np.where(flagged, Theme.WARNING, Theme.PRIMARY)
+        lod_scatter(ax, r['X_pca'][:,0], r['X_pca'][:,1], colors, priority=flagged, s=80, alpha=0.9, edgecolor='white')
+        LabelManager(ax, r['X_pca'][:,0], r['X_pca'][:,1], r['labels'], priority=flagged, highlight=flagged,
+                     offset=(0, 0), style={'color': Theme.TEXT_SECONDARY, 'fontsize': 7, 'alpha': 0.4},
+                     highlight_style={'color': Theme.WARNING, 'fontweight': 'bold', 'alpha': 0.9})
 
         ax.set_title(f"Visualizing {r['lof_count']} Density-based Outliers")
         canvas.draw()
 
-    def _render_risk_full(self):
-        card = StyledCard(self.content_container, "Risk Interpretation & Solutions", "⚠️")
+    def _render_risk_full(self, parent):
+        card = StyledCard(parent, "Risk Interpretation & Solutions", "⚠️")
         card.pack(fill="both", expand=True)
         r = self.res
         t = tk.Text(card.content, bg="#fef2f2", font=(Theme.FONT_MONO, 11), relief="flat", padx=25, pady=20)
@@ -196,8 +218,8 @@ class SecurityView(tk.Toplevel):
         t.config(state="disabled")
         t.pack(fill="both", expand=True)
 
-    def _render_protocol_full(self):
-        card = StyledCard(self.content_container, "Cybersecurity Standard Protocol", "🛡️")
+    def _render_protocol_full(self, parent):
+        card = StyledCard(parent, "Cybersecurity Standard Protocol", "🛡️")
         card.pack(fill="both", expand=True)
         protocol = """
 1. 🔍 INVESTIGATION PHASE
@@ -219,4 +241,116 @@ class SecurityView(tk.Toplevel):
                  justify="left", bg=Theme.BG_CARD, fg=Theme.TEXT_PRIMARY,
                  padx=40, pady=30, anchor="nw").pack(fill="both", expand=True)
 
+    def _render_live_full(self, parent):
+        card = StyledCard(parent, "Live Anomaly Monitoring", "📡")
+        card.pack(fill="both", expand=True)
+
+        controls = tk.Frame(card.content, bg=Theme.BG_CARD)
+        controls.pack(fill="x", padx=20, pady=(10, 0))
+        PremiumButton(controls, text="📂 Monitor CSV File", command=self._start_live,
+                      bg_color=Theme.DANGER, hover_color=Theme.DANGER_LIGHT,
+                      width=240, height=45).pack(side="left")
+        self.live_status = tk.Label(controls, text="Pick a CSV that is being appended to. "
+                                    "Its current rows become the reference window.",
+                                    font=(Theme.FONT_FAMILY, 10, "italic"), bg=Theme.BG_CARD,
+                                    fg=Theme.TEXT_MUTED)
+        self.live_status.pack(side="left", padx=20)
+
+        self.live_stats = tk.Label(card.content, text="", font=(Theme.FONT_MONO, 10), justify="left",
+                                   anchor="w", bg=Theme.BG_CARD, fg=Theme.TEXT_PRIMARY)
+        self.live_stats.pack(fill="x", padx=20, pady=10)
+
+        self.live_log = tk.Text(card.content, bg="#fef2f2", font=(Theme.FONT_MONO, 10), relief="flat",
+                                padx=15, pady=10, state="disabled")
+        self.live_log.pack(fill="both", expand=True, padx=20, pady=(0, 10))
+        card.bind("<Destroy>", lambda e: self._stop_live(), add="+")
+
+    def _start_live(self):
+        file_path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv")])
+        if not file_path: return
+        self._stop_live()
+
+        try:
+            monitor = StreamMonitor(file_path, executor=self.context.scheduler.executor())
+        except Exception as e:
+            messagebox.showerror("Monitoring Error", str(e))
+            return
+        self.live_status.config(text="⏳ Fitting the reference window…")
+        session = self._live_session
+        self.context.scheduler.submit(monitor.start, name="live-reference", owner=self,
+                                      on_success=lambda _: self._on_live_started(monitor, session),
+                                      on_error=lambda e: self._on_live_start_error(e, session))
+
+    def _live_page_current(self, session) -> bool:
+        return session == self._live_session and self.live_status.winfo_exists()
+
+    def _on_live_started(self, monitor, session):
+        if not self._live_page_current(session): return
+        self.monitor = monitor
+        model = monitor.model
+        self.live_status.config(text=f"✅ Watching {monitor.tailer.path}", fg=Theme.SUCCESS)
+        self._log_live(f"Reference fitted on {model.n_reference} rows in {model.fit_seconds:.2f}s\n")
+        self._live_after = self.after(LIVE_POLL_MS, self._live_tick)
+
+    def _live_tick(self):
+        monitor = self.monitor
+        if monitor is None: return
+        if not self._live_busy:
+            # One poll in flight at a time; a slow read simply skips ticks
+            self._live_busy = True
+            self.context.scheduler.submit(monitor.poll, name="live-poll", owner=self,
+                                          on_success=lambda batch: self._on_live_batch(monitor, batch),
+                                          on_error=self._on_live_error)
+        self._live_after = self.after(LIVE_POLL_MS, self._live_tick)
+
+    def _on_live_batch(self, monitor, batch):
+        self._live_busy = False
+        if monitor is not self.monitor: return
+
+        model = monitor.model
+        last_ms = f"{monitor.last_batch_ms:.1f} ms" if monitor.last_batch_ms is not None else "-"
+        refresh = "refitting…" if monitor.refreshing else f"age {monitor.model_age():.0f}s"
+        counts = monitor.flag_counts
+        self.live_stats.config(text=(
+            f"Rows scored: {monitor.rows_scored:<10} Last batch: {last_ms:<12} "
+            f"Reference: {model.n_reference} rows ({refresh})\n"
+            f"Isolation Forest: {counts['iso_flag']:<6} LOF: {counts['lof_flag']:<6} "
+            f"Consensus (high risk): {counts['high_risk']}"))
+
+        if batch.empty: return
+        lines = []
+        for idx, row in batch[batch["iso_flag"] | batch["lof_flag"]].iterrows():
+            level = "❌ HIGH" if row["high_risk"] else ("🌲 ISO " if row["iso_flag"] else "📍 LOF ")
+            lines.append(f"{level}  record #{idx:<8} iso={row['iso_score']:+.3f}  lof={row['lof_score']:+.3f}\n")
+        if lines:
+            self._log_live("".join(lines))
+
+    def _on_live_start_error(self, error, session):
+        if self._live_page_current(session):
+            self._on_live_error(error)
+
+    def _on_live_error(self, error):
+        self._live_busy = False
+        self._stop_live()
+        if self.winfo_exists():
+            messagebox.showerror("Monitoring Error", str(error))
+
+    def _log_live(self, text):
+        self.live_log.config(state="normal")
+        self.live_log.insert("end", text)
+        overflow = int(self.live_log.index("end-1c").split(".")[0]) - LIVE_LOG_LINES
+        if overflow > 0:
+            self.live_log.delete("1.0", f"{overflow + 1}.0")
+        self.live_log.see("end")
+        self.live_log.config(state="disabled")
+
+    def _stop_live(self):
+        self._live_session += 1
+        if self._live_after is not None:
+            self.after_cancel(self._live_after)
+            self._live_after = None
+        self.monitor = None
 
+    def destroy(self):
+        self._stop_live()
+        super().destroy()
@@ -5,33 +5,102 @@ Pure logic for Principal Component Analysis with full metrics suite.
 
 import numpy as np
 import pandas as pd
-from sklearn.decomposition import PCA
-from typing import Dict, Any, List
+from sklearn.decomposition import PCA, IncrementalPCA
+from typing import Dict, Any, List, Optional, Tuple
 from src.core.exceptions import AnalysisError
+from src.core.profiling import span
+from src.data.stats import DatasetStats, StatsAccumulator, attach_stats, cached_stats, dataset_stats
+
+SOLVERS = ("auto", "full", "randomized", "incremental")
+WIDE_FEATURES = 50
+STREAMING_MIN_CELLS = 20_000_000
+DEFAULT_TRUNCATED_COMPONENTS = 10
+ROW_BLOCK = 65_536
+
+def row_blocks(n_rows: int, size: int, min_size: int = 1) -> List[Tuple[int, int]]:
+    """Row ranges of `size`; a short tail is merged into the previous block."""
+    bounds = [(start, min(start + size, n_rows)) for start in range(0, n_rows, size)]
+    if len(bounds) > 1 and bounds[-1][1] - bounds[-1][0] < min_size:
+        bounds[-2:] = [(bounds[-2][0], n_rows)]
+    return bounds
+
+def row_sq_norms(values: np.ndarray, center: np.ndarray) -> np.ndarray:
+    """Squared norm of each centered row, computed in row blocks."""
+    out = np.empty(len(values))
+    for start in range(0, len(values), ROW_BLOCK):
+        block = np.asarray(values[start:start + ROW_BLOCK], dtype=np.float64) - center
+        out[start:start + len(block)] = np.einsum('ij,ij->i', block, block)
+    return out
 
 class PCAEngine:
-    def __init__(self, raw_data: pd.DataFrame, scaled_data: pd.DataFrame):
+    """
+    PCA with a selectable solver.
+
+    'full' keeps every component (exact SVD); 'randomized' and 'incremental'
+    keep only `n_components` (10 by default: PC1/PC2 plus the scree plot).
+    'incremental' runs out-of-core: IncrementalPCA is fitted batch by batch
+    over the (possibly memory-mapped) data, and the dataset statistics are
+    accumulated in the same pass unless they are already cached. 'auto' uses 'incremental'
+    above 20M cells, otherwise 'full' up to 50 features and 'randomized' beyond.
+    """
+
+    def __init__(self, raw_data: pd.DataFrame, scaled_data: pd.DataFrame,
+                 n_components: Optional[int] = None, solver: str = "auto", batch_size: Optional[int] = None,
+                 stats: Optional[DatasetStats] = None):
         if raw_data is None or scaled_data is None:
             raise AnalysisError("No data provided for PCA.")
+        if solver not in SOLVERS:
+            raise AnalysisError(f"Unknown PCA solver: {solver}")
         self.raw_data = raw_data
         self.scaled_data = scaled_data
-        self._pca = PCA()
+        self.stats = stats
+        self.solver = solver
+        if solver == "auto":
+            n_rows, n_cols = scaled_data.shape
+            if n_rows * n_cols >= STREAMING_MIN_CELLS:
+                self.solver = "incremental"
+            else:
+                self.solver = "full" if n_cols <= WIDE_FEATURES else "randomized"
+        self.n_components = self._resolve_components(n_components)
+        self.batch_size = batch_size or max(1000, 5 * scaled_data.shape[1])
+        self._pca = self._build_model(self.batch_size)
         self.results: Dict[str, Any] = {}
 
+    def _resolve_components(self, n_components: Optional[int]) -> Optional[int]:
+        max_components = min(self.scaled_data.shape)
+        if n_components is None:
+            return None if self.solver == "full" else min(DEFAULT_TRUNCATED_COMPONENTS, max_components)
+        return max(2, min(n_components, max_components))
+
+    def _build_model(self, batch_size: int):
+        if self.solver == "incremental":
+            return IncrementalPCA(n_components=self.n_components, batch_size=batch_size)
+        if self.solver == "randomized":
+            return PCA(n_components=self.n_components, svd_solver="randomized", random_state=42)
+        return PCA(n_components=self.n_components, svd_solver="full")
+
     def run(self) -> Dict[str, Any]:
         """Performs full PCA and returns comprehensive metrics."""
+        if self.solver == "incremental":
+            return self._run_streaming()
         try:
             # Fit/Transform on scaled data
-            components = self._pca.fit_transform(self.scaled_data)
-            
+            with span("pca.fit", solver=self.solver, shape=self.scaled_data.shape):
+                components = self._pca.fit_transform(self.scaled_data)
+
             # Basic metrics
             eigenvalues = self._pca.explained_variance_
             inertia = self._pca.explained_variance_ratio_ * 100
             loadings = self._pca.components_.T * np.sqrt(eigenvalues)
-            
+
             # Quality and Contributions
-            # Cos2: Quality of representation on first 2 dims
-            cos2 = components[:, :2] ** 2 / np.sum(components ** 2, axis=1, keepdims=True)
+            # Cos2: Quality of representation on first 2 dims. The denominator is the
+            # squared norm of each centered row, which equals the sum over all
+            # components, so truncated solvers never need the full projection.
+            with span("pca.quality"):
+                row_norms = row_sq_norms(self.scaled_data.to_numpy(), self._pca.mean_)[:, None]
+            stats = self.stats or dataset_stats(self.raw_data)
+            cos2 = components[:, :2] ** 2 / np.where(row_norms > 0, row_norms, 1.0)
             # Contrib: Percentage of contribution to first 2 dims
             contrib = (components[:, :2] ** 2 / np.sum(components[:, :2] ** 2, axis=0)) * 100
 
@@ -45,13 +114,70 @@ class PCAEngine:
                 "features": self.scaled_data.columns.tolist(),
                 "index": self.scaled_data.index.tolist(),
                 "scaled_data": self.scaled_data,
-                "corr_matrix": self.raw_data.corr(),
-                "desc_stats": self.raw_data.describe().loc[['mean', 'std']]
+                "corr_matrix": self._stats_frame(stats.corr()),
+                "desc_stats": stats.summary().set_axis(self.raw_data.columns, axis=1),
+                "solver": self.solver
             }
             return self.results
         except Exception as e:
             raise AnalysisError(f"PCA Analysis failed: {str(e)}")
 
+    def _run_streaming(self) -> Dict[str, Any]:
+        """Out-of-core PCA: one fit pass (with moments) and one transform pass."""
+        try:
+            scaled = self.scaled_data.to_numpy()
+            raw = self.raw_data.to_numpy()
+            features = self.scaled_data.columns.tolist()
+            bounds = row_blocks(len(scaled), self.batch_size, min_size=self.n_components)
+
+            # Pass 1: IncrementalPCA, plus the raw statistics when not cached yet
+            stats = self.stats or cached_stats(self.raw_data)
+            acc = StatsAccumulator(raw.shape[1]) if stats is None else None
+            with span("pca.stream.fit", shape=scaled.shape, batches=len(bounds)):
+                for start, stop in bounds:
+                    self._pca.partial_fit(np.asarray(scaled[start:stop], dtype=np.float64))
+                    if acc is not None:
+                        acc.update(raw[start:stop])
+            if acc is not None:
+                stats = acc.result([str(c) for c in self.raw_data.columns])
+                attach_stats(self.raw_data, stats)
+
+            # Pass 2: projection and row norms for cos2
+            components = np.empty((len(scaled), self.n_components))
+            row_norms = np.empty(len(scaled))
+            with span("pca.stream.transform"):
+                for start, stop in bounds:
+                    block = np.asarray(scaled[start:stop], dtype=np.float64)
+                    components[start:stop] = self._pca.transform(block)
+                    centered = block - self._pca.mean_
+                    row_norms[start:stop] = np.einsum('ij,ij->i', centered, centered)
+
+            eigenvalues = self._pca.explained_variance_
+            cos2 = components[:, :2] ** 2 / np.where(row_norms > 0, row_norms, 1.0)[:, None]
+            contrib = (components[:, :2] ** 2 / np.sum(components[:, :2] ** 2, axis=0)) * 100
+
+            self.results = {
+                "components": components,
+                "eigenvalues": eigenvalues,
+                "inertia": self._pca.explained_variance_ratio_ * 100,
+                "loadings": self._pca.components_.T * np.sqrt(eigenvalues),
+                "cos2": cos2,
+                "contrib": contrib,
+                "features": features,
+                "index": self.scaled_data.index.tolist(),
+                "scaled_data": self.scaled_data,
+                "corr_matrix": self._stats_frame(stats.corr()),
+                "desc_stats": stats.summary().set_axis(self.raw_data.columns, axis=1),
+                "solver": self.solver
+            }
+            return self.results
+        except Exception as e:
+            raise AnalysisError(f"PCA Analysis failed: {str(e)}")
+
+    def _stats_frame(self, matrix: np.ndarray) -> pd.DataFrame:
+        columns = self.raw_data.columns
+        return pd.DataFrame(matrix, index=columns, columns=columns)
+
     def get_tab_data(self) -> Dict[str, Any]:
         if not self.results:
             self.run()
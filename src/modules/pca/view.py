@@ -12,7 +12,9 @@ import matplotlib.pyplot as plt
 
 from src.ui.theme import Theme
 from src.ui.components import StyledCard, PremiumButton
-from src.ui.charts import create_embedded_chart, setup_chart_style
+from src.ui.table import VirtualTable
+from src.ui.view_cache import ViewCache
+from src.ui.charts import LabelManager, create_embedded_chart, lod_scatter, setup_chart_style
 from src.modules.pca.engine import PCAEngine
 from src.core.context import AppContext
 
@@ -25,12 +27,12 @@ class PCAView(tk.Toplevel):
         self.configure(bg=Theme.BG_PRIMARY)
         self.bind('<Escape>', lambda e: self.destroy())
         
-        if self.context.scaled_data is None:
+        if self.context.raw_data is None:
             messagebox.showerror("Error", "No dataset loaded.")
             self.destroy()
             return
             
-        self.engine = PCAEngine(self.context.raw_data, self.context.scaled_data)
+        self.engine = None
         setup_chart_style()
         self._build_ui()
         self._run_analysis()
@@ -52,20 +54,23 @@ class PCAView(tk.Toplevel):
         # Content Container
         self.content_container = tk.Frame(self, bg=Theme.BG_PRIMARY)
         self.content_container.pack(fill="both", expand=True, padx=20, pady=20)
+        # Rendered pages are kept and swapped, not rebuilt
+        self.views = ViewCache(self.content_container)
+
+        self.back_btn = tk.Button(self.header_content, text="⬅️ Back to Menu", 
+                                  font=(Theme.FONT_FAMILY, 10, "bold"),
+                                  bg="#475569", fg=Theme.TEXT_WHITE, bd=0, padx=15, pady=5,
+                                  cursor="hand2", command=self._render_dashboard)
 
         self._render_dashboard()
 
     def _render_dashboard(self):
-        # Clear current content
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
-        
-        # Reset header (remove back button if any)
-        for widget in self.header_content.winfo_children():
-            if getattr(widget, 'is_back_btn', False): widget.destroy()
+        self.back_btn.pack_forget()
+        self.views.show("dashboard", self._build_dashboard)
 
+    def _build_dashboard(self, parent):
         # Dashboard Grid Area
-        dashboard = tk.Frame(self.content_container, bg=Theme.BG_PRIMARY)
+        dashboard = tk.Frame(parent, bg=Theme.BG_PRIMARY)
         dashboard.pack(expand=True)
 
         menu_items = [
@@ -88,75 +93,62 @@ class PCAView(tk.Toplevel):
             btn.grid(row=r, column=c, padx=15, pady=15)
 
     def _run_analysis(self):
-        try:
-            self.results = self.engine.run()
-            # Do not switch view automatically, let user pick from dashboard
-        except Exception as e:
-            messagebox.showerror("Analysis Error", str(e))
+        # Runs on the shared worker pool; the dashboard stays responsive meanwhile
+        self.title_label.config(text="DATA-ANALYSIS - PCA (ACP)  •  computing…")
+        self.context.scheduler.submit(self._fit, name="pca", owner=self,
+                                      on_success=self._on_results, on_error=self._on_error)
+
+    def _fit(self):
+        # The lazy scaled frame is materialized here, on the worker, not in __init__
+        engine = PCAEngine(self.context.raw_data, self.context.scaled_data)
+        return engine, engine.run()
+
+    def _on_results(self, fitted):
+        self.engine, self.results = fitted
+        self.title_label.config(text="DATA-ANALYSIS - PCA (ACP)")
+        # Do not switch view automatically, let user pick from dashboard
+
+    def _on_error(self, error):
+        self.title_label.config(text="DATA-ANALYSIS - PCA (ACP)")
+        messagebox.showerror("Analysis Error", str(error))
 
     def _switch_view(self, view_id):
-        # Clear current content
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
-
-        # Add Back Button to Header - Clear existing ones first to prevent duplication
-        for widget in self.header_content.winfo_children():
-            if getattr(widget, 'is_back_btn', False): widget.destroy()
-
-        back_btn = tk.Button(self.header_content, text="⬅️ Back to Menu", 
-                             font=(Theme.FONT_FAMILY, 10, "bold"),
-                             bg="#475569", fg=Theme.TEXT_WHITE, bd=0, padx=15, pady=5,
-                             cursor="hand2", command=self._render_dashboard)
-        back_btn.is_back_btn = True
-        back_btn.pack(side="right", padx=20)
-
-        # Render selected view
-        if view_id == "stats":
-            self._render_stats()
-        elif view_id == "matrix":
-            self._render_matrix()
-        elif view_id == "corr":
-            self._render_corr()
-        elif view_id == "inertia":
-            self._render_inertia()
-        elif view_id == "circle":
-            self._render_circle()
-        elif view_id == "plan":
-            self._render_plan()
-        elif view_id == "quality":
-            self._render_quality()
-        elif view_id == "contrib":
-            self._render_contrib()
-
-    def _create_text_card(self, parent, title, icon, content, font_size=9):
+        if not hasattr(self, 'results'):
+            messagebox.showinfo("Note", "The analysis is still running, please wait.")
+            return
+
+        self.back_btn.pack(side="right", padx=20)
+
+        # Render selected view (built once, then recalled from the cache)
+        renderers = {
+            "stats": self._render_stats,
+            "matrix": self._render_matrix,
+            "corr": self._render_corr,
+            "inertia": self._render_inertia,
+            "circle": self._render_circle,
+            "plan": self._render_plan,
+            "quality": self._render_quality,
+            "contrib": self._render_contrib
+        }
+        self.views.show(view_id, renderers[view_id])
+
+    def _create_table_card(self, parent, title, icon, frame, index=None, precision=None, font_size=9):
         card = StyledCard(parent, title, icon)
-        txt = tk.Text(card.content, bg="#f8fafc", fg=Theme.TEXT_PRIMARY,
-                     font=(Theme.FONT_MONO, font_size), relief="flat", wrap="none",
-                     padx=15, pady=10)
-        sy = tk.Scrollbar(card.content, orient="vertical", command=txt.yview)
-        sx = tk.Scrollbar(card.content, orient="horizontal", command=txt.xview)
-        txt.config(yscrollcommand=sy.set, xscrollcommand=sx.set)
-        txt.insert("1.0", content)
-        txt.config(state="disabled")
-        sy.pack(side="right", fill="y")
-        sx.pack(side="bottom", fill="x")
-        txt.pack(side="left", fill="both", expand=True)
+        VirtualTable(card.content, frame, index=index, precision=precision,
+                     font_size=font_size).pack(fill="both", expand=True, padx=15, pady=10)
         return card
 
-    def _render_stats(self):
-        stats_text = "         MEAN & STANDARD DEVIATION\n" + "═" * 50 + "\n\n"
-        stats_text += self.results['desc_stats'].T.to_string()
-        self._create_text_card(self.content_container, "Descriptive Statistics", "📊", stats_text, 10).pack(fill="both", expand=True)
+    def _render_stats(self, parent):
+        self._create_table_card(parent, "Descriptive Statistics (Mean & Standard Deviation)", "📊",
+                                self.results['desc_stats'].T, precision=4, font_size=10).pack(fill="both", expand=True)
 
-    def _render_matrix(self):
-        labels = self.context.get_individual_labels()
-        df_display = self.results['scaled_data'].copy()
-        df_display.index = labels
-        matrix_text = df_display.round(4).to_string()
-        self._create_text_card(self.content_container, "Centered-Reduced Matrix (Z-Scores)", "🔢", matrix_text, 9).pack(fill="both", expand=True)
+    def _render_matrix(self, parent):
+        self._create_table_card(parent, "Centered-Reduced Matrix (Z-Scores)", "🔢",
+                                self.results['scaled_data'], index=self.context.get_individual_labels(),
+                                precision=4, font_size=9).pack(fill="both", expand=True)
 
-    def _render_corr(self):
-        card = StyledCard(self.content_container, "Correlation Matrix Heatmap", "🔥")
+    def _render_corr(self, parent):
+        card = StyledCard(parent, "Correlation Matrix Heatmap", "🔥")
         card.pack(fill="both", expand=True)
         fig, ax, canvas = create_embedded_chart(card.content)
         sns.heatmap(self.results['corr_matrix'], annot=True, cmap='RdYlBu_r', fmt=".2f", ax=ax,
@@ -164,8 +156,8 @@ class PCAView(tk.Toplevel):
         ax.tick_params(labelsize=9, rotation=45)
         canvas.draw()
 
-    def _render_inertia(self):
-        card = StyledCard(self.content_container, "Explained Variance (Scree Plot)", "⚡")
+    def _render_inertia(self, parent):
+        card = StyledCard(parent, "Explained Variance (Scree Plot)", "⚡")
         card.pack(fill="both", expand=True)
         fig, ax, canvas = create_embedded_chart(card.content)
         inertia = self.results['inertia']
@@ -176,22 +168,23 @@ class PCAView(tk.Toplevel):
         ax.set_ylabel("Explained Variance (%)")
         canvas.draw()
 
-    def _render_plan(self):
-        card = StyledCard(self.content_container, "Projection of Individuals (PC1 vs PC2)", "🎯")
+    def _render_plan(self, parent):
+        card = StyledCard(parent, "Projection of Individuals (PC1 vs PC2)", "🎯")
         card.pack(fill="both", expand=True)
         fig, ax, canvas = create_embedded_chart(card.content, figsize=(10, 7))
-        ax.scatter(self.results['components'][:, 0], self.results['components'][:, 1], c=Theme.CHART_BLUE, s=80, alpha=0.85, zorder=3)
-        labels = self.context.get_individual_labels()
-        for i, txt in enumerate(labels):
-            ax.annotate(txt, (self.results['components'][i, 0], self.results['components'][i, 1]), fontsize=8, alpha=0.8, xytext=(5, 5), textcoords='offset points')
+        lod_scatter(ax, self.results['components'][:, 0], self.results['components'][:, 1], Theme.CHART_BLUE, s=80, alpha=0.85, zorder=3)
+        # Best-represented individuals (highest cos² on the plan) are labelled first
+        LabelManager(ax, self.results['components'][:, 0], self.results['components'][:, 1],
+                     self.context.get_individual_labels(), priority=self.results['cos2'].sum(axis=1),
+                     offset=(5, 5), style={'fontsize': 8, 'alpha': 0.8})
         ax.axhline(0, color='#94a3b8', linestyle='--', alpha=0.7)
         ax.axvline(0, color='#94a3b8', linestyle='--', alpha=0.7)
         ax.set_xlabel(f"PC1 ({self.results['inertia'][0]:.1f}%)")
         ax.set_ylabel(f"PC2 ({self.results['inertia'][1]:.1f}%)")
         canvas.draw()
 
-    def _render_circle(self):
-        card = StyledCard(self.content_container, "Variables Factor Map", "🔄")
+    def _render_circle(self, parent):
+        card = StyledCard(parent, "Variables Factor Map", "🔄")
         card.pack(fill="both", expand=True)
         fig, ax, canvas = create_embedded_chart(card.content, figsize=(8, 7))
         loadings = self.results['loadings']
@@ -203,12 +196,12 @@ class PCAView(tk.Toplevel):
         ax.set_aspect('equal')
         canvas.draw()
 
-    def _render_quality(self):
-        labels = self.context.get_individual_labels()
-        data = pd.DataFrame(self.results['cos2'], columns=['PC1', 'PC2'], index=labels).round(4)
-        self._create_text_card(self.content_container, "QUALITY OF REPRESENTATION (COS²)", "✨", data.to_string(), 10).pack(fill="both", expand=True)
+    def _render_quality(self, parent):
+        data = pd.DataFrame(self.results['cos2'], columns=['PC1', 'PC2'])
+        self._create_table_card(parent, "QUALITY OF REPRESENTATION (COS²)", "✨", data,
+                                index=self.context.get_individual_labels(), precision=4, font_size=10).pack(fill="both", expand=True)
 
-    def _render_contrib(self):
-        labels = self.context.get_individual_labels()
-        data = pd.DataFrame(self.results['contrib'], columns=['PC1', 'PC2'], index=labels).round(2)
-        self._create_text_card(self.content_container, "CONTRIBUTIONS (%)", "📈", data.to_string(), 10).pack(fill="both", expand=True)
+    def _render_contrib(self, parent):
+        data = pd.DataFrame(self.results['contrib'], columns=['PC1', 'PC2'])
+        self._create_table_card(parent, "CONTRIBUTIONS (%)", "📈", data,
+                                index=self.context.get_individual_labels(), precision=2, font_size=10).pack(fill="both", expand=True)
@@ -0,0 +1,69 @@
+"""
+DataScope Projection Service
+Shared 2-D PCA embeddings for scatter views, computed once per dataset and scaling.
+"""
+
+import threading
+import numpy as np
+import pandas as pd
+from concurrent.futures import Future
+from sklearn.decomposition import PCA
+from typing import Dict, Hashable, Optional
+from src.core.exceptions import AnalysisError
+from src.core.lru import LRUCache
+from src.core.profiling import timed
+from src.data.cache import frame_fingerprint
+
+class ProjectionService:
+    """
+    Computes and caches 2-D PCA embeddings keyed by (dataset fingerprint, scaling kind).
+    Wide matrices use randomized SVD, since only two components are needed.
+    Concurrent callers asking for the same key wait on one computation.
+    """
+    WIDE_FEATURES = 50
+
+    def __init__(self, cache: Optional[LRUCache] = None, random_state: int = 42):
+        self.cache = cache if cache is not None else LRUCache(max_items=8)
+        self.random_state = random_state
+        self._pending: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def project_2d(self, data: pd.DataFrame, scaling: str = "zscore",
+                   fingerprint: Optional[str] = None) -> np.ndarray:
+        """Returns an (n, 2) embedding of already-scaled `data`."""
+        key = (fingerprint or frame_fingerprint(data), scaling)
+        with self._lock:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+            pending = self._pending.get(key)
+            if pending is None:
+                future = self._pending[key] = Future()
+        if pending is not None:
+            return pending.result()
+
+        try:
+            embedding = self._fit(data)
+            self.cache.put(key, embedding)
+            future.set_result(embedding)
+            return embedding
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    @timed("projection.fit")
+    def _fit(self, data: pd.DataFrame) -> np.ndarray:
+        try:
+            n_rows, n_cols = data.shape
+            if min(n_rows, n_cols) < 2:
+                raise AnalysisError("At least 2 rows and 2 features are needed for a 2-D projection.")
+            solver = "randomized" if n_cols > self.WIDE_FEATURES else "full"
+            pca = PCA(n_components=2, svd_solver=solver, random_state=self.random_state)
+            return pca.fit_transform(data.to_numpy())
+        except AnalysisError:
+            raise
+        except Exception as e:
+            raise AnalysisError(f"Projection failed: {str(e)}")
@@ -0,0 +1,167 @@
+"""
+DataScope Model Registry
+Versioned on-disk store of trained models, keyed by dataset fingerprint and hyperparameters.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import joblib
+import sklearn
+
+from src.core.disk import prune_to_budget, touch
+from src.core.lru import LRUCache
+from src.core.profiling import span
+
+# Bumped whenever a persisted payload changes shape; older versions load as misses
+REGISTRY_FORMAT_VERSION = 2
+KEEP_VERSIONS = 3
+# On-disk budget across every model; least recently used versions are pruned after each save
+MAX_REGISTRY_MB = 2048
+
+def model_key(kind: str, fingerprint: str, params: Dict[str, Any]) -> str:
+    """Stable digest of (kind, dataset fingerprint, hyperparameters)."""
+    raw = json.dumps({"kind": kind, "fingerprint": fingerprint, "params": params}, sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+class ModelRegistry:
+    """
+    Stores fitted models as ``<root>/<kind>/<key>/v<N>/`` directories holding
+    an uncompressed joblib payload and a manifest. Payloads are loaded with
+    ``mmap_mode='r'``, so the numpy arrays inside them (centroids, labels,
+    forest node tables) are mapped from disk rather than copied.
+
+    Entries written by another scikit-learn or registry format version are
+    treated as misses. Loaded payloads are kept in-process per version, and
+    I/O failures fall back to retraining, as with the ingestion cache. Saved
+    versions are kept under `max_mb` in total, least recently used pruned first.
+    """
+
+    def __init__(self, root: Optional[str] = None, keep_versions: int = KEEP_VERSIONS,
+                 max_mb: float = MAX_REGISTRY_MB) -> None:
+        self.root = root or os.environ.get("DATASCOPE_MODEL_DIR") or os.path.join(
+            os.path.expanduser("~"), ".datascope", "models")
+        self.keep_versions = keep_versions
+        self.max_bytes = int(max_mb * 2**20)
+        self._loaded = LRUCache(max_items=16)
+        self._lock = threading.Lock()
+
+    def _entry_dir(self, kind: str, fingerprint: str, params: Dict[str, Any]) -> str:
+        return os.path.join(self.root, kind, model_key(kind, fingerprint, params))
+
+    def versions(self, kind: str, fingerprint: str, params: Dict[str, Any]) -> List[int]:
+        """Saved version numbers for this model, oldest first."""
+        entry_dir = self._entry_dir(kind, fingerprint, params)
+        if not os.path.isdir(entry_dir):
+            return []
+        return sorted(int(name[1:]) for name in os.listdir(entry_dir) if name[:1] == "v" and name[1:].isdigit())
+
+    def save(self, kind: str, fingerprint: str, params: Dict[str, Any], payload: Any) -> Optional[int]:
+        """Writes `payload` as the next version and returns its number (None if the disk write failed)."""
+        entry_dir = self._entry_dir(kind, fingerprint, params)
+        with self._lock:
+            version = max(self.versions(kind, fingerprint, params), default=0) + 1
+            try:
+                with span("registry.save", kind=kind):
+                    os.makedirs(entry_dir, exist_ok=True)
+                    tmp_dir = tempfile.mkdtemp(prefix=".tmp-", dir=entry_dir)
+                    try:
+                        joblib.dump(payload, os.path.join(tmp_dir, "model.joblib"))
+                        with open(os.path.join(tmp_dir, "manifest.json"), "w", encoding="utf-8") as fh:
+                            json.dump({
+                                "format": REGISTRY_FORMAT_VERSION,
+                                "sklearn": sklearn.__version__,
+                                "kind": kind,
+                                "fingerprint": fingerprint,
+                                "params": params,
+                                "version": version,
+                                "created": time.time()
+                            }, fh, default=str)
+                        os.replace(tmp_dir, os.path.join(entry_dir, f"v{version}"))
+                    except OSError:
+                        shutil.rmtree(tmp_dir, ignore_errors=True)
+                        raise
+            except OSError:
+                return None
+            self._loaded.put(os.path.join(entry_dir, f"v{version}"), payload)
+            self._prune(entry_dir, version)
+            self._prune_disk(keep=[os.path.join(entry_dir, f"v{version}")])
+        return version
+
+    def load(self, kind: str, fingerprint: str, params: Dict[str, Any],
+             version: Optional[int] = None) -> Optional[Any]:
+        """Returns the payload of `version` (default: latest), or None on a miss."""
+        versions = self.versions(kind, fingerprint, params)
+        if version is None:
+            if not versions:
+                return None
+            version = versions[-1]
+        elif version not in versions:
+            return None
+
+        version_dir = os.path.join(self._entry_dir(kind, fingerprint, params), f"v{version}")
+        with self._lock:
+            payload = self._loaded.get(version_dir)
+            if payload is not None:
+                touch(version_dir)
+                return payload
+            try:
+                with open(os.path.join(version_dir, "manifest.json"), encoding="utf-8") as fh:
+                    manifest = json.load(fh)
+                if manifest.get("format") != REGISTRY_FORMAT_VERSION or manifest.get("sklearn") != sklearn.__version__:
+                    return None
+                with span("registry.load", kind=kind):
+                    payload = joblib.load(os.path.join(version_dir, "model.joblib"), mmap_mode="r")
+            except (OSError, ValueError, KeyError, EOFError):
+                shutil.rmtree(version_dir, ignore_errors=True)
+                return None
+            self._loaded.put(version_dir, payload)
+            touch(version_dir)
+            return payload
+
+    def load_or_fit(self, kind: str, fingerprint: str, params: Dict[str, Any], fit: Callable[[], Any]) -> Any:
+        """Latest saved payload, or `fit()` saved as a new version."""
+        payload = self.load(kind, fingerprint, params)
+        if payload is None:
+            payload = fit()
+            self.save(kind, fingerprint, params, payload)
+        return payload
+
+    def forget(self) -> None:
+        """Drops in-process payloads; the on-disk versions are kept."""
+        with self._lock:
+            self._loaded.clear()
+
+    def clear(self) -> None:
+        """Removes every saved model."""
+        with self._lock:
+            self._loaded.clear()
+            shutil.rmtree(self.root, ignore_errors=True)
+
+    def _prune(self, entry_dir: str, latest: int) -> None:
+        for name in os.listdir(entry_dir):
+            if name[:1] == "v" and name[1:].isdigit() and int(name[1:]) <= latest - self.keep_versions:
+                self._loaded.pop(os.path.join(entry_dir, name), None)
+                shutil.rmtree(os.path.join(entry_dir, name), ignore_errors=True)
+
+    def _prune_disk(self, keep: List[str]) -> None:
+        versions = []
+        for kind in os.scandir(self.root):
+            if not kind.is_dir():
+                continue
+            for entry in os.scandir(kind.path):
+                if entry.is_dir() and entry.name[:1] != ".":
+                    versions.extend(os.path.join(entry.path, name) for name in os.listdir(entry.path)
+                                    if name[:1] == "v" and name[1:].isdigit())
+        for version_dir in prune_to_budget(versions, self.max_bytes, keep):
+            self._loaded.pop(version_dir, None)
+            try:
+                os.rmdir(os.path.dirname(version_dir))
+            except OSError:
+                pass  # other versions remain
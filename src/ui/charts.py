@@ -3,14 +3,38 @@ DataScope Chart Engine
 Centralized Matplotlib configuration and embedding.
 """
 
+import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.colors import to_rgba_array
 from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import tkinter as tk
+from typing import Optional
+from src.core.profiling import span
 from src.ui.theme import Theme
 
+# Level-of-detail scatter: above LOD_THRESHOLD points, the viewport shows at most
+# LOD_MAX_POINTS markers and falls back to a density raster of LOD_BIN_PX pixel bins
+LOD_THRESHOLD = 50_000
+LOD_MAX_POINTS = 20_000
+LOD_BIN_PX = 3
+LOD_CULL_MARGIN = 0.25
+# Point labels: at most LABEL_BUDGET per view, one per LABEL_CELL_PX screen cell
+LABEL_BUDGET = 60
+LABEL_CELL_PX = (70, 14)
+
 class ZoomManager:
-    """Handles professional mouse wheel zooming and panning with performance optimizations."""
+    """
+    Handles professional mouse wheel zooming and panning with performance optimizations.
+
+    On blit-capable canvases a drag does not re-render the figure: the axes
+    area as last rendered is cached on press and every motion event only
+    repaints the axes background and copies that raster shifted by the drag
+    offset (`restore_region` + `blit`). Ticks, gridlines and the newly
+    exposed strip catch up in the single full render on release.
+    """
     def __init__(self, fig, ax, canvas):
         self.fig = fig
         self.ax = ax
@@ -24,12 +48,17 @@ class ZoomManager:
         self.press = None
         self._throttling = False
         self._interaction_active = False
+        # Blitted panning: raster of the axes area and the limits it was rendered at
+        self.use_blit = getattr(canvas, 'supports_blit', False)
+        self._pan_cache = None
+        self._drawn_limits = None
         
         self.cids = [
             self.canvas.mpl_connect('scroll_event', self.on_scroll),
             self.canvas.mpl_connect('button_press_event', self.on_press),
             self.canvas.mpl_connect('button_release_event', self.on_release),
-            self.canvas.mpl_connect('motion_notify_event', self.on_motion)
+            self.canvas.mpl_connect('motion_notify_event', self.on_motion),
+            self.canvas.mpl_connect('draw_event', self.on_draw)
         ]
         self.canvas.zoom_manager = self
 
@@ -44,9 +73,15 @@ class ZoomManager:
             return
         
         self._interaction_active = enabled
-        # Hide/Show all text elements to speed up rendering during pan/zoom
-        for text in self.ax.texts:
-            text.set_visible(not enabled)
+        # Hide the visible text elements during pan/zoom, then restore exactly those
+        if enabled:
+            self._hidden_texts = [text for text in self.ax.texts if text.get_visible()]
+            for text in self._hidden_texts:
+                text.set_visible(False)
+        else:
+            for text in getattr(self, '_hidden_texts', ()):
+                text.set_visible(True)
+            self._hidden_texts = []
 
     def _request_draw(self):
         """Throttled draw request for smoother UI."""
@@ -108,7 +143,14 @@ class ZoomManager:
             return
 
         if event.button == 1:
-            self._set_fast_mode(True)
+            if self.use_blit:
+                # The cached raster must match the current limits (a scroll may still be pending)
+                if self._drawn_limits != self._limits():
+                    self._set_fast_mode(False)
+                    self.canvas.draw()
+                self._pan_cache = self.canvas.copy_from_bbox(self.ax.bbox)
+            else:
+                self._set_fast_mode(True)
             # Store initial pixel coordinates, data limits, and the inverse transform
             inv = self.ax.transData.inverted()
             self.press = event.x, event.y, self.ax.get_xlim(), self.ax.get_ylim(), inv
@@ -128,13 +170,279 @@ class ZoomManager:
         
         self.ax.set_xlim([xlim[0] - dx, xlim[1] - dx])
         self.ax.set_ylim([ylim[0] - dy, ylim[1] - dy])
-        self._request_draw()
+        if self._pan_cache is not None:
+            self._blit_pan(event.x - xpress, event.y - ypress)
+        else:
+            self._request_draw()
+
+    def _blit_pan(self, dx: float, dy: float):
+        """Repaints the axes area as the cached raster shifted by (dx, dy) display pixels."""
+        with span("chart.blit"):
+            self.ax.draw_artist(self.ax.patch)
+            # Region extents are in the renderer's top-down pixel coordinates
+            x1, y1, x2, y2 = self._pan_cache.get_extents()
+            dx, dy = int(round(dx)), -int(round(dy))
+            sx1, sx2 = (x1, x2 - dx) if dx >= 0 else (x1 - dx, x2)
+            sy1, sy2 = (y1, y2 - dy) if dy >= 0 else (y1 - dy, y2)
+            if sx2 > sx1 and sy2 > sy1:
+                # xy is where the region's own origin lands, not the clipped bbox's
+                self.canvas.restore_region(self._pan_cache, bbox=(sx1, sy1, sx2, sy2),
+                                           xy=(x1 + dx, y1 + dy))
+            self.canvas.blit(self.ax.bbox)
 
     def on_release(self, event):
         self.press = None
+        self._pan_cache = None
         self._set_fast_mode(False)
         self.canvas.draw_idle()
 
+    def on_draw(self, event):
+        self._drawn_limits = self._limits()
+
+    def _limits(self):
+        return self.ax.get_xlim(), self.ax.get_ylim()
+
+class LODScatter:
+    """
+    Scatter plot that stays interactive at any point count.
+
+    Up to `threshold` points it is a plain `ax.scatter`. Beyond that, each
+    render looks at the current viewport: when at most `max_points` points
+    fall inside it (plus a margin for panning), those points are drawn as
+    markers; otherwise the view is shown as a density raster, re-binned
+    to the axes' pixel size ("density") or as a stable random subset of the
+    visible points ("decimate"). Per-point colors are kept: each raster
+    cell takes the color of its most frequent category, with opacity
+    growing with log-density. `priority` points (e.g. anomalies) are
+    always drawn as markers.
+
+    Re-binning happens on the next render after the limits change, and is
+    deferred while `ZoomManager` is mid-interaction.
+    """
+    MODES = ("density", "decimate")
+
+    def __init__(self, ax, x, y, colors=Theme.CHART_BLUE, priority=None, mode: str = "density",
+                 threshold: int = LOD_THRESHOLD, max_points: int = LOD_MAX_POINTS, **scatter_kwargs):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown LOD mode: {mode}")
+        self.ax = ax
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.mode = mode
+        self.max_points = max_points
+        self.active = len(self.x) > threshold
+        self.image = None
+        if not self.active:
+            self.points = ax.scatter(self.x, self.y, c=colors, **scatter_kwargs)
+            return
+
+        if isinstance(colors, str) or len(colors) != len(self.x):
+            self.codes = np.zeros(len(self.x), dtype=np.intp)
+            self.palette = to_rgba_array([colors])
+        else:
+            codes, uniques = pd.factorize(np.asarray(colors, dtype=object))
+            self.codes = codes.astype(np.intp)
+            self.palette = to_rgba_array(list(uniques))
+        self.priority = np.flatnonzero(priority) if priority is not None else np.empty(0, dtype=np.intp)
+        if len(self.priority) > max_points:
+            # Too many to stand out as markers; they stay in the raster
+            self.priority = self.priority[:0]
+        self._order = np.random.default_rng(0).permutation(len(self.x))
+        self._view = None
+
+        self.points = ax.scatter([], [], color=self.palette[0], **scatter_kwargs)
+        ax.update_datalim([(np.nanmin(self.x), np.nanmin(self.y)), (np.nanmax(self.x), np.nanmax(self.y))])
+        ax.autoscale_view()
+        if not _register_viewport_layer(self):
+            self.refresh()
+
+    @property
+    def attached(self) -> bool:
+        return self.points.axes is not None
+
+    def refresh(self, force: bool = False) -> None:
+        """Rebuilds the markers/raster for the current viewport if it changed."""
+        if not self.active or not self.attached:
+            return
+        bbox = self.ax.bbox
+        view = (tuple(self.ax.get_xlim()), tuple(self.ax.get_ylim()), int(bbox.width), int(bbox.height))
+        if view == self._view and not force:
+            return
+        zoom = getattr(self.ax.figure.canvas, "zoom_manager", None)
+        if self._view is not None and zoom is not None and zoom._interaction_active and not force:
+            return
+        self._view = view
+        with span("chart.lod", points=len(self.x)):
+            (x0, x1), (y0, y1), width, height = view
+            mx, my = (x1 - x0) * LOD_CULL_MARGIN, (y1 - y0) * LOD_CULL_MARGIN
+            near = ((self.x >= min(x0, x1) - abs(mx)) & (self.x <= max(x0, x1) + abs(mx)) &
+                    (self.y >= min(y0, y1) - abs(my)) & (self.y <= max(y0, y1) + abs(my)))
+            n_near = int(near.sum())
+            if n_near <= self.max_points:
+                self._show_points(np.flatnonzero(near))
+            elif self.mode == "decimate":
+                self._show_points(self._order[near[self._order]][:self.max_points])
+            else:
+                self._show_density(x0, x1, y0, y1, width, height)
+
+    def _show_points(self, idx: np.ndarray) -> None:
+        self._set_image(None)
+        self.points.set_offsets(np.column_stack([self.x[idx], self.y[idx]]))
+        self.points.set_facecolor(self.palette[self.codes[idx]])
+
+    def _show_density(self, x0: float, x1: float, y0: float, y1: float, width: int, height: int) -> None:
+        nx = int(np.clip(width // LOD_BIN_PX, 16, 1024))
+        ny = int(np.clip(height // LOD_BIN_PX, 16, 1024))
+        ix = np.floor((self.x - x0) / (x1 - x0) * nx)
+        iy = np.floor((self.y - y0) / (y1 - y0) * ny)
+        inside = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+        n_cat = len(self.palette)
+        flat = (self.codes[inside] * ny + iy[inside].astype(np.intp)) * nx + ix[inside].astype(np.intp)
+        counts = np.bincount(flat, minlength=n_cat * ny * nx).reshape(n_cat, ny, nx)
+
+        total = counts.sum(axis=0)
+        rgba = self.palette[counts.argmax(axis=0)]
+        peak = max(int(total.max()), 1)
+        rgba[..., 3] *= np.where(total > 0, 0.35 + 0.65 * np.log1p(total) / np.log1p(peak), 0.0)
+        self._set_image(AxesImage(self.ax, extent=(x0, x1, y0, y1), origin="lower", interpolation="nearest",
+                                  zorder=self.points.get_zorder()))
+        self.image.set_data(rgba)
+
+        idx = self.priority
+        self.points.set_offsets(np.column_stack([self.x[idx], self.y[idx]]))
+        self.points.set_facecolor(self.palette[self.codes[idx]])
+
+    def _set_image(self, image) -> None:
+        if self.image is not None and self.image.axes is not None:
+            self.image.remove()
+        self.image = image
+        if image is not None:
+            self.ax.add_image(image)
+
+class LabelManager:
+    """
+    Point labels culled to the viewport and capped at `budget`.
+
+    Points are indexed by x (sorted, searched with `searchsorted`). On each
+    render the points inside the view are ranked by `priority` (higher
+    first, e.g. anomaly flags or cos²), at most one label is kept per
+    screen cell so labels do not pile up, and the best `budget` are drawn
+    through a fixed pool of Annotation artists. Redraw cost depends on
+    the budget, not on the number of points.
+
+    `highlight` marks points drawn with `highlight_style` (merged over
+    `style`) rather than `style`.
+    """
+
+    def __init__(self, ax, x, y, labels, priority=None, highlight=None, budget: int = LABEL_BUDGET,
+                 offset=(4, 4), style=None, highlight_style=None):
+        self.ax = ax
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.labels = labels
+        n = len(self.x)
+        # Stable tie-breaker so equal-priority labels do not flicker between renders
+        jitter = np.random.default_rng(0).random(n) * 1e-6
+        self.rank = (np.asarray(priority, dtype=np.float64) if priority is not None else np.zeros(n)) + jitter
+        self.highlight = np.asarray(highlight, dtype=bool) if highlight is not None else np.zeros(n, dtype=bool)
+        self._order = np.argsort(self.x, kind="stable")
+        self._sorted_x = self.x[self._order]
+        self._view = None
+
+        self.pool = [ax.annotate("", (0, 0), xytext=offset, textcoords="offset points", visible=False)
+                     for _ in range(min(budget, n))]
+        # Pooled texts move between plain and highlighted points, so the plain
+        # style also resets every highlight-only key to the text's default
+        base = {key: _text_default(self.pool[0], key) for key in (highlight_style or {})} if self.pool else {}
+        base.update(style or {})
+        self._styles = (base, {**base, **(highlight_style or {})})
+        if not _register_viewport_layer(self):
+            self.refresh()
+
+    @property
+    def attached(self) -> bool:
+        return not self.pool or self.pool[0].axes is not None
+
+    def visible_indices(self) -> np.ndarray:
+        """Indices of the points labelled for the current view, best first."""
+        (x0, x1), (y0, y1) = sorted(self.ax.get_xlim()), sorted(self.ax.get_ylim())
+        lo, hi = np.searchsorted(self._sorted_x, [x0, x1], side="left")
+        candidates = self._order[lo:hi]
+        ys = self.y[candidates]
+        candidates = candidates[(ys >= y0) & (ys <= y1)]
+        budget = len(self.pool)
+        # Rank a shortlist first; fall back to every candidate if too many share cells
+        shortlist = budget * 16
+        if len(candidates) > shortlist:
+            shown = self._declutter(candidates, shortlist)
+            if len(shown) >= budget:
+                return shown[:budget]
+        return self._declutter(candidates)[:budget]
+
+    def _declutter(self, candidates: np.ndarray, limit: Optional[int] = None) -> np.ndarray:
+        """Best-ranked candidate of each screen cell, best first (from the top `limit` only)."""
+        ranks = -self.rank[candidates]
+        if limit is not None:
+            top = np.argpartition(ranks, limit)[:limit]
+            candidates, ranks = candidates[top], ranks[top]
+        candidates = candidates[np.argsort(ranks, kind="stable")]
+        pixels = self.ax.transData.transform(np.column_stack([self.x[candidates], self.y[candidates]]))
+        cells = np.floor(pixels / LABEL_CELL_PX).astype(np.int64)
+        _, first = np.unique(cells[:, 0] * 1_000_003 + cells[:, 1], return_index=True)
+        return candidates[np.sort(first)]
+
+    def refresh(self, force: bool = False) -> None:
+        if not self.pool or not self.attached:
+            return
+        bbox = self.ax.bbox
+        view = (tuple(self.ax.get_xlim()), tuple(self.ax.get_ylim()), int(bbox.width), int(bbox.height))
+        if view == self._view and not force:
+            return
+        zoom = getattr(self.ax.figure.canvas, "zoom_manager", None)
+        if self._view is not None and zoom is not None and zoom._interaction_active and not force:
+            return
+        self._view = view
+        with span("chart.labels", points=len(self.x)):
+            shown = self.visible_indices()
+            for text, i in zip(self.pool, shown):
+                text.xy = (self.x[i], self.y[i])
+                text.set_text(str(self.labels[i]))
+                text.update(self._styles[int(self.highlight[i])])
+                text.set_visible(True)
+            for text in self.pool[len(shown):]:
+                text.set_visible(False)
+
+def _text_default(text, key: str):
+    """Current value of property `key` on an unstyled text (None when it has no getter)."""
+    getter = getattr(text, f"get_{key}", None)
+    return getter() if getter is not None else None
+
+def _register_viewport_layer(layer) -> bool:
+    """Adds `layer` to its canvas' pre-draw refresh list; False if the canvas has none."""
+    layers = getattr(layer.ax.figure.canvas, "viewport_layers", None)
+    if layers is None:
+        return False
+    layers.append(layer)
+    return True
+
+def lod_scatter(ax, x, y, colors=Theme.CHART_BLUE, **kwargs) -> LODScatter:
+    """Level-of-detail replacement for `ax.scatter` (see `LODScatter`)."""
+    return LODScatter(ax, x, y, colors, **kwargs)
+
+class ProfiledCanvas(FigureCanvasTkAgg):
+    """Tk canvas whose renders are reported as `chart.draw` spans."""
+    def __init__(self, figure, master=None):
+        self.viewport_layers = []
+        super().__init__(figure, master=master)
+
+    def draw(self):
+        with span("chart.draw"):
+            # Re-bin LOD scatters and re-pick labels for the current viewport
+            self.viewport_layers = [layer for layer in self.viewport_layers if layer.attached]
+            for layer in self.viewport_layers:
+                layer.refresh()
+            super().draw()
+
 def setup_chart_style():
     """Applies universal styling to all matplotlib charts."""
     plt.style.use('seaborn-v0_8-whitegrid')
@@ -167,7 +475,7 @@ def create_embedded_chart(parent: tk.Widget, figsize=(5, 4), toolbar: bool = Fal
     ax.spines['right'].set_visible(False)
     
     # Canvas
-    canvas = FigureCanvasTkAgg(fig, master=parent)
+    canvas = ProfiledCanvas(fig, master=parent)
     canvas_widget = canvas.get_tk_widget()
     canvas_widget.config(highlightthickness=0)
     
@@ -0,0 +1,137 @@
+"""
+DataScope Performance Panel
+Live view of recorded profiling spans: recent operations and per-operation totals.
+"""
+
+import time
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+
+from src.core.profiling import Profiler
+from src.ui.components import PremiumButton
+from src.ui.theme import Theme
+
+REFRESH_MS = 500
+RECENT_ROWS = 300
+
+class PerformancePanel(tk.Toplevel):
+    def __init__(self, parent, profiler: Profiler):
+        super().__init__(parent)
+        self.profiler = profiler
+        self.title("DataScope - Performance")
+        self.geometry("1100x700")
+        self.configure(bg=Theme.BG_PRIMARY)
+        self.bind('<Escape>', lambda e: self.destroy())
+
+        self._shown = None
+        self._build_ui()
+        self._refresh()
+
+    def _build_ui(self):
+        header = tk.Frame(self, bg=Theme.BG_DARK, height=70)
+        header.pack(fill="x")
+        header.pack_propagate(False)
+        tk.Label(header, text="PERFORMANCE MONITOR", font=(Theme.FONT_FAMILY, 20, "bold"),
+                 fg=Theme.TEXT_WHITE, bg=Theme.BG_DARK).pack(side="left", padx=20, pady=15)
+
+        toolbar = tk.Frame(self, bg=Theme.BG_PRIMARY)
+        toolbar.pack(fill="x", padx=20, pady=(15, 5))
+        self.record_btn = PremiumButton(toolbar, text="", command=self._toggle_recording,
+                                        bg_color=Theme.SUCCESS, hover_color=Theme.SUCCESS_LIGHT,
+                                        width=220, height=45, font_size=10)
+        self.record_btn.pack(side="left", padx=(0, 10))
+        PremiumButton(toolbar, text="🗑 Clear", command=self._clear, bg_color=Theme.BG_MEDIUM,
+                      hover_color=Theme.BG_DARK, width=140, height=45, font_size=10).pack(side="left", padx=10)
+        PremiumButton(toolbar, text="💾 Export JSON", command=self._export, bg_color=Theme.PRIMARY,
+                      hover_color=Theme.PRIMARY_HOVER, width=180, height=45, font_size=10).pack(side="left", padx=10)
+        self.status_lbl = tk.Label(toolbar, text="", font=(Theme.FONT_FAMILY, 10, "italic"),
+                                   fg=Theme.TEXT_SECONDARY, bg=Theme.BG_PRIMARY)
+        self.status_lbl.pack(side="right")
+        self._update_record_button()
+
+        body = tk.PanedWindow(self, orient="vertical", bg=Theme.BG_PRIMARY, sashwidth=6, bd=0)
+        body.pack(fill="both", expand=True, padx=20, pady=(5, 20))
+
+        self.summary_tree = self._make_tree(body, "By operation", [
+            ("name", "Operation", 260, "w"), ("count", "Calls", 70, "e"), ("total_ms", "Total (ms)", 110, "e"),
+            ("mean_ms", "Mean (ms)", 110, "e"), ("max_ms", "Max (ms)", 110, "e"),
+            ("rss_delta_mb", "Σ RSS Δ (MB)", 120, "e")])
+        self.recent_tree = self._make_tree(body, "Recent spans", [
+            ("time", "Time", 90, "w"), ("name", "Operation", 240, "w"), ("duration_ms", "Duration (ms)", 120, "e"),
+            ("rss_delta_mb", "RSS Δ (MB)", 100, "e"), ("parent", "Parent", 180, "w"),
+            ("thread", "Thread", 150, "w"), ("attrs", "Details", 300, "w")])
+
+    def _make_tree(self, paned: tk.PanedWindow, title: str, columns) -> ttk.Treeview:
+        frame = tk.Frame(paned, bg=Theme.BG_CARD, highlightthickness=1, highlightbackground=Theme.BORDER)
+        tk.Label(frame, text=title, font=(Theme.FONT_FAMILY, 12, "bold"), fg=Theme.TEXT_PRIMARY,
+                 bg=Theme.BG_CARD).pack(anchor="w", padx=12, pady=(10, 5))
+        tree = ttk.Treeview(frame, columns=[c[0] for c in columns], show="headings")
+        for key, label, width, anchor in columns:
+            tree.heading(key, text=label)
+            tree.column(key, width=width, anchor=anchor, stretch=key in ("name", "attrs"))
+        scroll = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scroll.set)
+        scroll.pack(side="right", fill="y")
+        tree.pack(fill="both", expand=True, padx=(12, 0), pady=(0, 12))
+        paned.add(frame, stretch="always")
+        return tree
+
+    def _refresh(self):
+        if not self.winfo_exists():
+            return
+        events = self.profiler.recent(RECENT_ROWS)
+        marker = (len(events), events[-1]["start"] if events else None)
+        # Only rebuild the tables when new spans arrived
+        if marker != self._shown:
+            self._shown = marker
+            self._fill_summary()
+            self._fill_recent(events)
+        self.after(REFRESH_MS, self._refresh)
+
+    def _fill_summary(self):
+        self.summary_tree.delete(*self.summary_tree.get_children())
+        for row in self.profiler.summary():
+            self.summary_tree.insert("", "end", values=(
+                row["name"], row["count"], f"{row['total_ms']:,.1f}", f"{row['mean_ms']:,.2f}",
+                f"{row['max_ms']:,.2f}", f"{row['rss_delta_mb']:+.1f}"))
+
+    def _fill_recent(self, events):
+        self.recent_tree.delete(*self.recent_tree.get_children())
+        for event in reversed(events):
+            rss = event.get("rss_delta_mb")
+            attrs = ", ".join(f"{k}={v}" for k, v in event.get("attrs", {}).items())
+            if event.get("error"):
+                attrs = f"⚠ {event['error']}  {attrs}".strip()
+            self.recent_tree.insert("", "end", values=(
+                time.strftime("%H:%M:%S", time.localtime(event["start"])), event["name"],
+                f"{event['duration_ms']:,.2f}", f"{rss:+.2f}" if rss is not None else "—",
+                event.get("parent") or "", event["thread"], attrs))
+        self.status_lbl.config(text=f"{len(events)} span(s) shown")
+
+    def _toggle_recording(self):
+        if self.profiler.enabled:
+            self.profiler.disable()
+        else:
+            self.profiler.enable()
+        self._update_record_button()
+
+    def _update_record_button(self):
+        if self.profiler.enabled:
+            self.record_btn.text = "⏸ Pause recording"
+            self.record_btn.enable(Theme.WARNING, Theme.WARNING_LIGHT)
+        else:
+            self.record_btn.text = "⏺ Start recording"
+            self.record_btn.enable(Theme.SUCCESS, Theme.SUCCESS_LIGHT)
+
+    def _clear(self):
+        self.profiler.clear()
+        self._shown = None
+
+    def _export(self):
+        path = filedialog.asksaveasfilename(parent=self, defaultextension=".jsonl",
+                                            filetypes=[("JSON lines", "*.jsonl"), ("All files", "*.*")])
+        if not path: return
+        try:
+            self.profiler.export(path)
+        except OSError as e:
+            messagebox.showerror("Export failed", str(e), parent=self)
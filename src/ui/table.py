@@ -0,0 +1,226 @@
+"""
+DataScope Virtual Table
+Canvas-drawn DataFrame grid that formats only the cells in view.
+"""
+
+import tkinter as tk
+import tkinter.font as tkfont
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Sequence
+
+import numpy as np
+
+from src.ui.theme import Theme
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Column widths are measured on at most TABLE_WIDTH_SAMPLE rows
+TABLE_WIDTH_SAMPLE = 200
+TABLE_CELL_PAD = 12
+TABLE_MAX_COL_PX = 320
+# Width assumed for columns not yet scrolled into view (and so not measured)
+TABLE_DEFAULT_COL_PX = 96
+
+def _column_formatter(values: np.ndarray, precision: Optional[int]) -> Callable[[object], str]:
+    """Cell formatter for one column, chosen once from its dtype."""
+    if values.dtype.kind == "f":
+        spec = f".{precision}f" if precision is not None else ".6g"
+        return lambda v: "NaN" if v != v else format(v, spec)
+    if values.dtype.kind in "iub":
+        return str
+    return lambda v: "" if v is None or (isinstance(v, float) and v != v) else str(v)
+
+class VirtualTable(tk.Frame):
+    """
+    Scrollable grid over a DataFrame that only formats the cells in view.
+
+    Columns are kept as the frame's own arrays; each scroll, resize or sort
+    redraws the visible rows x columns on a canvas, so opening a table costs
+    O(visible cells) whatever its length. Clicking a header sorts by that
+    column (again to reverse); sort orders are computed once per column and
+    cached. Columns start at TABLE_DEFAULT_COL_PX and are measured the first
+    time they scroll into view, so wide frames also open in O(visible cells).
+    """
+
+    def __init__(self, parent, frame: "pd.DataFrame", index: Optional[Sequence] = None,
+                 show_index: bool = True, precision: Optional[int] = None, font_size: int = 10,
+                 bg: str = "#f8fafc", stripe: str = "#f1f5f9", **kwargs):
+        super().__init__(parent, bg=bg, **kwargs)
+        self.bg = bg
+        self.stripe = stripe
+        self.font = tkfont.Font(family=Theme.FONT_MONO, size=font_size)
+        self.header_font = tkfont.Font(family=Theme.FONT_FAMILY, size=font_size, weight="bold")
+        self.row_height = self.font.metrics("linespace") + 6
+
+        self.headers = [str(c) for c in frame.columns]
+        self.columns = [frame.iloc[:, j].to_numpy() for j in range(frame.shape[1])]
+        if show_index:
+            labels = frame.index if index is None else index
+            self.headers.insert(0, str(frame.index.name or ""))
+            self.columns.insert(0, np.asarray(labels, dtype=object))
+        self.n_rows = len(frame)
+        self.formatters = [_column_formatter(col, precision) for col in self.columns]
+        self.numeric = [col.dtype.kind in "iufb" for col in self.columns]
+
+        # Caches: measured width per column, row order per (column, ascending)
+        self._widths: Dict[int, int] = {}
+        self._orders: Dict[tuple, np.ndarray] = {}
+        self.order: Optional[np.ndarray] = None
+        self.sort_key: Optional[tuple] = None
+        self._top = 0
+        self._left = 0
+        self._col_px = np.full(len(self.columns), TABLE_DEFAULT_COL_PX, dtype=np.int64)
+        self._offsets = np.concatenate([[0], np.cumsum(self._col_px)])
+
+        self.header = tk.Canvas(self, height=self.row_height + 4, bg=Theme.BG_LIGHT, highlightthickness=0)
+        self.body = tk.Canvas(self, bg=bg, highlightthickness=0)
+        self.ybar = tk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.xbar = tk.Scrollbar(self, orient="horizontal", command=self.xview)
+        self.ybar.pack(side="right", fill="y")
+        self.xbar.pack(side="bottom", fill="x")
+        self.header.pack(side="top", fill="x")
+        self.body.pack(side="left", fill="both", expand=True)
+
+        self.body.bind("<Configure>", lambda e: self.render())
+        self.header.bind("<Button-1>", self._on_header_click)
+        for widget in (self.body, self.header):
+            widget.bind("<MouseWheel>", self._on_wheel)
+            widget.bind("<Shift-MouseWheel>", lambda e: self._scroll_x(-1 if e.delta > 0 else 1, "units"))
+            widget.bind("<Button-4>", lambda e: self._scroll_y(-3))
+            widget.bind("<Button-5>", lambda e: self._scroll_y(3))
+
+    # --- Geometry ---
+
+    def column_width(self, j: int) -> int:
+        """Pixel width of column j, measured on the header and a spread sample of rows."""
+        width = self._widths.get(j)
+        if width is None:
+            sample = np.unique(np.linspace(0, self.n_rows - 1, min(self.n_rows, TABLE_WIDTH_SAMPLE)).astype(int)) \
+                if self.n_rows else []
+            fmt, col = self.formatters[j], self.columns[j]
+            longest = max((fmt(col[i]) for i in sample), key=len, default="")
+            width = max(self.header_font.measure(self.headers[j] + " ▲"), self.font.measure(longest)) + TABLE_CELL_PAD
+            width = self._widths[j] = min(width, TABLE_MAX_COL_PX)
+        return width
+
+    @property
+    def total_width(self) -> int:
+        return int(self._offsets[-1])
+
+    def visible_rows(self) -> int:
+        return max(1, self.body.winfo_height() // self.row_height)
+
+    def visible_range(self):
+        """(first row, last row + 1, first column, last column + 1) currently in view."""
+        top = self._top
+        bottom = min(self.n_rows, top + self.visible_rows() + 1)
+        left = max(0, int(np.searchsorted(self._offsets, self._left, side="right")) - 1)
+        right = int(np.searchsorted(self._offsets, self._left + self.body.winfo_width(), side="left"))
+        return top, bottom, left, min(len(self.columns), right)
+
+    def layout(self):
+        """Measures the columns in view that still have the default width, then returns `visible_range()`."""
+        while True:
+            top, bottom, left, right = self.visible_range()
+            pending = [j for j in range(left, right) if j not in self._widths]
+            if not pending:
+                return top, bottom, left, right
+            for j in pending:
+                self._col_px[j] = self.column_width(j)
+            self._offsets = np.concatenate([[0], np.cumsum(self._col_px)])
+
+    # --- Scrolling ---
+
+    def yview(self, *args):
+        if args[0] == "moveto":
+            self._set_top(round(float(args[1]) * self.n_rows))
+        elif args[0] == "scroll":
+            step = self.visible_rows() if args[2] == "pages" else 1
+            self._set_top(self._top + int(args[1]) * step)
+
+    def xview(self, *args):
+        if args[0] == "moveto":
+            self._set_left(round(float(args[1]) * self.total_width))
+        elif args[0] == "scroll":
+            self._scroll_x(int(args[1]), args[2])
+
+    def _scroll_x(self, n: int, what: str):
+        step = self.body.winfo_width() if what == "pages" else 40
+        self._set_left(self._left + n * step)
+
+    def _scroll_y(self, n: int):
+        self._set_top(self._top + n)
+
+    def _on_wheel(self, event):
+        self._scroll_y(-3 if event.delta > 0 else 3)
+
+    def _set_top(self, top: int):
+        top = max(0, min(top, self.n_rows - self.visible_rows()))
+        if top != self._top:
+            self._top = top
+            self.render()
+
+    def _set_left(self, left: int):
+        left = max(0, min(left, self.total_width - self.body.winfo_width()))
+        if left != self._left:
+            self._left = left
+            self.render()
+
+    # --- Sorting ---
+
+    def sort_by(self, j: int, ascending: bool = True):
+        """Orders rows by column j; orders are cached so toggling back is free."""
+        key = (j, ascending)
+        order = self._orders.get(key)
+        if order is None:
+            import pandas as pd
+            order = pd.Series(self.columns[j]).sort_values(
+                ascending=ascending, kind="stable", na_position="last").index.to_numpy()
+            self._orders[key] = order
+        self.order, self.sort_key = order, key
+        self._top = 0
+        self.render()
+
+    def _on_header_click(self, event):
+        j = int(np.searchsorted(self._offsets, event.x + self._left, side="right")) - 1
+        if not 0 <= j < len(self.columns):
+            return
+        ascending = not (self.sort_key == (j, True))
+        self.sort_by(j, ascending)
+
+    # --- Drawing ---
+
+    def render(self):
+        """Redraws the header and the cells in view."""
+        if not self.winfo_exists():
+            return
+        top, bottom, left, right = self.layout()
+        width = self.body.winfo_width()
+        self.header.delete("all")
+        self.body.delete("all")
+
+        rows = np.arange(top, bottom)
+        if self.order is not None:
+            rows = self.order[top:bottom]
+        for r in range(bottom - top):
+            if (top + r) % 2:
+                y = r * self.row_height
+                self.body.create_rectangle(0, y, width, y + self.row_height, fill=self.stripe, outline="")
+
+        for j in range(left, right):
+            x0 = int(self._offsets[j]) - self._left
+            x1 = int(self._offsets[j + 1]) - self._left
+            anchor, tx = ("e", x1 - TABLE_CELL_PAD // 2) if self.numeric[j] else ("w", x0 + TABLE_CELL_PAD // 2)
+            arrow = {(j, True): " ▲", (j, False): " ▼"}.get(self.sort_key, "")
+            self.header.create_text(tx, (self.row_height + 4) // 2, text=self.headers[j] + arrow, anchor=anchor,
+                                    font=self.header_font, fill=Theme.TEXT_PRIMARY)
+            self.header.create_line(x1, 0, x1, self.row_height + 4, fill=Theme.BORDER)
+            fmt, col = self.formatters[j], self.columns[j]
+            for r, i in enumerate(rows):
+                self.body.create_text(tx, r * self.row_height + self.row_height // 2, text=fmt(col[i]),
+                                      anchor=anchor, font=self.font, fill=Theme.TEXT_PRIMARY)
+
+        if self.n_rows:
+            self.ybar.set(top / self.n_rows, min(1.0, (top + self.visible_rows()) / self.n_rows))
+        total = max(self.total_width, 1)
+        self.xbar.set(self._left / total, min(1.0, (self._left + width) / total))
@@ -0,0 +1,77 @@
+"""
+DataScope View Cache
+Keeps rendered module pages alive and swaps them in and out with pack/forget.
+"""
+
+import tkinter as tk
+from typing import Any, Callable, Hashable, Optional
+
+from src.core.lru import LRUCache
+
+MAX_CACHED_VIEWS = 10
+
+class ViewCache:
+    """
+    Page frames of one content container, keyed by view id.
+
+    `show` packs the cached frame of a view or builds it once with
+    `build(frame)`; the page it replaces is only hidden, so returning to it
+    redraws nothing. A page is rebuilt when its `token` (e.g. the K it was
+    rendered for) changes or after `invalidate`. At most `max_views` hidden
+    pages are kept; the least recently shown ones are destroyed first.
+    """
+
+    def __init__(self, container: tk.Frame, max_views: int = MAX_CACHED_VIEWS) -> None:
+        self.container = container
+        self.current: Optional[Hashable] = None
+        self._current_frame: Optional[tk.Frame] = None
+        self._frames = LRUCache(max_items=max_views, on_evict=lambda key, entry: self._destroy(entry[1]))
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._frames
+
+    def show(self, key: Hashable, build: Callable[[tk.Frame], Any], token: Any = None,
+             keep: bool = True) -> tk.Frame:
+        """Shows the page `key`, building it if it is not cached for `token`.
+        Pages shown with `keep=False` are destroyed as soon as they are left."""
+        entry = self._frames.get(key)
+        if entry is not None and entry[0] != token:
+            self.invalidate(key)
+            entry = None
+        self._hide_current()
+
+        if entry is None:
+            frame = tk.Frame(self.container, bg=self.container["bg"])
+            frame.pack(fill="both", expand=True)
+            build(frame)
+            if keep:
+                self._frames.put(key, (token, frame))
+        else:
+            frame = entry[1]
+            frame.pack(fill="both", expand=True)
+        self.current, self._current_frame = key, frame
+        return frame
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Destroys the cached page `key`, or every page when `key` is None."""
+        keys = [key] if key is not None else self._frames.keys()
+        for k in keys:
+            entry = self._frames.pop(k)
+            if entry is not None:
+                self._destroy(entry[1])
+        if self._current_frame is not None and not self._current_frame.winfo_exists():
+            self.current, self._current_frame = None, None
+
+    def _hide_current(self) -> None:
+        frame = self._current_frame
+        if frame is None or not frame.winfo_exists():
+            return
+        if self.current in self._frames:
+            frame.pack_forget()
+        else:
+            frame.destroy()
+        self.current, self._current_frame = None, None
+
+    def _destroy(self, frame: tk.Frame) -> None:
+        if frame.winfo_exists():
+            frame.destroy()
@@ -0,0 +1,48 @@
+"""
+DataScope Tests - Ingestion Cache
+Regression tests for memory-mapped cache hits and the in-process frame bound.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.data.cache import IngestionCache
+
+def _write_csv(path, rows: int = 1000) -> pd.DataFrame:
+    frame = pd.DataFrame({"x": np.arange(rows, dtype=float), "y": np.ones(rows), "tag": ["a"] * rows})
+    frame.to_csv(path, index=False)
+    return frame
+
+def test_cache_hit_keeps_numeric_columns_memory_mapped(tmp_path):
+    path = tmp_path / "table.csv"
+    expected = _write_csv(path)
+    IngestionCache(str(tmp_path / "cache")).read(str(path), lambda: pd.read_csv(path))
+
+    frame = IngestionCache(str(tmp_path / "cache")).read(str(path), lambda: pd.read_csv(path))
+    pd.testing.assert_frame_equal(frame, expected, check_dtype=False)
+    values = frame["x"].to_numpy()
+    assert not values.flags.writeable
+    while values is not None and not isinstance(values, np.memmap):
+        values = getattr(values, "base", None)
+    assert values is not None
+
+def test_shared_frames_are_bounded(tmp_path):
+    cache = IngestionCache(str(tmp_path / "cache"), max_frames=2)
+    paths = []
+    for i in range(3):
+        paths.append(tmp_path / f"table_{i}.csv")
+        _write_csv(paths[-1], rows=10)
+        cache.read(str(paths[-1]), lambda p=paths[-1]: pd.read_csv(p))
+    assert len(cache._frames) == 2
+
+def test_disk_entries_are_pruned_to_budget(tmp_path):
+    root = tmp_path / "cache"
+    cache = IngestionCache(str(root), max_mb=0.1)
+    for i in range(4):
+        path = tmp_path / f"big_{i}.csv"
+        _write_csv(path, rows=4000)
+        cache.read(str(path), lambda p=path: pd.read_csv(p))
+
+    entries = [entry for entry in root.iterdir() if (entry / "manifest.json").is_file()]
+    assert len(entries) == 1
+    assert entries[0].name == cache.entry_key(str(tmp_path / "big_3.csv"), "")
@@ -0,0 +1,31 @@
+"""
+DataScope Tests - Chart Layers
+Regression tests for pooled point labels.
+"""
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+from src.ui.charts import LabelManager
+
+def test_pooled_labels_drop_highlight_style():
+    fig, ax = plt.subplots()
+    x = np.arange(20, dtype=float)
+    ax.set_xlim(-1, 20)
+    ax.set_ylim(-1, 1)
+    highlight = np.zeros(20, dtype=bool)
+    highlight[:10] = True
+    labels = LabelManager(ax, x, np.zeros(20), [str(i) for i in range(20)], highlight=highlight,
+                          budget=5, style={"fontsize": 7}, highlight_style={"fontweight": "bold", "color": "red"})
+    ax.set_xlim(-0.5, 4.5)
+    labels.refresh()
+    assert all(text.get_fontweight() == "bold" for text in labels.pool if text.get_visible())
+
+    ax.set_xlim(14.5, 19.5)
+    labels.refresh()
+    shown = [text for text in labels.pool if text.get_visible()]
+    assert shown
+    assert all(text.get_fontweight() == "normal" and text.get_color() != "red" for text in shown)
+    plt.close(fig)
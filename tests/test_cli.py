@@ -0,0 +1,26 @@
+"""
+DataScope Tests - Batch Runner
+A module that fails on valid input must not discard the other modules' report.
+"""
+
+import numpy as np
+import pandas as pd
+
+import src.cli as cli
+
+def test_module_error_still_writes_partial_report(tmp_path, monkeypatch):
+    path = tmp_path / "stations.csv"
+    pd.DataFrame(np.random.default_rng(0).normal(size=(60, 3)), columns=list("abc")).to_csv(path, index=False)
+
+    def fail(raw, options):
+        raise ValueError("n_samples=60 should be >= n_clusters=100.")
+
+    monkeypatch.setattr(cli, "_clustering_sheets", fail)
+    summary = cli.process_file(str(path), str(tmp_path), ["pca", "clustering"], {"k": 100, "contamination": 0.1})
+
+    assert summary["status"] == "partial"
+    assert summary["error"] == "clustering: ValueError: n_samples=60 should be >= n_clusters=100."
+    sheets = pd.read_excel(summary["report"], sheet_name=None, index_col=0)
+    assert "PCA Eigenvalues" in sheets
+    assert sheets["Summary"].loc["pca", "status"] == "ok"
+    assert sheets["Summary"].loc["clustering", "status"] == "error"
@@ -0,0 +1,28 @@
+"""
+DataScope Tests - Clustering Engine
+Construction must stay cheap: data and fingerprint are resolved by the first job.
+"""
+
+import pandas as pd
+from sklearn.datasets import make_blobs
+
+from src.modules.clustering.engine import ClusteringEngine
+
+def test_lazy_data_is_built_on_first_use():
+    X, _ = make_blobs(n_samples=500, centers=3, n_features=4, random_state=0)
+    data = pd.DataFrame(X, columns=[f"f{i}" for i in range(4)])
+    calls = []
+
+    def build():
+        calls.append(1)
+        return data
+
+    engine = ClusteringEngine(build)
+    assert not calls
+    assert not engine.has_clustering(3)
+
+    result = engine.run_clustering(3)
+    assert len(calls) == 1
+    assert engine.has_clustering(3)
+    assert result["labels"].equals(ClusteringEngine(data).run_clustering(3)["labels"])
+    assert len(calls) == 1
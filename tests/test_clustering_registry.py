@@ -0,0 +1,28 @@
+"""
+DataScope Tests - Clustering Registry
+Forests reloaded from the model registry must match the labels on display.
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.datasets import make_blobs
+
+from src.modules.clustering.engine import ClusteringEngine
+from src.services.registry import ModelRegistry
+
+def test_reloaded_forest_agrees_with_exact_labels(tmp_path):
+    X, _ = make_blobs(n_samples=2_000, centers=6, n_features=5, random_state=1)
+    data = pd.DataFrame(X, columns=[f"f{i}" for i in range(5)])
+    registry = ModelRegistry(str(tmp_path / "models"))
+
+    # Session A: the sweep's labels are the only ones cached when the forest trains
+    first = ClusteringEngine(data, registry=registry, n_estimators=20)
+    first.sweep(range(2, 11))
+    first.train_classifier(6)
+
+    # Session B: fresh cache, exact K-Means on display, forest from the registry
+    second = ClusteringEngine(data, registry=ModelRegistry(str(tmp_path / "models")), n_estimators=20)
+    labels = second.run_clustering(6)["labels"].to_numpy()
+    second.train_classifier(6)
+    agreement = (second.clf.predict(data) == labels).mean()
+    assert agreement > 0.95
@@ -0,0 +1,26 @@
+"""
+DataScope Tests - Lazy Loader
+A module requested while the warm-up is importing it must come back complete.
+"""
+
+import sys
+import threading
+import time
+
+from src.core.lazy import LazyLoader
+
+def test_resolve_waits_for_import_in_flight(tmp_path, monkeypatch):
+    (tmp_path / "slowmod.py").write_text("import time\ntime.sleep(0.5)\nclass Thing:\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "slowmod", raising=False)
+    loader = LazyLoader()
+
+    warm = threading.Thread(target=loader.warm, args=(["slowmod:Thing"],))
+    warm.start()
+    while "slowmod" not in sys.modules:
+        time.sleep(0.01)
+    assert not loader.is_loaded("slowmod:Thing")
+
+    assert loader.resolve("slowmod:Thing").__name__ == "Thing"
+    warm.join()
+    assert loader.is_loaded("slowmod:Thing")
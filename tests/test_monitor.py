@@ -0,0 +1,36 @@
+"""
+DataScope Tests - Live Monitor
+Regression tests for reference fits on incomplete windows and failed refreshes.
+"""
+
+from concurrent.futures import Future
+
+import numpy as np
+import pandas as pd
+
+from src.modules.cybersecurity.monitor import ReferenceModel, StreamMonitor
+
+def _window(rows: int = 200) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"bytes": rng.normal(size=rows), "latency": rng.normal(size=rows),
+                         "port": np.full(rows, np.nan)})
+
+def test_all_nan_column_is_filled_with_zero():
+    model = ReferenceModel.fit(_window())
+    assert model.fill[2] == 0.0
+
+    scores = model.score(_window(10))
+    assert not scores[["iso_score", "lof_score"]].isna().any().any()
+
+def test_failed_refresh_keeps_previous_model(tmp_path):
+    path = tmp_path / "traffic.csv"
+    _window().to_csv(path, index=False)
+    monitor = StreamMonitor(str(path))
+    model = monitor.start()
+
+    failed = Future()
+    failed.set_exception(ValueError("Input X contains NaN."))
+    monitor._pending = failed
+    monitor.poll()
+    assert monitor.model is model
+    assert not monitor.refreshing
@@ -0,0 +1,45 @@
+"""
+DataScope Tests - PCA View
+Opening the view must not build the scaled frame on the Tk thread.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("tkinter")
+
+from src.core.context import AppContext
+from src.modules.pca.view import PCAView
+
+class _CountingContext(AppContext):
+    scaled_reads = 0
+
+    @property
+    def scaled_data(self):
+        self.scaled_reads += 1
+        return super().scaled_data
+
+class _Scheduler:
+    def submit(self, fn, *args, on_success=None, **kwargs):
+        self.job = (fn, on_success)
+
+class _Label:
+    def config(self, **kwargs):
+        pass
+
+def test_scaled_frame_is_built_by_the_job():
+    context = _CountingContext()
+    context.set_data(pd.DataFrame(np.random.default_rng(0).normal(size=(200, 5)), columns=list("abcde")))
+    context.scheduler = _Scheduler()
+    view = object.__new__(PCAView)
+    view.context, view.engine, view.title_label = context, None, _Label()
+
+    view._run_analysis()
+    assert context.scaled_reads == 0
+
+    fn, on_success = context.scheduler.job
+    on_success(fn())
+    assert context.scaled_reads == 1
+    assert view.engine is not None
+    assert view.results is view.engine.results
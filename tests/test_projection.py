@@ -0,0 +1,35 @@
+"""
+DataScope Tests - Projection Service
+Concurrent requests for one projection share a single fit.
+"""
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.services.projection import ProjectionService
+
+def test_concurrent_callers_share_one_fit(monkeypatch):
+    service = ProjectionService()
+    data = pd.DataFrame(np.random.default_rng(0).normal(size=(300, 4)), columns=list("abcd"))
+    fit, calls = service._fit, []
+
+    def slow_fit(frame):
+        calls.append(1)
+        time.sleep(0.3)
+        return fit(frame)
+
+    monkeypatch.setattr(service, "_fit", slow_fit)
+    results = []
+    workers = [threading.Thread(target=lambda: results.append(service.project_2d(data, fingerprint="fp")))
+               for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert service.project_2d(data, fingerprint="fp") is results[0]
@@ -0,0 +1,28 @@
+"""
+DataScope Tests - Model Registry
+Saved models are pruned to the registry's disk budget, least recently used first.
+"""
+
+import os
+import time
+
+import numpy as np
+
+from src.services.registry import ModelRegistry
+
+def test_saved_versions_are_pruned_to_budget(tmp_path):
+    registry = ModelRegistry(str(tmp_path / "models"), max_mb=0.4)
+    payload = {"centroids": np.zeros((10_000, 2))}  # ~160 KB each
+    registry.save("kmeans", "fp-a", {"k": 2}, payload)
+    time.sleep(0.05)
+    registry.save("kmeans", "fp-b", {"k": 2}, payload)
+    time.sleep(0.05)
+    # Reading A again makes B the least recently used
+    registry.forget()
+    assert registry.load("kmeans", "fp-a", {"k": 2}) is not None
+    time.sleep(0.05)
+    registry.save("forest", "fp-c", {"k": 2}, payload)
+
+    assert registry.versions("kmeans", "fp-b", {"k": 2}) == []
+    assert registry.versions("forest", "fp-c", {"k": 2}) == [1]
+    assert not os.path.isdir(registry._entry_dir("kmeans", "fp-b", {"k": 2}))
@@ -0,0 +1,19 @@
+"""
+DataScope Tests - Scaled Views
+Regression tests for sharing scaled frames beyond the cache budget.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.core.context import AppContext
+
+def test_over_budget_scaled_frame_is_shared_while_held():
+    context = AppContext()
+    context.set_setting("scaled_cache_mb", 0)
+    frame = pd.DataFrame(np.random.default_rng(0).normal(size=(1000, 4)), columns=list("abcd"))
+    context.set_data(frame)
+
+    first = context.scaled_data
+    assert context.scaled_data is first
+    np.testing.assert_allclose(first.mean().to_numpy(), 0, atol=1e-12)
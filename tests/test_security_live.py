@@ -0,0 +1,57 @@
+"""
+DataScope Tests - Live Monitoring Page
+A reference fit finishing after the live page is gone must not touch it.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+from src.modules.cybersecurity.view import SecurityView
+
+class _Status:
+    def __init__(self, exists=True):
+        self.exists = exists
+        self.text = None
+
+    def winfo_exists(self):
+        return self.exists
+
+    def config(self, **kwargs):
+        self.text = kwargs.get("text")
+
+def _view():
+    view = object.__new__(SecurityView)
+    view.monitor = None
+    view._live_after = None
+    view._live_busy = False
+    view._live_session = 0
+    view.live_status = _Status()
+    view.after_cancel = lambda _id: None
+    view.after = lambda ms, fn: "tick"
+    view._log_live = lambda text: None
+    return view
+
+def _monitor():
+    model = SimpleNamespace(n_reference=10, fit_seconds=0.1)
+    return SimpleNamespace(model=model, tailer=SimpleNamespace(path="traffic.csv"))
+
+def test_fit_finishing_after_leaving_the_page_is_dropped():
+    view = _view()
+    session = view._live_session
+    view._stop_live()
+    view.live_status.exists = False
+
+    view._on_live_started(_monitor(), session)
+    assert view.monitor is None
+    assert view._live_after is None
+    assert view.live_status.text is None
+
+def test_fit_for_the_current_page_starts_polling():
+    view = _view()
+    monitor = _monitor()
+    view._on_live_started(monitor, view._live_session)
+    assert view.monitor is monitor
+    assert view._live_after == "tick"
@@ -0,0 +1,19 @@
+"""
+DataScope Tests - Startup
+The launcher must paint before numpy, pandas or sklearn are imported.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_main_import_skips_analysis_stack():
+    script = "import sys, main; print(sorted(m for m in ('numpy', 'pandas', 'sklearn') if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
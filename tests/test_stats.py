@@ -0,0 +1,30 @@
+"""
+DataScope Tests - Statistics Kernel
+Memory-mapped frames are streamed in row blocks rather than copied whole.
+"""
+
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from src.data.cache import IngestionCache
+from src.data.stats import compute_stats
+
+def test_memory_mapped_frame_is_not_materialized(tmp_path):
+    rng = np.random.default_rng(0)
+    source = pd.DataFrame(rng.normal(size=(100_000, 10)), columns=[f"c{j}" for j in range(10)])
+    source.iloc[::9, 3] = np.nan
+    path = tmp_path / "wide.csv"
+    source.to_csv(path, index=False)
+    IngestionCache(str(tmp_path / "cache")).read(str(path), lambda: pd.read_csv(path))
+    mapped = IngestionCache(str(tmp_path / "cache")).read(str(path), lambda: pd.read_csv(path))
+
+    tracemalloc.start()
+    stats = compute_stats(mapped, block_rows=4096)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak < source.memory_usage(index=False).sum() / 4
+    np.testing.assert_allclose(stats.mean, source.mean().to_numpy(), rtol=1e-10)
+    np.testing.assert_allclose(stats.corr(), source.fillna(source.mean()).corr().to_numpy(), atol=1e-10)
@@ -0,0 +1,26 @@
+"""
+DataScope Tests - Chunked Loader
+Regression tests for streaming CSV files into memory-mapped stores.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.data.cache import IngestionCache
+from src.data.streaming import load_chunked_dataset
+
+def test_csv_with_missing_values_is_mean_imputed(tmp_path):
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(rng.normal(size=(20_000, 3)), columns=["a", "b", "c"])
+    frame.loc[::7, "b"] = np.nan
+    path = tmp_path / "stations.csv"
+    frame.to_csv(path, index=False)
+
+    mapped = load_chunked_dataset(str(path), chunksize=4096, cache=IngestionCache(str(tmp_path / "cache")))
+    raw = mapped.raw_frame()
+
+    assert raw.shape == frame.shape
+    assert not raw.isna().any().any()
+    missing = frame["b"].isna().to_numpy()
+    np.testing.assert_allclose(raw["b"].to_numpy()[missing], frame["b"].mean(), rtol=1e-5)
+    np.testing.assert_allclose(raw["a"].to_numpy(), frame["a"].to_numpy(), rtol=1e-5)
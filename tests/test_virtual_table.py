@@ -0,0 +1,53 @@
+"""
+DataScope Tests - Virtual Table
+Only the columns scrolled into view are measured.
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("tkinter")
+
+from src.ui.table import TABLE_DEFAULT_COL_PX, VirtualTable
+
+class _Font:
+    def __init__(self):
+        self.calls = 0
+
+    def measure(self, text):
+        self.calls += 1
+        return 7 * len(text)
+
+class _Canvas:
+    def winfo_width(self):
+        return 400
+
+    def winfo_height(self):
+        return 200
+
+def _table(n_cols: int = 500, n_rows: int = 1000) -> VirtualTable:
+    table = object.__new__(VirtualTable)
+    table.headers = [f"feature_{j}" for j in range(n_cols)]
+    table.columns = [np.arange(n_rows, dtype=float) * j for j in range(n_cols)]
+    table.formatters = [lambda v: f"{v:.2f}"] * n_cols
+    table.n_rows = n_rows
+    table.font, table.header_font = _Font(), _Font()
+    table.row_height = 20
+    table.body = _Canvas()
+    table._widths = {}
+    table._top = table._left = 0
+    table._col_px = np.full(n_cols, TABLE_DEFAULT_COL_PX, dtype=np.int64)
+    table._offsets = np.concatenate([[0], np.cumsum(table._col_px)])
+    return table
+
+def test_only_visible_columns_are_measured():
+    table = _table()
+    _, _, left, right = table.layout()
+    assert left == 0 and 0 < right < 20
+    assert set(table._widths) == set(range(left, right))
+    assert table._offsets[right] == sum(table._widths.values())
+
+    table._left = int(table._offsets[-1]) // 2
+    _, _, left, right = table.layout()
+    assert set(range(left, right)) <= set(table._widths)
+    assert len(table._widths) < 40